@@ -0,0 +1,131 @@
+# Buckets/api/client.py
+"""Small synchronous client for the local API (stdlib only).
+
+    python -m Buckets.api.client accounts.list
+    python -m Buckets.api.client records.create label=Coffee amount=3.5 account=Cash
+    python -m Buckets.api.client --batch ops.json
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import socket
+import sys
+from typing import Any
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float = 10) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ApiClientError(RuntimeError):
+    """The server answered with an error."""
+
+
+class ApiClient:
+    def __init__(
+        self,
+        socket_path: str = "",
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        token: str = "",
+        timeout: float = 10,
+    ) -> None:
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.token = token
+        self.timeout = timeout
+
+    @classmethod
+    def from_config(cls) -> "ApiClient":
+        from Buckets import config
+
+        if config.CONFIG is None:
+            config.load_config()
+        api = config.CONFIG.api
+        return cls(api.socket, api.host, api.port, api.token)
+
+    def _request(self, method: str, body: Any = None) -> dict:
+        if self.socket_path:
+            connection = _UnixHTTPConnection(self.socket_path, self.timeout)
+        else:
+            connection = http.client.HTTPConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        try:
+            payload = None if body is None else json.dumps(body).encode()
+            connection.request(method, "/", body=payload, headers=headers)
+            response = json.loads(connection.getresponse().read() or b"{}")
+        finally:
+            connection.close()
+        if not response.get("ok"):
+            raise ApiClientError(response.get("error", "Unknown error"))
+        return response
+
+    def operations(self) -> list[str]:
+        return self._request("GET")["operations"]
+
+    def call(self, op: str, **args: Any) -> Any:
+        return self._request("POST", {"op": op, "args": args})["result"]
+
+    def batch(self, ops: list[dict]) -> list[Any]:
+        """Run several operations in one transaction."""
+        return self._request("POST", {"ops": ops})["results"]
+
+
+def _value(text: str) -> Any:
+    """Parse `key=value` values as JSON where possible (numbers, booleans)."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="buckets-api")
+    parser.add_argument("--socket", help="Unix socket path (default: from config)")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--batch", help="JSON file with a list of operations")
+    parser.add_argument("op", nargs="?", help="Operation; omit to list them")
+    parser.add_argument("args", nargs="*", help="key=value arguments")
+    args = parser.parse_args(argv)
+
+    client = ApiClient.from_config()
+    if args.socket is not None:
+        client.socket_path = args.socket
+    if args.port is not None:
+        client.socket_path, client.port = "", args.port
+
+    try:
+        if args.batch:
+            with open(args.batch, encoding="utf-8") as f:
+                result = client.batch(json.load(f))
+        elif args.op:
+            kwargs = {}
+            for pair in args.args:
+                key, _, value = pair.partition("=")
+                kwargs[key] = _value(value)
+            result = client.call(args.op, **kwargs)
+        else:
+            result = client.operations()
+    except (ApiClientError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,264 @@
+# Buckets/api/operations.py
+"""Operations exposed by the local API, mapped onto the managers.
+
+A request is a list of operations. Writes share one session and are
+committed together, so a batch either applies completely or not at all.
+Reads use their own sessions and see the state before the batch.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Callable
+
+from sqlalchemy.orm import sessionmaker
+
+from Buckets.managers import versions
+from Buckets.managers.accounts import get_all_accounts, get_all_accounts_with_balance
+from Buckets.managers.categories import get_all_categories_by_freq
+from Buckets.managers.filters import FilterError
+from Buckets.managers.record_templates import get_all_templates
+from Buckets.managers.records import (
+    create_record,
+    delete_record,
+    get_record_by_id,
+    get_records,
+    update_record,
+)
+from Buckets.managers.utils import get_period_figures
+from Buckets.models.database.app import write_engine
+
+# For the writes of a batch; reads open their own sessions
+Session = sessionmaker(bind=write_engine)
+
+
+class ApiError(ValueError):
+    """Raised for requests that cannot be served; reported to the client."""
+
+
+# ------------------------ Helpers ------------------------- #
+
+
+def to_json(obj, *extra: str) -> dict[str, Any]:
+    """Column values of a model instance (plus `extra` attributes) as JSON."""
+    data = {
+        column.name: getattr(obj, column.name) for column in obj.__table__.columns
+    }
+    for name in extra:
+        data[name] = getattr(obj, name, None)
+    return {
+        key: value.isoformat() if isinstance(value, (datetime, date)) else value
+        for key, value in data.items()
+    }
+
+
+def _find_account_id(value) -> int:
+    for account in get_all_accounts(get_hidden=True):
+        if account.id == value or account.name.casefold() == str(value).casefold():
+            return account.id
+    raise ApiError(f"No account matching {value!r}")
+
+
+def _find_category_id(value) -> int:
+    for category, _ in get_all_categories_by_freq():
+        if category.id == value or category.name.casefold() == str(value).casefold():
+            return category.id
+    raise ApiError(f"No category matching {value!r}")
+
+
+_RECORD_FIELDS = {
+    "label",
+    "amount",
+    "date",
+    "accountId",
+    "categoryId",
+    "isIncome",
+    "isTransfer",
+    "transferToAccountId",
+    "isInProgress",
+}
+
+
+def _positive_amount(value) -> float:
+    try:
+        amount = float(value)
+    except (TypeError, ValueError):
+        raise ApiError(f"Invalid amount {value!r}")
+    if not amount > 0:
+        raise ApiError(
+            f"Amount must be positive, got {value!r}; set isIncome for income"
+        )
+    return amount
+
+
+def _check_writes(ops: list) -> None:
+    """Reject bad record amounts before anything is written, so the client
+    gets a clear error instead of a database constraint failure."""
+    for op in ops:
+        if not isinstance(op, dict):
+            raise ApiError("Each operation must be an object")
+        args = op.get("args") or {}
+        if op.get("op") not in ("records.create", "records.update"):
+            continue
+        if not isinstance(args, dict):
+            raise ApiError("Operation arguments must be an object")
+        if "amount" in args:
+            args["amount"] = _positive_amount(args["amount"])
+        elif op["op"] == "records.create":
+            raise ApiError("Missing amount")
+
+
+def _record_data(args: dict) -> dict:
+    """Record fields from request arguments; names are accepted in place of
+    ids ("account", "category", "transferTo") and dates as ISO strings."""
+    data = {key: value for key, value in args.items() if key in _RECORD_FIELDS}
+    if "account" in args:
+        data["accountId"] = _find_account_id(args["account"])
+    if "category" in args:
+        data["categoryId"] = _find_category_id(args["category"])
+    if "transferTo" in args:
+        data["transferToAccountId"] = _find_account_id(args["transferTo"])
+        data["isTransfer"] = True
+    if isinstance(data.get("date"), str):
+        try:
+            data["date"] = datetime.fromisoformat(data["date"])
+        except ValueError:
+            raise ApiError(f"Invalid date {data['date']!r}")
+    return data
+
+
+# ------------------------- Reads -------------------------- #
+
+
+def _accounts(args: dict) -> list[dict]:
+    accounts = get_all_accounts_with_balance(get_hidden=bool(args.get("hidden")))
+    return [to_json(a, "balance") for a in accounts]
+
+
+def _categories(args: dict) -> list[dict]:
+    return [to_json(c) for c, _ in get_all_categories_by_freq()]
+
+
+def _records(args: dict) -> list[dict]:
+    records = get_records(
+        offset=int(args.get("offset", 0)),
+        offset_type=args.get("offset_type", "month"),
+        record_filter=args.get("filter"),
+    )
+    return [to_json(r) for r in records]
+
+
+def _record(args: dict) -> dict | None:
+    record = get_record_by_id(int(args["id"]))
+    return to_json(record) if record else None
+
+
+def _templates(args: dict) -> list[dict]:
+    return [to_json(t) for t in get_all_templates()]
+
+
+def _report(args: dict) -> dict:
+    figures = {
+        "offset": int(args.get("offset", 0)),
+        "offset_type": args.get("offset_type", "month"),
+        "accountId": args.get("accountId"),
+        "record_filter": args.get("filter"),
+    }
+    return {
+        "income": get_period_figures(isIncome=True, **figures),
+        "expense": get_period_figures(isIncome=False, **figures),
+    }
+
+
+READS: dict[str, Callable[[dict], Any]] = {
+    "accounts.list": _accounts,
+    "categories.list": _categories,
+    "records.list": _records,
+    "records.get": _record,
+    "templates.list": _templates,
+    "report": _report,
+}
+
+
+# ------------------------- Writes ------------------------- #
+
+
+def _create_record(session, args: dict) -> dict:
+    data = _record_data(args)
+    data.setdefault("date", datetime.now())
+    return to_json(create_record(data, session=session))
+
+
+def _update_record(session, args: dict) -> dict | None:
+    record = update_record(int(args["id"]), _record_data(args), session=session)
+    return to_json(record) if record else None
+
+
+def _delete_record(session, args: dict) -> bool:
+    return delete_record(int(args["id"]), session=session) is not None
+
+
+def _run_template(session, args: dict) -> dict:
+    """Create a record from template slot `slot` (1-based, as the hotkeys)."""
+    templates = get_all_templates()
+    slot = int(args["slot"])
+    if not 1 <= slot <= len(templates):
+        raise ApiError(f"Template slot {slot} is empty")
+    data = templates[slot - 1].to_dict()
+    data["date"] = _record_data(args).get("date") or datetime.now()
+    return to_json(create_record(data, session=session))
+
+
+# op -> (handler, data versions it touches)
+WRITES: dict[str, tuple[Callable[[Any, dict], Any], tuple[str, ...]]] = {
+    "records.create": (_create_record, ("records", "balances")),
+    "records.update": (_update_record, ("records", "balances")),
+    "records.delete": (_delete_record, ("records", "balances")),
+    "templates.run": (_run_template, ("records", "balances")),
+}
+
+
+def operation_names() -> list[str]:
+    return sorted([*READS, *WRITES])
+
+
+# ------------------------ Execute ------------------------- #
+
+
+def execute(ops: list[dict]) -> tuple[list[Any], set[str]]:
+    """Run `ops` in order and return their results and the data versions
+    bumped. Any failure rolls back every write of the batch."""
+    _check_writes(ops)
+    touched: set[str] = set()
+    results: list[Any] = []
+    session = Session()
+    try:
+        for op in ops:
+            if not isinstance(op, dict):
+                raise ApiError("Each operation must be an object")
+            name = op.get("op")
+            args = op.get("args") or {}
+            if name in WRITES:
+                handler, tables = WRITES[name]
+                results.append(handler(session, args))
+                touched.update(tables)
+            elif name in READS:
+                results.append(READS[name](args))
+            else:
+                raise ApiError(f"Unknown operation {name!r}")
+        if touched:
+            session.commit()
+    except FilterError as e:
+        session.rollback()
+        raise ApiError(f"Invalid filter: {e}") from e
+    except (KeyError, TypeError, ValueError) as e:
+        session.rollback()
+        raise ApiError(f"Invalid arguments: {e}") from e
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+    if touched:
+        versions.bump(*touched)
+    return results, touched
@@ -0,0 +1,212 @@
+# Buckets/api/server.py
+"""Minimal HTTP/1.1 JSON server on a Unix socket or a localhost port.
+
+    GET  /        -> {"ok": true, "operations": [...]}
+    POST /        body {"op": ..., "args": {...}}
+                  or   {"ops": [{"op": ..., "args": {...}}, ...]}
+                  -> {"ok": true, "result": ...} / {"ok": true, "results": [...]}
+
+Requests are served one at a time, in a worker thread so the event loop (the
+TUI's, when embedded) stays responsive. Each request is one transaction.
+
+Browsers can't be allowed to reach the port: requests carrying an `Origin`
+header are refused, and POST bodies must be sent as `application/json`,
+which a page can't do cross-origin without a preflight this server never
+answers.
+"""
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import os
+from typing import Any, Callable
+
+from Buckets.api.operations import ApiError, execute, operation_names
+
+# Called on the event loop with the data versions a request bumped
+ChangeCallback = Callable[[set[str]], None]
+
+MAX_BODY = 1 << 20
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    415: "Unsupported Media Type",
+    500: "Internal Server Error",
+}
+
+
+class ApiServer:
+    def __init__(
+        self,
+        socket_path: str = "",
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        token: str = "",
+        on_change: ChangeCallback | None = None,
+    ) -> None:
+        self.socket_path = socket_path
+        self.host = host
+        self.port = port
+        self.token = token
+        self.on_change = on_change
+        self._lock = asyncio.Lock()
+        self._server: asyncio.AbstractServer | None = None
+
+    @classmethod
+    def from_config(cls, on_change: ChangeCallback | None = None) -> "ApiServer":
+        from Buckets.config import CONFIG
+
+        api = CONFIG.api
+        return cls(api.socket, api.host, api.port, api.token, on_change)
+
+    @property
+    def address(self) -> str:
+        return self.socket_path or f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            self._server = await asyncio.start_unix_server(
+                self._handle, path=self.socket_path
+            )
+            os.chmod(self.socket_path, 0o600)
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, host=self.host, port=self.port
+            )
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+
+    # ----------------------- Protocol ----------------------- #
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> tuple[str, str, dict[str, str], bytes]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        method, path, _version = request_line.split(" ", 2)
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        length = int(headers.get("content-length") or 0)
+        if length > MAX_BODY:
+            raise OverflowError
+        body = await reader.readexactly(length) if length else b""
+        return method, path, headers, body
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            try:
+                request = await self._read_request(reader)
+            except OverflowError:
+                status, payload = 413, {"ok": False, "error": "Body too large"}
+            except (ValueError, asyncio.IncompleteReadError):
+                status, payload = 400, {"ok": False, "error": "Malformed request"}
+            else:
+                status, payload = await self._respond(*request)
+            self._write(writer, status, payload)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _write(self, writer: asyncio.StreamWriter, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        head = (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+
+    def _authorized(self, headers: dict[str, str]) -> bool:
+        if not self.token:
+            return True
+        return hmac.compare_digest(
+            headers.get("authorization", ""), f"Bearer {self.token}"
+        )
+
+    async def _respond(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, Any]:
+        if path.split("?", 1)[0] != "/":
+            return 404, {"ok": False, "error": f"Unknown path {path}"}
+        if "origin" in headers:
+            return 403, {"ok": False, "error": "Browser requests are not accepted"}
+        if not self._authorized(headers):
+            return 401, {"ok": False, "error": "Invalid token"}
+        if method == "GET":
+            return 200, {"ok": True, "operations": operation_names()}
+        if method != "POST":
+            return 405, {"ok": False, "error": f"Unsupported method {method}"}
+        content_type = headers.get("content-type", "").split(";", 1)[0].strip()
+        if content_type.lower() != "application/json":
+            return 415, {"ok": False, "error": "Content-Type must be application/json"}
+
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {"ok": False, "error": "Body is not JSON"}
+        single = isinstance(request, dict) and "ops" not in request
+        if single:
+            ops = [request]
+        else:
+            ops = request.get("ops") if isinstance(request, dict) else None
+        if not isinstance(ops, list):
+            return 400, {"ok": False, "error": "Expected 'op' or a list of 'ops'"}
+
+        async with self._lock:
+            try:
+                results, changed = await asyncio.to_thread(execute, ops)
+            except ApiError as e:
+                return 400, {"ok": False, "error": str(e)}
+            except Exception as e:
+                return 500, {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+        if changed and self.on_change is not None:
+            self.on_change(changed)
+        if single:
+            return 200, {"ok": True, "result": results[0]}
+        return 200, {"ok": True, "results": results}
+
+
+def run(server: ApiServer | None = None) -> None:
+    """Serve until interrupted (standalone mode)."""
+    server = server or ApiServer.from_config()
+
+    async def main() -> None:
+        await server.start()
+        print(f"Serving Buckets API on {server.address}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
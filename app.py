@@ -1,25 +1,34 @@
-from importlib.metadata import metadata, PackageNotFoundError
+from functools import cached_property
+from importlib import import_module
+from typing import Any
 
 from textual import events, log, on
 from textual.app import App as TextualApp, ComposeResult
+from textual.binding import Binding
 from textual.containers import Container
 from textual.css.query import NoMatches
+from textual.dom import DOMNode
 from textual.geometry import Size
 from textual.reactive import reactive
 from textual.widget import Widget
 from textual.widgets import Footer, Label, Tab, Tabs
 
-from Buckets.components.jump_overlay import JumpOverlay
 from Buckets.components.jumper import Jumper
 from Buckets.config import CONFIG
-from Buckets.home import Home
-from Buckets.buckets_page import BucketsPage
+from Buckets.managers import versions
+from Buckets.utils import instrumentation, profiling
 
+# Pages are imported when their tab is first shown, keeping the modules and
+# forms of hidden pages out of startup.
 PAGES = [
-    {"name": "Home", "class": Home},
-    {"name": "Buckets", "class": BucketsPage},
+    {"name": "Home", "module": "Buckets.home", "class": "Home"},
+    {"name": "Buckets", "module": "Buckets.buckets_page", "class": "BucketsPage"},
 ]
 
+
+def page_class(page: dict) -> type[Widget]:
+    return getattr(import_module(page["module"]), page["class"])
+
 class App(TextualApp):
     CSS_PATH = [
         "styles/index.tcss",
@@ -32,24 +41,55 @@ class App(TextualApp):
     BINDINGS = [
         (CONFIG.hotkeys.toggle_jump_mode, "toggle_jump_mode", "Jump Mode"),
         (CONFIG.hotkeys.home.cycle_tabs, "cycle_tabs", "Cycle tabs"),
+        Binding(
+            CONFIG.hotkeys.toggle_instrumentation,
+            "toggle_instrumentation",
+            "Instrumentation",
+            show=False,
+        ),
+        Binding(
+            CONFIG.hotkeys.toggle_profiling,
+            "toggle_profiling",
+            "Profiling",
+            show=False,
+        ),
         ("ctrl+q", "quit", "Quit"),
     ]
 
     layout: reactive[str] = reactive("h")
     _jumping: reactive[bool] = reactive(False, init=False, bindings=True)
     current_tab = 0
+    _active_page: str | None = None
 
     def __init__(self, is_testing: bool = False) -> None:
         self.is_testing = is_testing
         super().__init__()
 
+        self._pages: dict[str, Widget] = {}
+        self._page_versions: dict[str, dict[str, int]] = {}
+        self._page_focus: dict[str, Widget | None] = {}
+
+    @cached_property
+    def project_info(self) -> dict[str, str]:
+        from importlib.metadata import PackageNotFoundError, metadata
+
         try:
             meta = metadata("Buckets")
-            name = meta.get("Name", "Buckets")
-            version = meta.get("Version", "dev")
+            return {
+                "name": meta.get("Name", "Buckets"),
+                "version": meta.get("Version", "dev"),
+            }
         except PackageNotFoundError:
-            name, version = "Buckets", "dev"
-        self.project_info = {"name": name, "version": version}
+            return {"name": "Buckets", "version": "dev"}
+
+    def _show_project_info(self) -> None:
+        """Fill the header after the first frame; the metadata lookup is slow."""
+        self.query_one(".header .title", Label).update(
+            f"↪ {self.project_info['name']}"
+        )
+        self.query_one(".header .version", Label).update(
+            self.project_info["version"]
+        )
 
     def on_mount(self) -> None:
         # Keyboard "jumper" overlay mapping — jump directly to focusable widgets
@@ -65,6 +105,102 @@ class App(TextualApp):
             },
             screen=self.screen,
         )
+        if not self.is_testing:
+            self.call_after_refresh(self._show_project_info)
+        # Build the entry modals while idle so the first "new record" is instant
+        self.call_after_refresh(self._prewarm_modals)
+        if CONFIG.api.enabled and not self.is_testing:
+            self.run_worker(self._serve_api(), name="api-server", group="api")
+        if CONFIG.database.writer:
+            from Buckets.managers import writer
+
+            writer.add_listener(self._on_writer_commit)
+        if CONFIG.database.watch_interval and not self.is_testing:
+            from Buckets.managers.watcher import ChangeWatcher
+
+            self._watcher = ChangeWatcher()
+            self.set_interval(CONFIG.database.watch_interval, self._poll_changes)
+
+    def _poll_changes(self) -> None:
+        """Refresh what another process changed in the database."""
+        changed = self._watcher.poll()
+        if changed:
+            self._on_data_change(changed)
+
+    def _on_writer_commit(self, changed: set[str]) -> None:
+        """Writer thread: refresh on the app's loop once a batch is committed."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._on_data_change, changed)
+
+    async def _serve_api(self) -> None:
+        from Buckets.api.server import ApiServer
+
+        server = ApiServer.from_config(on_change=self._on_data_change)
+        try:
+            await server.serve_forever()
+        except OSError as e:
+            self.notify(
+                title="API server not started",
+                message=f"{e}",
+                severity="error",
+                timeout=10,
+            )
+
+    def _on_data_change(self, changed: set[str]) -> None:
+        """Refresh the visible page after an API or queued write; hidden pages
+        catch up from their version snapshot when shown again."""
+        page = self._current_page()
+        if page is not None:
+            page.invalidate(changed)
+
+    def _prewarm_modals(self) -> None:
+        from Buckets.forms import options_cache
+        from Buckets.modals.record import RecordModal
+        from Buckets.modals.transfer import TransferModal
+
+        RecordModal.reusable(self)
+        if len(options_cache.transfer_accounts()) >= 2:
+            TransferModal.reusable(self)
+
+    # ----- Instrumentation -----
+    async def _dispatch_action(
+        self, namespace: DOMNode, action_name: str, params: Any
+    ) -> bool:
+        if not (instrumentation.ENABLED or profiling.ACTIVE):
+            return await super()._dispatch_action(namespace, action_name, params)
+        name = f"{type(namespace).__name__}.{action_name}"
+        with instrumentation.action(name):
+            if action_name == "toggle_profiling":
+                return await super()._dispatch_action(namespace, action_name, params)
+            with profiling.profile(name):
+                return await super()._dispatch_action(namespace, action_name, params)
+
+    def action_toggle_instrumentation(self) -> None:
+        from Buckets.modals.instrumentation import InstrumentationModal
+
+        if isinstance(self.screen, InstrumentationModal):
+            self.pop_screen()
+        elif not instrumentation.ENABLED:
+            self.notify(
+                "Set instrumentation.enabled in the config and restart",
+                title="Instrumentation is off",
+                severity="warning",
+            )
+        else:
+            self.push_screen(InstrumentationModal())
+
+    def action_toggle_profiling(self) -> None:
+        from Buckets.modals.profiling import ProfilingModal
+
+        if isinstance(self.screen, ProfilingModal):
+            self.pop_screen()
+        elif profiling.toggle():
+            self.notify(
+                f"Saving a profile per action to {profiling.directory.resolve()}",
+                title="Profiling on",
+            )
+        else:
+            self.push_screen(ProfilingModal())
 
     # ----- Jump overlay -----
     def action_toggle_jump_mode(self) -> None:
@@ -97,8 +233,10 @@ class App(TextualApp):
 
         def handle_jump_target(target: str | Widget | None) -> None:
             if isinstance(target, str):
+                # Hidden pages keep their widgets mounted, so look in the visible one
+                scope = self._current_page() or self.screen
                 try:
-                    target_widget = self.screen.query_one(f"#{target}")
+                    target_widget = scope.query_one(f"#{target}")
                 except NoMatches:
                     log.warning(f"Jump target #{target} not found on {self.screen!r}")
                     return
@@ -117,33 +255,63 @@ class App(TextualApp):
                 if focused_before is not None:
                     self.set_focus(focused_before, scroll_visible=False)
 
+        from Buckets.components.jump_overlay import JumpOverlay
+
         self.clear_notifications()
         self.push_screen(JumpOverlay(self.jumper), callback=handle_jump_target)
 
     # ----- Tabs / layout -----
+    def _current_page(self) -> Widget | None:
+        page = self._pages.get(self._active_page)
+        return page if page is not None and page.is_attached else None
+
     async def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
-        if event.tab.id.startswith("tab-"):
-            try:
-                current = self.query_one(".content")
-                current.remove()
-            except NoMatches:
-                pass
-            page_class = next(
-                page["class"]
-                for page in PAGES
-                if page["name"].lower() == event.tab.id.replace("tab-", "")
+        if not event.tab.id.startswith("tab-"):
+            return
+        name = event.tab.id.replace("tab-", "")
+
+        # Pages are mounted once and then only hidden/shown; remember what the
+        # outgoing page last saw so it can catch up when it comes back.
+        current = self._current_page()
+        if current is not None and name != self._active_page:
+            focused = self.focused
+            self._page_focus[self._active_page] = (
+                focused
+                if focused is not None and current in focused.ancestors
+                else None
             )
-            await self.mount(page_class(classes="content"))
-            self.query_one(".content").set_classes(f"content {self.layout}")
+            self._page_versions[self._active_page] = versions.snapshot()
+            current.display = False
+            if focused is not None and current in focused.ancestors:
+                self.set_focus(None, scroll_visible=False)
+        self._active_page = name
+
+        page = self._pages.get(name)
+        if page is None or not page.is_attached:
+            page_cls = page_class(
+                next(page for page in PAGES if page["name"].lower() == name)
+            )
+            page = page_cls(classes=f"content {self.layout}")
+            self._pages[name] = page
+            self._page_versions.pop(name, None)
+            await self.mount(page)
+            return
+
+        page.set_classes(f"content {self.layout}")
+        page.display = True
+        changed = versions.changed_since(self._page_versions.pop(name, {}))
+        if changed:
+            page.invalidate(changed)
+        focused = self._page_focus.pop(name, None)
+        if focused is not None and focused.is_attached:
+            self.call_after_refresh(self.set_focus, focused)
 
     def on_resize(self, event: events.Resize) -> None:
         console_size: Size = event.size
         aspect_ratio = (console_size.width / 2) / console_size.height
         self.layout = "v" if aspect_ratio < 1 else "h"
-        try:
-            self.query_one(".content").set_classes(f"content {self.layout}")
-        except Exception:
-            pass
+        for page in self.query(".content"):
+            page.set_classes(f"content {self.layout}")
 
     # ----- Actions -----
     def action_goToTab(self, tab_number: int) -> None:
@@ -160,10 +328,9 @@ class App(TextualApp):
 
     # ----- View -----
     def compose(self) -> ComposeResult:
-        version = self.project_info["version"] if not self.is_testing else "vt"
         with Container(classes="header"):
-            yield Label(f"↪ {self.project_info['name']}", classes="title")
-            yield Label(version, classes="version")
+            yield Label("↪ Buckets", classes="title")
+            yield Label("vt" if self.is_testing else "", classes="version")
             tabs = Tabs(
                 *[
                     Tab(name, id=f"tab-{name.lower()}")
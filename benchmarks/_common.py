@@ -0,0 +1,45 @@
+"""Helpers shared by the benchmark scripts."""
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_PARENT = Path(__file__).resolve().parents[2]
+
+
+def package_env(**extra: str) -> dict[str, str]:
+    """Environment for a child interpreter that can import the package."""
+    env = dict(os.environ, **extra)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(PACKAGE_PARENT), env.get("PYTHONPATH")])
+    )
+    return env
+
+
+def run_child(module: str, args: list[str], cwd=None, **env: str) -> list[dict]:
+    """Run `python -m module args` and collect the JSON lines it prints.
+
+    The database engine binds BUCKETS_DB at import time, so every dataset
+    is measured in a fresh process."""
+    result = subprocess.run(
+        [sys.executable, "-m", module, *args],
+        cwd=cwd,
+        env=package_env(**env),
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
+
+
+def summarize(samples_ms: list[float]) -> dict[str, float]:
+    return {
+        "runs": len(samples_ms),
+        "median_ms": round(statistics.median(samples_ms), 3),
+        "min_ms": round(min(samples_ms), 3),
+        "max_ms": round(max(samples_ms), 3),
+    }
@@ -0,0 +1,78 @@
+"""Form schema build/clone timings.
+
+Run from the directory containing the package:
+
+    python -m Buckets.benchmarks.bench_forms [--options 10 100 1000] [--repeat 200]
+
+Prints one JSON object per (case, option count) with the mean time in
+microseconds.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+from rich.text import Text
+
+from Buckets.forms.form import Form, FormField, Option, Options
+
+
+def _options(count: int) -> Options:
+    return Options(
+        items=[
+            Option(
+                text=f"Option {i}",
+                value=i,
+                prefix=Text("●", style="red"),
+                postfix=Text(f"{i * 1.5}", style="yellow"),
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def _build(options: Options) -> Form:
+    """Roughly the shape of the record form."""
+    return Form(
+        fields=[
+            FormField(key="label", type="autocomplete", options=options),
+            FormField(key="categoryId", type="autocomplete", options=options),
+            FormField(key="amount", type="number", min=0, is_required=True),
+            FormField(key="bucketId", type="autocomplete", options=options),
+            FormField(key="accountId", type="autocomplete", options=options),
+            FormField(key="isIncome", type="boolean", labels=["Expense", "Income"]),
+            FormField(key="date", type="dateAutoDay"),
+        ]
+    )
+
+
+def run(option_counts: list[int], repeat: int) -> list[dict]:
+    results = []
+    for count in option_counts:
+        options = _options(count)
+        blueprint = _build(options)
+        cases = {
+            "options_build": lambda: _options(count),
+            "form_build": lambda: _build(options),
+            "form_clone": blueprint.clone,
+        }
+        for name, fn in cases.items():
+            seconds = min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat
+            results.append(
+                {"case": name, "options": count, "mean_us": round(seconds * 1e6, 2)}
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--options", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    for result in run(args.options, args.repeat):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
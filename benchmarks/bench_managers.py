@@ -0,0 +1,106 @@
+"""Manager entry point timings on generated datasets.
+
+Run from the directory containing the package:
+
+    python -m Buckets.benchmarks.bench_managers [--records 10000 100000] [--repeat 5]
+
+Datasets are generated on first use (see benchmarks/dataset.py) and cached
+under benchmarks/.data. Prints one JSON object per (case, dataset size)
+with median/min/max milliseconds.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+from Buckets.benchmarks._common import run_child, summarize
+from Buckets.benchmarks.dataset import ensure_dataset
+
+
+def cases() -> dict:
+    """Name -> (function, keyword arguments), for the database at BUCKETS_DB."""
+    from Buckets.managers.accounts import get_all_accounts_with_balance
+    from Buckets.managers.categories import (
+        get_all_categories_by_freq,
+        get_all_categories_records,
+    )
+    from Buckets.managers.record_templates import get_all_templates
+    from Buckets.managers.records import get_daily_balance, get_records
+    from Buckets.managers.search import search_records
+    from Buckets.managers.utils import get_period_figures
+
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return {
+        "get_records[month]": (get_records, {"offset": 0, "offset_type": "month"}),
+        "get_records[year]": (get_records, {"offset": 0, "offset_type": "year"}),
+        "get_records[filter]": (
+            get_records,
+            {"offset": 0, "offset_type": "year", "record_filter": "cat:Food amount>20"},
+        ),
+        "get_period_figures[month]": (
+            get_period_figures,
+            {"offset": 0, "offset_type": "month", "isIncome": False},
+        ),
+        "get_period_figures[year]": (
+            get_period_figures,
+            {"offset": 0, "offset_type": "year", "isIncome": False},
+        ),
+        "get_all_categories_records[month]": (
+            get_all_categories_records,
+            {"offset": 0, "offset_type": "month", "is_income": False},
+        ),
+        "get_all_categories_by_freq": (get_all_categories_by_freq, {}),
+        "get_all_accounts_with_balance": (get_all_accounts_with_balance, {}),
+        "get_daily_balance[30d]": (
+            get_daily_balance,
+            {"start_date": today - timedelta(days=29), "end_date": today},
+        ),
+        "get_all_templates": (get_all_templates, {}),
+        "search_records": (search_records, {"query": "coff"}),
+    }
+
+
+def run(records: int, repeat: int) -> list[dict]:
+    from Buckets.config import load_config
+
+    load_config()
+
+    results = []
+    for name, (fn, kwargs) in cases().items():
+        fn(**kwargs)  # warm caches and the connection pool
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(**kwargs)
+            samples.append((time.perf_counter() - start) * 1000)
+        results.append({"case": name, "records": records, **summarize(samples)})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        for result in run(args.records[0], args.repeat):
+            print(json.dumps(result))
+        return
+
+    for records in args.records:
+        path = ensure_dataset(records, args.seed)
+        for result in run_child(
+            "Buckets.benchmarks.bench_managers",
+            ["--child", "--records", str(records), "--repeat", str(args.repeat)],
+            BUCKETS_DB=str(path),
+        ):
+            print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Keypress-to-render latency of the headless app on generated datasets.
+
+Run from the directory containing the package:
+
+    python -m Buckets.benchmarks.bench_ui [--records 10000 100000] [--repeat 5]
+
+Drives `App(is_testing=True)` through Textual's pilot against a scratch
+copy of each dataset (template hotkeys write records). A sample runs from
+the key press until the app is idle again, after the expected screen is
+up. Prints one JSON object per (case, dataset size).
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from Buckets.benchmarks._common import run_child, summarize
+from Buckets.benchmarks.dataset import ensure_dataset
+
+SIZE = (160, 48)
+
+
+async def _timed(pilot, key: str, until=None) -> float:
+    start = time.perf_counter()
+    await pilot.press(key)
+    if until is not None:
+        while not until():
+            await pilot.pause()
+    await pilot.pause()
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(records: int, repeat: int) -> list[dict]:
+    from Buckets import config
+
+    config.load_config()
+    CONFIG = config.CONFIG
+
+    from textual.screen import ModalScreen
+
+    from Buckets.app import App
+
+    app = App(is_testing=True)
+    samples: dict[str, list[float]] = {}
+
+    def add(name: str, ms: float) -> None:
+        samples.setdefault(name, []).append(ms)
+
+    async with app.run_test(headless=True, size=SIZE) as pilot:
+        while not app.query("#records-container"):
+            await pilot.pause()
+        await pilot.pause()
+        records_module = app.query_one("#records-container")
+
+        def modal_open() -> bool:
+            return isinstance(app.screen, ModalScreen)
+
+        async def close_modal() -> None:
+            await pilot.press("escape")
+            while modal_open():
+                await pilot.pause()
+            records_module.focus()
+            await pilot.pause()
+
+        for _ in range(repeat):
+            records_module.focus()
+            await pilot.pause()
+
+            add("previous_period", await _timed(pilot, "left"))
+            add("next_period", await _timed(pilot, "right"))
+            add(
+                "cycle_period_type",
+                await _timed(pilot, CONFIG.hotkeys.home.cycle_offset_type),
+            )
+            add("template_1", await _timed(pilot, "1"))
+
+            add("open_record_modal", await _timed(pilot, CONFIG.hotkeys.new, modal_open))
+            await close_modal()
+            add(
+                "open_transfer_modal",
+                await _timed(pilot, CONFIG.hotkeys.home.new_transfer, modal_open),
+            )
+            await close_modal()
+
+    return [
+        {"case": name, "records": records, **summarize(values)}
+        for name, values in samples.items()
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        for result in asyncio.run(run(args.records[0], args.repeat)):
+            print(json.dumps(result))
+        return
+
+    for records in args.records:
+        dataset = ensure_dataset(records, args.seed)
+        with tempfile.TemporaryDirectory() as scratch:
+            copy = Path(scratch) / "buckets.db"
+            shutil.copyfile(dataset, copy)
+            for result in run_child(
+                "Buckets.benchmarks.bench_ui",
+                ["--child", "--records", str(records), "--repeat", str(args.repeat)],
+                cwd=scratch,
+                BUCKETS_DB=str(copy),
+            ):
+                print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Burst write throughput: one transaction per record vs the writer thread.
+
+Run from the directory containing the package:
+
+    python -m Buckets.benchmarks.bench_writes [--records 10000] [--burst 200] [--repeat 5]
+
+Creates `--burst` records back to back on a scratch copy of the dataset,
+first with `create_record` (a commit each, as template hotkeys do by
+default) and then through `managers.writer` with group commit. Prints one
+JSON object per (case, dataset size) with milliseconds per burst.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from Buckets.benchmarks._common import run_child, summarize
+from Buckets.benchmarks.dataset import ensure_dataset
+
+
+def run(records: int, burst: int, repeat: int) -> list[dict]:
+    from Buckets.config import load_config
+
+    load_config()
+
+    from Buckets.managers import writer
+    from Buckets.managers.accounts import get_all_accounts
+    from Buckets.managers.records import create_record
+
+    account_id = get_all_accounts()[0].id
+
+    def record(i: int) -> dict:
+        return {
+            "label": f"Burst {i}",
+            "amount": 1.0 + i % 50,
+            "accountId": account_id,
+            "isIncome": False,
+            "date": datetime.now(),
+        }
+
+    def direct() -> None:
+        for i in range(burst):
+            create_record(record(i))
+
+    def queued() -> None:
+        futures = [
+            writer.submit(create_record, record(i), tables=("records", "balances"))
+            for i in range(burst)
+        ]
+        for future in futures:
+            future.result()
+
+    writer.start()
+    results = []
+    for name, fn in (("direct", direct), ("writer", queued)):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        results.append(
+            {"case": name, "records": records, "burst": burst, **summarize(samples)}
+        )
+    writer.stop()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        for result in run(args.records[0], args.burst, args.repeat):
+            print(json.dumps(result))
+        return
+
+    for records in args.records:
+        dataset = ensure_dataset(records, args.seed)
+        with tempfile.TemporaryDirectory() as scratch:
+            copy = Path(scratch) / "buckets.db"
+            shutil.copyfile(dataset, copy)
+            for result in run_child(
+                "Buckets.benchmarks.bench_writes",
+                [
+                    "--child",
+                    "--records", str(records),
+                    "--burst", str(args.burst),
+                    "--repeat", str(args.repeat),
+                ],
+                cwd=scratch,
+                BUCKETS_DB=str(copy),
+            ):
+                print(json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
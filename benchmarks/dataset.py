@@ -0,0 +1,263 @@
+"""Deterministic synthetic datasets for the benchmarks.
+
+    BUCKETS_DB=/tmp/bench.db python -m Buckets.benchmarks.dataset --records 100000
+
+The same (records, seed) always produces the same rows, laid out backwards
+from today so the current period has data: accounts with opening balances,
+expenses spread over the default categories, some income, transfers
+between accounts and a few templates. The database is whatever BUCKETS_DB
+points to; it must not exist yet.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from Buckets.benchmarks._common import package_env
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+ACCOUNTS = [
+    ("Checking", 2500.0),
+    ("Savings", 12000.0),
+    ("Visa", 0.0),
+    ("Cash", 150.0),
+    ("Brokerage", 5000.0),
+]
+
+# (label, typical amount) per spending pattern; amounts vary +-60%
+EXPENSES = [
+    ("Coffee", 4.5),
+    ("Groceries", 62.0),
+    ("Lunch", 13.0),
+    ("Fuel", 48.0),
+    ("Train ticket", 7.2),
+    ("Pharmacy", 18.0),
+    ("Cinema", 24.0),
+    ("Electricity bill", 85.0),
+    ("Phone plan", 35.0),
+    ("Restaurant", 54.0),
+    ("Books", 21.0),
+    ("Hardware store", 39.0),
+]
+INCOME = [("Salary", 3200.0), ("Freelance invoice", 740.0), ("Refund", 26.0)]
+
+TRANSFER_SHARE = 0.05
+INCOME_SHARE = 0.04
+# Records span this many days back from today, whatever their count
+SPAN_DAYS = 3 * 365
+
+CHUNK = 20_000
+
+
+def default_path(records: int, seed: int = 0) -> Path:
+    """Where the suite caches a generated dataset."""
+    return Path(__file__).resolve().parent / ".data" / f"buckets-{records}-{seed}.db"
+
+
+def _amount(rng: random.Random, typical: float) -> float:
+    return round(max(0.01, typical * rng.uniform(0.4, 1.6)), 2)
+
+
+def _rows(rng: random.Random, records: int, account_ids, category_ids, today):
+    from Buckets.models.record import record_hash
+
+    spending_accounts = account_ids[:4]
+    for i in range(records):
+        # Newest first, evenly spread, with jitter inside the day
+        date = today - timedelta(
+            days=i * SPAN_DAYS / records, minutes=rng.randint(0, 12 * 60)
+        )
+        roll = rng.random()
+        row = {
+            "accountId": rng.choice(spending_accounts),
+            "date": date,
+            "createdAt": date,
+            "updatedAt": date,
+            "isInProgress": False,
+            "isIncome": False,
+            "isTransfer": False,
+            "transferToAccountId": None,
+            "categoryId": None,
+        }
+        if roll < TRANSFER_SHARE:
+            source, target = rng.sample(account_ids, 2)
+            row.update(
+                label="Transfer",
+                amount=_amount(rng, 200.0),
+                accountId=source,
+                isTransfer=True,
+                transferToAccountId=target,
+            )
+        elif roll < TRANSFER_SHARE + INCOME_SHARE:
+            label, typical = rng.choice(INCOME)
+            row.update(
+                label=label,
+                amount=_amount(rng, typical),
+                accountId=account_ids[0],
+                isIncome=True,
+                categoryId=rng.choice(category_ids),
+            )
+        else:
+            label, typical = rng.choice(EXPENSES)
+            row.update(
+                label=label,
+                amount=_amount(rng, typical),
+                categoryId=rng.choice(category_ids),
+            )
+        row["dedupeHash"] = record_hash(
+            row["accountId"], date, row["amount"], row["label"], row["isIncome"]
+        )
+        yield row
+
+
+def generate(records: int, seed: int = 0, progress: bool = False) -> None:
+    """Fill the (new) database at BUCKETS_DB with `records` records."""
+    from sqlalchemy import insert, select
+
+    from Buckets.config import load_config
+
+    load_config()
+
+    from Buckets.managers.label_index import rebuild_label_index
+    from Buckets.models.account import Account
+    from Buckets.models.category import Category
+    from Buckets.models.database.app import DB_PATH, Session, db_engine, init_db
+    from Buckets.models.record import Record
+    from Buckets.models.record_template import RecordTemplate
+
+    if DB_PATH.exists() and DB_PATH.stat().st_size:
+        raise SystemExit(f"{DB_PATH} already exists")
+    init_db()
+
+    rng = random.Random(seed)
+    today = datetime.now().replace(hour=20, minute=0, second=0, microsecond=0)
+    session = Session()
+    try:
+        session.execute(
+            insert(Account),
+            [{"name": name, "beginningBalance": balance} for name, balance in ACCOUNTS],
+        )
+        account_ids = list(
+            session.scalars(
+                select(Account.id).where(Account.hidden == False)  # noqa: E712
+                .order_by(Account.id)
+            )
+        )
+        category_ids = list(
+            session.scalars(select(Category.id).where(Category.deletedAt.is_(None)))
+        )
+
+        chunk = []
+        for done, row in enumerate(
+            _rows(rng, records, account_ids, category_ids, today), 1
+        ):
+            chunk.append(row)
+            if len(chunk) == CHUNK:
+                session.execute(insert(Record), chunk)
+                chunk = []
+                if progress:
+                    print(f"\r{done}/{records}", end="", file=sys.stderr, flush=True)
+        if chunk:
+            session.execute(insert(Record), chunk)
+
+        templates = [
+            RecordTemplate(
+                label=label,
+                amount=typical,
+                accountId=account_ids[0],
+                categoryId=category_ids[i % len(category_ids)],
+                isIncome=(label, typical) in INCOME,
+            )
+            for i, (label, typical) in enumerate(EXPENSES[:6] + INCOME[:1])
+        ]
+        templates.append(
+            RecordTemplate(
+                label="Save",
+                amount=300.0,
+                accountId=account_ids[0],
+                isTransfer=True,
+                transferToAccountId=account_ids[1],
+            )
+        )
+        for template in templates:
+            # One flush each: the before_insert hook numbers `order` from
+            # the rows already in the table
+            session.add(template)
+            session.flush()
+        session.commit()
+        rebuild_label_index(session)
+    finally:
+        session.close()
+    # The database runs in WAL mode; fold the log into the main file so
+    # the dataset is that one file when it is renamed or copied
+    with db_engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    db_engine.dispose()
+    if progress:
+        print(file=sys.stderr)
+
+
+def ensure_dataset(records: int, seed: int = 0) -> Path:
+    """Path of the cached dataset, generating it in a subprocess if missing.
+
+    Generation needs its own process because the engine binds BUCKETS_DB
+    at import time."""
+    import subprocess
+
+    path = default_path(records, seed)
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(".partial")
+    _remove_database(partial)
+    try:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "Buckets.benchmarks.dataset",
+                "--records",
+                str(records),
+                "--seed",
+                str(seed),
+            ],
+            env=package_env(BUCKETS_DB=str(partial)),
+            check=True,
+        )
+    except BaseException:
+        _remove_database(partial)
+        raise
+    partial.rename(path)
+    _remove_database(partial)
+    return path
+
+
+def _remove_database(path: Path) -> None:
+    """Delete `path` with its WAL and shared-memory files."""
+    for file in (path, Path(f"{path}-wal"), Path(f"{path}-shm")):
+        file.unlink(missing_ok=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=SIZES[0])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if not os.environ.get("BUCKETS_DB"):
+        raise SystemExit("Set BUCKETS_DB to the database file to create")
+    start = time.perf_counter()
+    generate(args.records, args.seed, progress=sys.stderr.isatty())
+    print(
+        f"{args.records} records in {time.perf_counter() - start:.1f}s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
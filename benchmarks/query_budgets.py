@@ -0,0 +1,297 @@
+"""Check manager read paths against their declared query budgets.
+
+Run from the directory containing the package:
+
+    python -m Buckets.benchmarks.query_budgets [--records 1000 10000]
+
+Every function under managers/ declaring `@query_budget` (see
+utils/query_guard.py) is run under its guard on each dataset size, along
+with the records and templates views, which also touch the relationships
+they render. A budget must hold at every size; a count that grows with the
+data is an N+1. A budgeted function with no check here fails too, so new
+budgets can't go unchecked. Prints one JSON object per (case, dataset
+size) and exits with status 1 on any violation.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import pkgutil
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from Buckets.benchmarks._common import run_child
+from Buckets.benchmarks.dataset import ensure_dataset
+
+# Name -> (budgeted function, keyword arguments, what the caller does with
+# the result inside the same guard, or None)
+Check = tuple[Callable, dict, Callable[[Any], None] | None]
+
+
+def budgeted() -> dict[str, Callable]:
+    """Every manager function declaring a query budget, by qualified name."""
+    import Buckets.managers as package
+
+    found = {}
+    for info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package.__name__}.{info.name}")
+        for name, value in vars(module).items():
+            if (
+                hasattr(value, "__query_budget__")
+                and getattr(value, "__module__", None) == module.__name__
+            ):
+                found[f"{info.name}.{name}"] = value
+    return found
+
+
+def _touch(obj, *names: str) -> None:
+    """Read attributes the way a view does; an unloaded relationship then
+    queries (or fails once detached)."""
+    if obj is not None:
+        for name in names:
+            getattr(obj, name)
+
+
+def _records_view(records) -> None:
+    # What the records table renders per row (see records/_table_builder.py)
+    for record in records:
+        _touch(record, "label", "amount", "isTransfer")
+        _touch(record.account, "name", "hidden")
+        _touch(record.transferToAccount, "name", "hidden")
+        _touch(record.category, "name", "color")
+
+
+def _templates_view(templates) -> None:
+    # What the templates module renders per template
+    for template in templates:
+        _touch(template, "label", "recurrence", "isTransfer")
+        if not template.isTransfer:
+            _touch(template.category, "color")
+
+
+def _sample(session, model):
+    """First row of `model`, detached so rollbacks between checks can't
+    expire it (a refresh would be counted against the check)."""
+    from sqlalchemy import select
+
+    row = session.scalars(select(model).limit(1)).first()
+    if row is not None:
+        session.expunge(row)
+    return row
+
+
+def checks(session) -> dict[str, Check]:
+    """Checks for the database at BUCKETS_DB. `session` is rolled back after
+    each one, so those taking a caller's session write nothing."""
+    from Buckets.benchmarks.bench_managers import cases
+    from Buckets.managers.accounts import (
+        get_account_balance,
+        get_account_balance_by_id,
+        get_account_by_id,
+        get_accounts_count,
+        get_all_accounts,
+    )
+    from Buckets.managers.buckets import (
+        get_all_buckets,
+        get_bucket_by_id,
+        get_buckets_by_account,
+    )
+    from Buckets.managers.categories import (
+        get_all_categories_tree,
+        get_categories_count,
+        get_category_by_id,
+    )
+    from Buckets.managers.label_index import (
+        rebuild_label_index,
+        record_label_rows,
+        record_label_unuse,
+        record_label_use,
+        search_labels,
+    )
+    from Buckets.managers.record_templates import (
+        get_all_templates,
+        get_record_templates,
+        get_template_by_id,
+        get_transfer_templates,
+    )
+    from Buckets.managers.records import (
+        get_record_by_id,
+        get_records,
+        get_spending,
+        get_spending_trend,
+    )
+    from Buckets.managers.recurrence import generate_due_records
+    from Buckets.models.account import Account
+    from Buckets.models.category import Category
+    from Buckets.models.record import Record
+    from Buckets.models.record_template import RecordTemplate
+
+    account = _sample(session, Account)
+    category = _sample(session, Category)
+    record = _sample(session, Record)
+    template = _sample(session, RecordTemplate)
+    session.rollback()
+
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    month = {"start_date": today - timedelta(days=29), "end_date": today}
+    rows = [
+        {"label": f"Budget check {i % 5}", "date": today, "amount": 1.0}
+        for i in range(20)
+    ]
+
+    result: dict[str, Check] = {
+        name: (fn, kwargs, None) for name, (fn, kwargs) in cases().items()
+    }
+    result.update(
+        {
+            "view:records[month]": (
+                get_records,
+                {"offset": 0, "offset_type": "month"},
+                _records_view,
+            ),
+            "view:templates": (get_all_templates, {}, _templates_view),
+            "get_record_templates": (get_record_templates, {}, None),
+            "get_transfer_templates": (get_transfer_templates, {}, None),
+            "get_template_by_id": (
+                get_template_by_id,
+                {"recordtemplate_id": template.id},
+                None,
+            ),
+            "get_record_by_id": (get_record_by_id, {"record_id": record.id}, None),
+            "get_spending[30d]": (get_spending, month, None),
+            "get_spending_trend[30d]": (get_spending_trend, month, None),
+            "get_all_accounts": (get_all_accounts, {}, None),
+            "get_accounts_count": (get_accounts_count, {}, None),
+            "get_account_by_id": (get_account_by_id, {"account_id": account.id}, None),
+            "get_account_balance": (
+                get_account_balance,
+                {"account_id": account.id},
+                None,
+            ),
+            "get_account_balance_by_id": (
+                get_account_balance_by_id,
+                {"account_id": account.id},
+                None,
+            ),
+            "get_categories_count": (get_categories_count, {}, None),
+            "get_all_categories_tree": (get_all_categories_tree, {}, None),
+            "get_category_by_id": (
+                get_category_by_id,
+                {"category_id": category.id},
+                None,
+            ),
+            "get_all_buckets": (get_all_buckets, {}, None),
+            "get_bucket_by_id": (get_bucket_by_id, {"bucket_id": 1}, None),
+            "get_buckets_by_account": (
+                get_buckets_by_account,
+                {"account_id": account.id},
+                None,
+            ),
+            "search_labels": (search_labels, {"prefix": "co"}, None),
+            "record_label_use": (
+                record_label_use,
+                {"session": session, "record": record},
+                None,
+            ),
+            "record_label_unuse": (
+                record_label_unuse,
+                {"session": session, "record": record},
+                None,
+            ),
+            "record_label_rows": (
+                record_label_rows,
+                {"session": session, "rows": rows},
+                None,
+            ),
+            "rebuild_label_index": (rebuild_label_index, {"session": session}, None),
+            # The generated templates don't repeat, so this is the check
+            # every app start runs: nothing due
+            "generate_due_records": (generate_due_records, {}, None),
+        }
+    )
+    return result
+
+
+def run(records: int) -> list[dict]:
+    from Buckets.config import load_config
+    from Buckets.models.database.app import Session
+    from Buckets.utils.query_guard import QueryGuard
+
+    load_config()
+
+    session = Session()
+    try:
+        cases = checks(session)
+        results = []
+        for name, (fn, kwargs, use) in cases.items():
+            budget, max_repeats = fn.__query_budget__
+            guard = QueryGuard(budget, max_repeats)
+            try:
+                with guard:
+                    value = fn(**kwargs)
+                    if use is not None:
+                        use(value)
+                error = None
+            except Exception as e:
+                # Budget violations, and lazy loads on detached objects
+                error = f"{type(e).__name__}: {e}"
+            finally:
+                session.rollback()
+            results.append(
+                {
+                    "case": name,
+                    "records": records,
+                    "statements": len(guard.statements),
+                    "budget": budget,
+                    "error": error,
+                }
+            )
+    finally:
+        session.close()
+
+    checked = {fn for fn, _, _ in cases.values()}
+    for name, fn in budgeted().items():
+        if fn not in checked:
+            results.append(
+                {
+                    "case": name,
+                    "records": records,
+                    "statements": 0,
+                    "budget": fn.__query_budget__[0],
+                    "error": "Declares a query budget but has no check",
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        for result in run(args.records[0]):
+            print(json.dumps(result))
+        return
+
+    failed = False
+    for records in args.records:
+        path = ensure_dataset(records, args.seed)
+        for result in run_child(
+            "Buckets.benchmarks.query_budgets",
+            ["--child", "--records", str(records)],
+            BUCKETS_DB=str(path),
+        ):
+            print(json.dumps(result), flush=True)
+            failed |= result["error"] is not None
+    if failed:
+        print("Query budgets exceeded", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Run the benchmark suite and save one JSON document for comparison.
+
+Run from the directory containing the package:
+
+    python -m Buckets.benchmarks.run -o bench-$(git rev-parse --short HEAD).json
+    python -m Buckets.benchmarks.run --records 10000 100000 1000000 --only managers
+
+The document holds the commit, machine and every result line of the
+selected benchmarks, each tagged with its benchmark name.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from Buckets.benchmarks._common import run_child
+
+BENCHMARKS = ("managers", "ui", "writes", "forms", "startup")
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="JSON file (default: stdout)")
+    parser.add_argument("--records", nargs="+", default=["10000", "100000"])
+    parser.add_argument("--repeat", default="5")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=BENCHMARKS)
+    args = parser.parse_args()
+
+    sized = ["--records", *args.records, "--repeat", args.repeat]
+    commands = {
+        "managers": ("Buckets.benchmarks.bench_managers", sized),
+        "ui": ("Buckets.benchmarks.bench_ui", sized),
+        "writes": ("Buckets.benchmarks.bench_writes", ["--records", args.records[0]]),
+        "forms": ("Buckets.benchmarks.bench_forms", []),
+        # Recorded here; the budget is enforced by running startup directly
+        "startup": ("Buckets.benchmarks.startup", ["--budget", "inf"]),
+    }
+    results = []
+    for name in args.only:
+        module, module_args = commands[name]
+        print(f"{name}…", file=sys.stderr, flush=True)
+        results += [{"bench": name, **row} for row in run_child(module, module_args)]
+
+    document = {
+        "commit": _commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    text = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
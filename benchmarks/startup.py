@@ -0,0 +1,139 @@
+"""Cold-start timings: import cost and time to first paint.
+
+Run from the directory containing the package:
+
+    python -m Buckets.benchmarks.startup [--runs 5] [--budget 1500] [--top 15]
+
+Each run is a fresh interpreter. "first_paint_ms" is measured from spawning
+the process until the headless app has mounted the home page; the slowest
+imports come from `-X importtime`. Exits with status 1 when the median
+first paint exceeds `--budget` milliseconds, so CI can guard it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from Buckets.benchmarks._common import package_env
+
+_MARKER = "first-paint"
+
+
+async def _first_paint() -> None:
+    """Child process: start the app headless and report once Home is up."""
+    from Buckets.config import load_config
+
+    load_config()
+
+    from Buckets.models.database.app import init_db
+
+    init_db()
+
+    from Buckets.app import App
+
+    app = App(is_testing=True)
+    async with app.run_test(headless=True, size=(160, 48)) as pilot:
+        while not app.query("#records-container"):
+            await pilot.pause()
+        await pilot.pause()
+        print(_MARKER, flush=True)
+
+
+def time_first_paint(cwd: str, timeout: float = 60) -> float:
+    """Milliseconds from spawning the app until its first full frame."""
+    start = time.perf_counter()
+    child = subprocess.Popen(
+        [sys.executable, "-m", "Buckets.benchmarks.startup", "--child"],
+        cwd=cwd,
+        # The scratch directory's database, not one set for the shell
+        env=package_env(BUCKETS_DB=""),
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        for line in child.stdout:
+            if line.strip() == _MARKER:
+                return (time.perf_counter() - start) * 1000
+        raise RuntimeError(f"App exited without painting (status {child.wait()})")
+    finally:
+        child.kill()
+        child.wait(timeout)
+
+
+def slowest_imports(module: str = "Buckets.app", top: int = 15) -> list[dict]:
+    """Modules with the largest cumulative import time, from -X importtime.
+
+    The config is loaded first, as textualrun does: the app reads it at
+    class definition."""
+    code = f"from Buckets.config import load_config; load_config(); import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=package_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append(
+            {
+                "module": name.strip(),
+                "self_ms": round(int(self_us) / 1000, 2),
+                "cumulative_ms": round(int(cumulative_us) / 1000, 2),
+            }
+        )
+    rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+    return rows[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=1500, help="Milliseconds")
+    parser.add_argument("--top", type=int, default=15, help="Imports to list")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        import asyncio
+
+        asyncio.run(_first_paint())
+        return
+
+    for row in slowest_imports(top=args.top):
+        print(json.dumps({"case": "import", **row}))
+
+    # A scratch directory keeps the benchmark database out of the real one
+    with tempfile.TemporaryDirectory() as cwd:
+        time_first_paint(cwd)  # creates the database and config
+        runs = [time_first_paint(cwd) for _ in range(args.runs)]
+    median = statistics.median(runs)
+    print(
+        json.dumps(
+            {
+                "case": "first_paint",
+                "runs": args.runs,
+                "median_ms": round(median, 1),
+                "max_ms": round(max(runs), 1),
+                "budget_ms": args.budget,
+            }
+        )
+    )
+    if median > args.budget:
+        print(
+            f"First paint {median:.0f} ms exceeds the {args.budget:.0f} ms budget",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,22 @@ class BucketsPage(Static):
     def on_mount(self) -> None:
         self.rebuild()
 
+    def invalidate(self, changed: set[str]) -> None:
+        """Rebuild only the modules whose data changed while the page was hidden."""
+        if "accounts" in changed:
+            self.accounts = get_all_accounts()
+            self.accounts_indices["count"] = len(self.accounts)
+            self.accounts_indices["index"] = min(
+                self.accounts_indices["index"], max(len(self.accounts) - 1, 0)
+            )
+        for module in (
+            self.accounts_module,
+            self.buckets_module,
+            self.categories_module,
+        ):
+            if changed.intersection(module.DATA_DEPENDENCIES):
+                module.rebuild()
+
     def rebuild(self) -> None:
         self.accounts_module.rebuild()
         self.buckets_module.rebuild()
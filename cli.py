@@ -0,0 +1,348 @@
+# Buckets/cli.py
+"""Headless command line entry points.
+
+Only config, models and managers are imported here, and each lazily inside
+its command, so scripted use never pays for Textual.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime
+
+COMMANDS = {"add", "balance", "report", "template", "import", "export", "serve"}
+
+
+def _find_account(value: str | None):
+    from Buckets.managers.accounts import get_all_accounts
+
+    if value is None:
+        # Same default as the TUI: the first visible account
+        accounts = get_all_accounts()
+        if not accounts:
+            raise SystemExit("No accounts yet; create one first")
+        return accounts[0]
+
+    accounts = get_all_accounts(get_hidden=True)
+    for account in accounts:
+        if str(account.id) == value or account.name.casefold() == value.casefold():
+            return account
+    raise SystemExit(f"No account matching {value!r}")
+
+
+def _find_category(value: str):
+    from Buckets.managers.categories import get_all_categories_by_freq
+
+    for category, _ in get_all_categories_by_freq():
+        if str(category.id) == value or category.name.casefold() == value.casefold():
+            return category
+    raise SystemExit(f"No category matching {value!r}")
+
+
+def _date(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected YYYY-MM-DD, got {value!r}")
+
+
+def _money(value: float) -> str:
+    from Buckets.config import CONFIG
+
+    return f"{value:,.{CONFIG.defaults.round_decimals}f}"
+
+
+def _progress(done: int, total: int) -> None:
+    percent = min(done * 100 // max(total, 1), 100)
+    print(f"\r{percent:3d}%", end="", file=sys.stderr, flush=True)
+
+
+def cmd_add(args: argparse.Namespace) -> int:
+    from Buckets.managers.records import create_record
+    from Buckets.utils.format import parse_formula_expression
+
+    amount = parse_formula_expression(args.amount)
+    if amount <= 0:
+        print(f"Invalid amount {args.amount!r}", file=sys.stderr)
+        return 1
+    account = _find_account(args.account)
+    record = create_record(
+        {
+            "label": args.label,
+            "amount": amount,
+            "accountId": account.id,
+            "categoryId": _find_category(args.category).id if args.category else None,
+            "isIncome": args.income,
+            "date": args.date or datetime.now(),
+        }
+    )
+    kind = "income" if record.isIncome else "expense"
+    print(
+        f"Added {kind} #{record.id} {record.label} "
+        f"{_money(record.amount)} to {account.name}"
+    )
+    return 0
+
+
+def cmd_balance(args: argparse.Namespace) -> int:
+    from Buckets.managers.accounts import get_all_accounts_with_balance
+
+    accounts = get_all_accounts_with_balance(get_hidden=args.all)
+    if not accounts:
+        print("No accounts")
+        return 0
+    width = max(len(a.name) for a in accounts)
+    for account in accounts:
+        print(f"{account.name:<{width}}  {_money(account.balance):>14}")
+    total = sum(a.balance for a in accounts if not a.hidden)
+    print(f"{'Total':<{width}}  {_money(total):>14}")
+    return 0
+
+
+def cmd_report(args: argparse.Namespace) -> int:
+    from Buckets.config import CONFIG
+    from Buckets.managers.categories import get_all_categories_records
+    from Buckets.managers.filters import FilterError, compile_filter
+    from Buckets.managers.utils import (
+        get_period_average,
+        get_period_figures,
+        get_start_end_of_period,
+    )
+
+    try:
+        compile_filter(args.filter)
+    except FilterError as e:
+        print(f"Invalid filter: {e}", file=sys.stderr)
+        return 1
+
+    offset_type = args.period or CONFIG.defaults.period
+    account_id = _find_account(args.account).id if args.account else None
+    start, end = get_start_end_of_period(args.offset, offset_type)
+    figures = {
+        "offset": args.offset,
+        "offset_type": offset_type,
+        "accountId": account_id,
+        "record_filter": args.filter,
+    }
+    income = get_period_figures(isIncome=True, **figures)
+    expense = get_period_figures(isIncome=False, **figures)
+
+    print(f"{offset_type.capitalize()} {start:%Y-%m-%d} - {end:%Y-%m-%d}")
+    print(f"  Income   {_money(income):>14}")
+    print(f"  Expense  {_money(expense):>14}")
+    print(f"  Net      {_money(income - expense):>14}")
+    print(
+        f"  Per day  {_money(get_period_average(expense, args.offset, offset_type)):>14}"
+    )
+
+    categories = get_all_categories_records(
+        args.offset,
+        offset_type,
+        is_income=args.income,
+        account_id=account_id,
+        record_filter=args.filter,
+    )
+    if categories:
+        print("Income by category" if args.income else "Expense by category")
+        width = max(len(c.name) for c in categories[: args.top])
+        for category in categories[: args.top]:
+            print(f"  {category.name:<{width}}  {_money(category.amount):>14}")
+    return 0
+
+
+def cmd_template(args: argparse.Namespace) -> int:
+    from Buckets.managers.record_templates import get_all_templates
+
+    templates = get_all_templates()
+    if args.template_command == "list":
+        for slot, template in enumerate(templates, start=1):
+            if template.isTransfer:
+                kind = "transfer"
+            else:
+                kind = "income" if template.isIncome else "expense"
+            repeat = ""
+            if template.recurrence:
+                repeat = f"  {template.recurrence}, next {template.nextDueAt:%Y-%m-%d}"
+            print(
+                f"{slot:>2}  {template.label}  {_money(template.amount)}  ({kind})"
+                f"{repeat}"
+            )
+        return 0
+
+    # run: slots are numbered like the 1-9 hotkeys on the home page
+    if not 1 <= args.slot <= len(templates):
+        print(f"Template slot {args.slot} is empty", file=sys.stderr)
+        return 1
+    from Buckets.managers.records import create_record
+
+    template = templates[args.slot - 1]
+    record_data = template.to_dict()
+    record_data["date"] = args.date or datetime.now()
+    create_record(record_data)
+    print(f"Created new record with {template.label}")
+    return 0
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    from Buckets.config import CONFIG
+    from Buckets.managers.importer import CsvImportError, import_csv
+
+    settings = CONFIG.csv_import.model_copy(
+        update={
+            key: value
+            for key, value in {
+                "date_format": args.date_format,
+                "delimiter": args.delimiter,
+                "date_column": args.date_column,
+                "amount_column": args.amount_column,
+                "label_column": args.label_column,
+                "encoding": args.encoding,
+            }.items()
+            if value is not None
+        }
+    )
+    account = _find_account(args.account)
+    try:
+        result = import_csv(
+            args.file,
+            account.id,
+            settings=settings,
+            dry_run=args.dry_run,
+            progress=None if args.quiet else _progress,
+        )
+    except (CsvImportError, OSError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(result.summary())
+    for line, error in result.errors[:20]:
+        print(f"  line {line}: {error}")
+    if len(result.errors) > 20:
+        print(f"  ... {len(result.errors) - 20} more")
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    from Buckets.managers.exporter import export_records
+
+    fmt = args.format
+    if fmt is None:
+        name = (args.output or "").removesuffix(".gz")
+        fmt = "jsonl" if name.endswith((".jsonl", ".ndjson")) else "csv"
+
+    count = export_records(
+        args.output,
+        format=fmt,
+        compress=True if args.gzip else None,
+        offset=args.offset if args.period else None,
+        offset_type=args.period or "month",
+        start=args.start,
+        end=args.end,
+        account_id=_find_account(args.account).id if args.account else None,
+        category_id=_find_category(args.category).id if args.category else None,
+        kind=args.type,
+    )
+    if args.output not in (None, "-"):
+        print(f"Exported {count} records to {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    from Buckets.api.server import ApiServer, run
+
+    server = ApiServer.from_config()
+    if args.socket is not None:
+        server.socket_path = args.socket
+    if args.port is not None:
+        server.socket_path, server.port = "", args.port
+    if args.host is not None:
+        server.host = args.host
+    run(server)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="buckets")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("add", help="Add a record")
+    p.add_argument("label")
+    p.add_argument("amount", help="Amount or arithmetic, e.g. 12.5 or 90/3")
+    p.add_argument("--account", help="Account name or id (default: first account)")
+    p.add_argument("--category", help="Category name or id")
+    p.add_argument("--income", action="store_true", help="Income instead of expense")
+    p.add_argument("--date", type=_date, help="YYYY-MM-DD (default: now)")
+    p.set_defaults(handler=cmd_add)
+
+    p = commands.add_parser("balance", help="Show account balances")
+    p.add_argument("--all", action="store_true", help="Include hidden accounts")
+    p.set_defaults(handler=cmd_balance)
+
+    p = commands.add_parser("report", help="Period totals and top categories")
+    p.add_argument("--period", choices=("day", "week", "month", "year"))
+    p.add_argument("--offset", type=int, default=0, help="Periods back, e.g. -1")
+    p.add_argument("--account", help="Account name or id")
+    p.add_argument("--income", action="store_true", help="Break down income")
+    p.add_argument("--top", type=int, default=10, help="Categories to list")
+    p.add_argument("--filter", help='Record filter, e.g. "cat:Food amount>20"')
+    p.set_defaults(handler=cmd_report)
+
+    p = commands.add_parser("template", help="List or run record templates")
+    templates = p.add_subparsers(dest="template_command", required=True)
+    templates.add_parser("list", help="List templates by slot")
+    run = templates.add_parser("run", help="Create a record from template slot N")
+    run.add_argument("slot", type=int)
+    run.add_argument("--date", type=_date, help="YYYY-MM-DD (default: now)")
+    p.set_defaults(handler=cmd_template)
+
+    p = commands.add_parser("import", help="Import a bank-statement CSV file")
+    p.add_argument("file")
+    p.add_argument("--account", required=True, help="Account name or id")
+    p.add_argument("--dry-run", action="store_true", help="Report, don't write")
+    p.add_argument("--date-format")
+    p.add_argument("--delimiter")
+    p.add_argument("--date-column")
+    p.add_argument("--amount-column")
+    p.add_argument("--label-column")
+    p.add_argument("--encoding", help="File encoding, e.g. latin-1")
+    p.add_argument("-q", "--quiet", action="store_true")
+    p.set_defaults(handler=cmd_import)
+
+    p = commands.add_parser("export", help="Export records as CSV or JSON Lines")
+    p.add_argument("-o", "--output", help="Output file (default: stdout)")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="Default: from suffix")
+    p.add_argument("--gzip", action="store_true", help="Compress (implied by .gz)")
+    p.add_argument("--period", choices=("day", "week", "month", "year"))
+    p.add_argument("--offset", type=int, default=0, help="Periods back, e.g. -1")
+    p.add_argument("--from", dest="start", type=_date, help="YYYY-MM-DD")
+    p.add_argument("--to", dest="end", type=_date, help="YYYY-MM-DD, exclusive")
+    p.add_argument("--account", help="Account name or id")
+    p.add_argument("--category", help="Category name or id (includes children)")
+    p.add_argument("--type", choices=("income", "expense", "transfer"))
+    p.set_defaults(handler=cmd_export)
+
+    p = commands.add_parser("serve", help="Run the local JSON API without the TUI")
+    p.add_argument("--socket", help="Unix socket path (default: from config)")
+    p.add_argument("--host")
+    p.add_argument("--port", type=int)
+    p.set_defaults(handler=cmd_serve)
+
+    return parser
+
+
+def main(argv: list[str]) -> int:
+    args = build_parser().parse_args(argv)
+
+    from Buckets.config import load_config
+
+    load_config()
+
+    from Buckets.models.database.app import init_db
+
+    init_db()
+
+    from Buckets.managers.recurrence import generate_due_records
+
+    generate_due_records()
+    return args.handler(args)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, ClassVar, Iterable, Literal, Mapping, cast
+from typing import Any, Callable, ClassVar, Iterable, Literal, Mapping, cast
 
 from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
 from rich.style import Style
@@ -14,6 +14,8 @@ from textual.message import Message
 from textual.widget import Widget
 from textual.widgets import Input
 
+from Buckets.components.matcher import FuzzyMatcher, SubstringMatcher
+
 class DropdownRender:
     def __init__(
         self,
@@ -55,7 +57,7 @@ class DropdownRender:
                     for start, end in match.highlight_ranges:
                         main_text.stylize(highlight_style, start, end)
                 elif match.is_create_option is False:
-                    # Otherwise, by default, we highlight case-insensitive substrings
+                    # Fallback for items supplied by a callable `items`
                     main_text.highlight_words(
                         [self.filter],
                         highlight_style,
@@ -100,7 +102,11 @@ class DropdownItem:
             `main` attribute, then that substring will be highlighted. If you supply your own
             implementation of `items` which uses a more complex process to decide what to
             display in the dropdown, then you can customise the highlighting of the returned
-            candidates by supplying index ranges to highlight.
+            candidates by supplying index ranges to highlight. The built-in matchers
+            fill this in for the rows they return.
+        weight: Relative frequency of this option, used by the fuzzy matcher to
+            rank commonly used options higher.
+        payload: Arbitrary data carried along to the `Selected` message.
 
     """
 
@@ -111,6 +117,8 @@ class DropdownItem:
     create_option_text: str = ""
     highlight_ranges: Iterable[tuple[int, int]] | None = None
     original_index: int | None = None
+    weight: float = 0
+    payload: Any = None
 
     def __post_init__(self):
         if isinstance(self.left_meta, str):
@@ -310,6 +318,9 @@ Dropdown .autocomplete--right-column {
         show_on_focus: bool = True,
         create_option: bool = False,
         show_when_empty: bool = True,
+        max_matches: int | None = 12,
+        match_strategy: Literal["substring", "fuzzy"] = "substring",
+        suggest: Callable[[str], list[DropdownItem]] | None = None,
         id: str | None = None,
         classes: str | None = None,
     ):
@@ -321,6 +332,12 @@ Dropdown .autocomplete--right-column {
                 of dropdown items for the current input value and cursor position.
                 Function takes the current InputState as an argument, and returns a list of
                 `DropdownItem` which will be displayed in the dropdown list.
+            max_matches: Upper bound on the number of rows handed to the renderer
+                (defaults to the dropdown's max-height). None shows every match.
+            match_strategy: "substring" keeps prefix hits first, then other substring
+                hits in list order. "fuzzy" ranks subsequence matches by score.
+            suggest: Optional lookup for extra items beyond `items` (e.g. a database
+                index), called with the typed value to fill the remaining rows.
             id: The ID of the widget, allowing you to directly refer to it using CSS and managers.
             classes: The classes of this widget, a space separated string.
         """
@@ -333,6 +350,11 @@ Dropdown .autocomplete--right-column {
         self.show_on_focus = show_on_focus
         self.create_option = create_option
         self.show_when_empty = show_when_empty
+        self.max_matches = max_matches
+        self.match_strategy = match_strategy
+        self.suggest = suggest
+        self._matcher: SubstringMatcher | FuzzyMatcher | None = None
+        self._matcher_items: list[DropdownItem] | None = None
 
     def compose(self) -> ComposeResult:
         self.child = DropdownChild(self.input_widget)
@@ -420,30 +442,16 @@ Dropdown .autocomplete--right-column {
             matches = self.items(input_state)
         else:
             matches = []
-            for index, item in enumerate(self.items):
-                # Casting to Text, since we convert to Text object in
-                # the __post_init__ of DropdownItem.
-                text = cast(Text, item.main)
-                should_show = self.show_when_empty or value != ""
-                if should_show and value.lower() in text.plain.lower():
-                    matches.append(
-                        DropdownItem(
-                            left_meta=cast(Text, item.left_meta).copy(),
-                            main=cast(Text, item.main).copy(),
-                            right_meta=cast(Text, item.right_meta).copy(),
-                            is_create_option=item.is_create_option,
-                            create_option_text=item.create_option_text,
-                            highlight_ranges=item.highlight_ranges,
-                            original_index=index,
-                        )
+            if self.show_when_empty or value != "":
+                matches = [
+                    self._copy_item(self.items[index], index, ranges)
+                    for index, ranges in self._get_matcher().match(
+                        value, self.max_matches
                     )
+                ]
 
-            matches = sorted(
-                matches,
-                key=lambda match: not cast(Text, match.main)
-                .plain.lower()
-                .startswith(value.lower()),
-            )
+            if self.suggest is not None and value.strip():
+                matches.extend(self._suggestions(value, matches))
 
         # Add "Create" option if no matches and create_action is set
         if len(matches) == 0 and self.create_option is True and value.strip():
@@ -463,6 +471,57 @@ Dropdown .autocomplete--right-column {
         self.reposition(input_cursor_position)
         self.child.refresh()
 
+    def _get_matcher(self) -> SubstringMatcher | FuzzyMatcher:
+        """Index for the current item list, rebuilt only when `items` is replaced."""
+        items = cast(list[DropdownItem], self.items)
+        if self._matcher is None or self._matcher_items is not items:
+            matcher_cls = (
+                FuzzyMatcher if self.match_strategy == "fuzzy" else SubstringMatcher
+            )
+            self._matcher = matcher_cls(
+                [cast(Text, item.main).plain for item in items],
+                [item.weight for item in items],
+            )
+            self._matcher_items = items
+        return self._matcher
+
+    def _suggestions(
+        self, value: str, matches: list[DropdownItem]
+    ) -> list[DropdownItem]:
+        room = None if self.max_matches is None else self.max_matches - len(matches)
+        if room is not None and room <= 0:
+            return []
+        shown = {cast(Text, match.main).plain.casefold() for match in matches}
+        folded_value = value.casefold()
+        suggestions = []
+        for item in self.suggest(value):
+            plain = cast(Text, item.main).plain
+            if plain.casefold() in shown:
+                continue
+            if item.highlight_ranges is None and plain.casefold().startswith(
+                folded_value
+            ):
+                item.highlight_ranges = ((0, len(value)),)
+            suggestions.append(item)
+        return suggestions[:room]
+
+    @staticmethod
+    def _copy_item(
+        item: DropdownItem, index: int, ranges: Iterable[tuple[int, int]] | None
+    ) -> DropdownItem:
+        # Casting to Text, since we convert to Text object in
+        # the __post_init__ of DropdownItem.
+        return DropdownItem(
+            left_meta=cast(Text, item.left_meta).copy(),
+            main=cast(Text, item.main).copy(),
+            right_meta=cast(Text, item.right_meta).copy(),
+            is_create_option=item.is_create_option,
+            create_option_text=item.create_option_text,
+            highlight_ranges=ranges if ranges is not None else item.highlight_ranges,
+            original_index=index,
+            weight=item.weight,
+        )
+
     def handle_screen_scroll(self, old: float, new: float) -> None:
         self.reposition(scroll_target_adjust_y=int(old) - int(new))
 
@@ -4,14 +4,21 @@ from textual.containers import Container
 from textual.widgets import Input, Label, Static, Switch
 
 from Buckets.components.autocomplete import AutoComplete, Dropdown, DropdownItem
-from Buckets.forms.form import Form, FormField
+from Buckets.forms.form import Form, FormField, Option
 from Buckets.managers.categories import get_category_by_id
-from Buckets.utils.format import parse_formula_expression
+from Buckets.config import CONFIG
+from Buckets.utils.formula import (
+    FormulaError,
+    evaluate_formula,
+    is_formula,
+    round_amount,
+)
 
 _RESTRICT_TYPES = {
     "any": None,
     "integer": r"^-?\d+$",
-    "number": r"^-?\d*\.?\d*(?:[+\-*\/]-?\d*\.?\d+)*[+\-*\/\.]?$",
+    # Formulas are checked by the evaluator; only restrict the alphabet here
+    "number": r"^[\d\s.+\-*\/()]*$",
 }
 
 
@@ -26,6 +33,16 @@ class Fields(Static):
         for field in self.form.fields:
             yield Field(field)
 
+    def reset(self, form: Form) -> None:
+        """Show `form` reusing the composed fields; recompose if the layout differs."""
+        self.form = form
+        widgets = list(self.query_children(Field))
+        if [w.field.key for w in widgets] != [f.key for f in form.fields]:
+            self.refresh(recompose=True)
+            return
+        for widget, field in zip(widgets, form.fields):
+            widget.reset(field)
+
 
 class Field(Static):
     """Individual form field that can be text, number, boolean, or autocomplete"""
@@ -46,14 +63,21 @@ class Field(Static):
             classes="autocomplete-postfix-display-label",
             id="autocomplete-postfix-display-label",
         )
+        self.formula_preview = Label("", classes="formula-preview")
+        self.dropdown: Dropdown | None = None
         self.id = f"field-{field.key}-controller"
 
-        # Configure input based on field type
+        if self.field.type in ("integer", "number"):
+            self.input.restrict = _RESTRICT_TYPES.get(self.field.type, None)
+        self._apply_defaults()
+
+    def _apply_defaults(self) -> None:
+        """Configure input based on field type"""
+        field = self.field
         match self.field.type:
             case "hidden":
                 pass
             case "integer" | "number":
-                self.input.restrict = _RESTRICT_TYPES.get(self.field.type, None)
                 self.input.value = field.default_value or ""
 
             case "autocomplete":
@@ -68,8 +92,51 @@ class Field(Static):
             case type_ if type_ != "boolean":
                 self.input.value = field.default_value or ""
 
-    def handle_select_index(self, index: int) -> None:
+    def reset(self, field: FormField) -> None:
+        """Load a new field definition (same key and type) into the mounted widgets."""
+        options_changed = field.options is not self.field.options
+        self.field = field
+        self.autocomplete_postfix_display_label.update("")
+        self.formula_preview.update("")
+
+        match field.type:
+            case "hidden":
+                self.input.value = self.input.heldValue = field.default_value
+            case "boolean":
+                self.query_one(f"#field-{field.key}", Switch).value = (
+                    field.default_value or False
+                )
+            case "autocomplete":
+                if self.dropdown is not None:
+                    if options_changed:
+                        self.dropdown.items = [
+                            self._dropdown_item(item) for item in field.options.items
+                        ]
+                    self.dropdown.suggest = self._suggest if field.suggest else None
+                self._apply_defaults()
+            case _:
+                self._apply_defaults()
+
+    @staticmethod
+    def _dropdown_item(option: Option) -> DropdownItem:
+        return DropdownItem(
+            option.text or option.value,
+            option.prefix or "",
+            option.postfix or "",
+            weight=option.weight,
+            payload=option.payload,
+        )
+
+    def _suggest(self, value: str) -> list[DropdownItem]:
+        return [self._dropdown_item(option) for option in self.field.suggest(value)]
+
+    def handle_select_index(self, index: int | None) -> None:
         """Handler for (externally) selecting an autocomplete option"""
+        if index is None:
+            # Suggested item outside `options`; there is no held option value
+            self.input.heldValue = None
+            self.autocomplete_postfix_display_label.update("")
+            return
         if index == -1:
             return
         selected_item = self.field.options.items[index]
@@ -86,6 +153,21 @@ class Field(Static):
 
         self.autocomplete_postfix_display_label.update("")
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        """Live preview of the computed amount for number fields"""
+        if self.field.type == "number" and event.input is self.input:
+            self._update_formula_preview(event.value)
+
+    def _update_formula_preview(self, value: str) -> None:
+        preview = ""
+        if is_formula(value):
+            try:
+                result = evaluate_formula(value)
+                preview = f"= {round_amount(result, CONFIG.defaults.round_decimals)}"
+            except FormulaError:
+                pass
+        self.formula_preview.update(preview)
+
     def on_auto_complete_selected(self, event: AutoComplete.Selected) -> None:
         """Handle autocomplete selection"""
         self.handle_select_index(event.index)
@@ -111,19 +193,16 @@ class Field(Static):
             if self.field.type == "autocomplete":
                 # Build dropdown items list
                 dropdown_items = [
-                    DropdownItem(
-                        item.text or item.value,
-                        item.prefix or "",
-                        item.postfix or "",
-                    )
-                    for item in self.field.options.items
+                    self._dropdown_item(item) for item in self.field.options.items
                 ]
-                dropdown = Dropdown(
+                dropdown = self.dropdown = Dropdown(
                     items=dropdown_items,
                     show_on_focus=True,
                     id=f"dropdown-{self.field.key}",
                     create_option=self.field.create_action,
                     show_when_empty=self.field.autocomplete_selector,
+                    match_strategy=self.field.match_strategy,
+                    suggest=self._suggest if self.field.suggest else None,
                 )
 
                 with Container(classes="autocomplete-container"):
@@ -145,5 +224,10 @@ class Field(Static):
                     )
                     yield Label(str(self.field.labels[1]), classes="right")
 
+            elif self.field.type == "number":
+                with Container(classes="formula-container"):
+                    yield self.input
+                    yield self.formula_preview
+
             else:
                 yield self.input
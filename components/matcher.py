@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+from typing import Sequence
+
+_MAX_GRAM = 3
+
+Span = tuple[int, int]
+Match = tuple[int, "tuple[Span, ...] | None"]
+
+
+def _spans(positions: Sequence[int]) -> tuple[Span, ...]:
+    """Collapse sorted character positions into (start, end) spans."""
+    spans: list[Span] = []
+    for pos in positions:
+        if spans and spans[-1][1] == pos:
+            spans[-1] = (spans[-1][0], pos + 1)
+        else:
+            spans.append((pos, pos + 1))
+    return tuple(spans)
+
+
+class SubstringMatcher:
+    """Case-insensitive substring index over a fixed list of candidate strings.
+
+    Built once per option set:
+    - folded (casefolded) copies of every candidate
+    - a sorted array of folded strings for prefix hits
+    - an n-gram index (n <= 3) mapping each gram to the candidates containing it
+
+    `match` returns (candidate index, highlight spans) with prefix hits first,
+    each group in the original order. When a query extends the previous one,
+    only the previous hits are re-checked.
+    """
+
+    def __init__(self, candidates: Sequence[str], weights: Sequence[float] = ()) -> None:
+        self._lengths = [len(candidate) for candidate in candidates]
+        self._folded = [candidate.casefold() for candidate in candidates]
+
+        self._order = sorted(range(len(self._folded)), key=self._folded.__getitem__)
+        self._sorted = [self._folded[i] for i in self._order]
+
+        grams: dict[str, list[int]] = {}
+        for index, text in enumerate(self._folded):
+            seen: set[str] = set()
+            for n in range(1, _MAX_GRAM + 1):
+                for start in range(len(text) - n + 1):
+                    gram = text[start : start + n]
+                    if gram not in seen:
+                        seen.add(gram)
+                        grams.setdefault(gram, []).append(index)
+        self._grams = grams
+
+        self._last_query: str | None = None
+        self._last_hits: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._folded)
+
+    def match(self, query: str, limit: int | None = None) -> list[Match]:
+        folded_query = query.casefold()
+        hits = self._hits(folded_query)
+        self._last_query, self._last_hits = folded_query, hits
+
+        if not folded_query:
+            return [(i, None) for i in hits[:limit]]
+
+        prefix = self._prefix_hits(folded_query)
+        ranked = [i for i in hits if i in prefix]
+        if limit is None or len(ranked) < limit:
+            ranked.extend(i for i in hits if i not in prefix)
+        return [(i, self._ranges(i, folded_query)) for i in ranked[:limit]]
+
+    def _ranges(self, index: int, query: str) -> tuple[Span, ...] | None:
+        text = self._folded[index]
+        if len(text) != self._lengths[index]:
+            # Casefolding changed the length; spans would not line up
+            return None
+        spans = []
+        start = text.find(query)
+        while start != -1:
+            spans.append((start, start + len(query)))
+            start = text.find(query, start + len(query))
+        return tuple(spans)
+
+    def _hits(self, query: str) -> list[int]:
+        """All candidates containing `query`, in original order."""
+        if not query:
+            return list(range(len(self._folded)))
+
+        last = self._last_query
+        if last is not None and query.startswith(last):
+            # Narrow the previous result set
+            pool = self._last_hits
+        elif len(query) <= _MAX_GRAM:
+            return list(self._grams.get(query, ()))
+        else:
+            # Start from the rarest trigram of the query
+            pool = min(
+                (
+                    self._grams.get(query[start : start + _MAX_GRAM], ())
+                    for start in range(len(query) - _MAX_GRAM + 1)
+                ),
+                key=len,
+            )
+
+        folded = self._folded
+        return [i for i in pool if query in folded[i]]
+
+    def _prefix_hits(self, query: str) -> set[int]:
+        lo = bisect_left(self._sorted, query)
+        hi = bisect_right(self._sorted, query + "\U0010ffff", lo)
+        return set(self._order[lo:hi])
+
+
+# Fuzzy scoring weights
+_SCORE_MATCH = 16
+_BONUS_BOUNDARY = 10
+_BONUS_FIRST_CHAR = 8
+_BONUS_CONSECUTIVE = 6
+_PENALTY_GAP_START = 3
+_PENALTY_GAP_EXTENSION = 1
+_WEIGHT_FACTOR = 4
+
+
+class FuzzyMatcher:
+    """Subsequence matcher with ranked results.
+
+    Per candidate, the folded text, its character set (for quick rejection)
+    and its word-boundary positions are computed once. Scoring rewards
+    boundary and consecutive hits, penalises gaps, and adds a log-scaled
+    frequency weight. Only the best `limit` candidates are kept, via a
+    bounded heap.
+    """
+
+    def __init__(self, candidates: Sequence[str], weights: Sequence[float] = ()) -> None:
+        self._lengths = [len(candidate) for candidate in candidates]
+        self._folded = [candidate.casefold() for candidate in candidates]
+        self._charsets = [frozenset(text) for text in self._folded]
+        self._boundaries = [self._boundary_positions(c) for c in candidates]
+        self._weights = [
+            math.log1p(max(weight, 0)) * _WEIGHT_FACTOR for weight in weights
+        ] + [0.0] * (len(candidates) - len(weights))
+
+        self._last_query: str | None = None
+        self._last_hits: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._folded)
+
+    @staticmethod
+    def _boundary_positions(text: str) -> frozenset[int]:
+        positions = set()
+        prev = ""
+        for index, char in enumerate(text):
+            if char.isalnum() and (
+                not prev
+                or not prev.isalnum()
+                or (prev.islower() and char.isupper())
+                or (prev.isalpha() != char.isalpha())
+            ):
+                positions.add(index)
+            prev = char
+        return frozenset(positions)
+
+    def match(self, query: str, limit: int | None = None) -> list[Match]:
+        folded_query = query.casefold()
+        if not folded_query:
+            self._last_query, self._last_hits = folded_query, list(range(len(self)))
+            return [(i, None) for i in self._last_hits[:limit]]
+
+        last = self._last_query
+        if last and folded_query.startswith(last):
+            pool = self._last_hits
+        else:
+            pool = range(len(self))
+
+        needed = set(folded_query)
+        charsets = self._charsets
+        hits: list[int] = []
+        heap: list[tuple[float, int, tuple[int, ...]]] = []
+        for index in pool:
+            if not needed <= charsets[index]:
+                continue
+            positions = self._positions(index, folded_query)
+            if positions is None:
+                continue
+            hits.append(index)
+            # Ties keep the original order (lower index wins)
+            entry = (self._score(index, positions), -index, positions)
+            if limit is None or len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        self._last_query, self._last_hits = folded_query, hits
+
+        ranked = sorted(heap, reverse=True)
+        return [
+            (
+                -neg_index,
+                _spans(positions)
+                if len(self._folded[-neg_index]) == self._lengths[-neg_index]
+                else None,
+            )
+            for _score, neg_index, positions in ranked
+        ]
+
+    def _positions(self, index: int, query: str) -> tuple[int, ...] | None:
+        """Tightest subsequence occurrence: scan forward to the first complete
+        match, then backward from its end to pull the start as far right as
+        possible."""
+        text = self._folded[index]
+        pos = -1
+        for char in query:
+            pos = text.find(char, pos + 1)
+            if pos == -1:
+                return None
+
+        positions = [0] * len(query)
+        for qi in range(len(query) - 1, -1, -1):
+            pos = text.rfind(query[qi], 0, pos + 1)
+            positions[qi] = pos
+            pos -= 1
+        return tuple(positions)
+
+    def _score(self, index: int, positions: tuple[int, ...]) -> float:
+        boundaries = self._boundaries[index]
+        score = self._weights[index]
+        prev = None
+        for pos in positions:
+            score += _SCORE_MATCH
+            if pos in boundaries:
+                score += _BONUS_FIRST_CHAR if prev is None else _BONUS_BOUNDARY
+            if prev is not None:
+                gap = pos - prev - 1
+                if gap == 0:
+                    score += _BONUS_CONSECUTIVE
+                else:
+                    score -= _PENALTY_GAP_START + _PENALTY_GAP_EXTENSION * (gap - 1)
+            prev = pos
+        # Matches starting late in the text rank slightly lower
+        score -= min(positions[0], 10) * _PENALTY_GAP_EXTENSION
+        return score
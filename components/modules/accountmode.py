@@ -13,8 +13,6 @@ from Buckets.managers.accounts import (
     get_all_accounts_with_balance,
     update_account,
 )
-from Buckets.modals.confirmation import ConfirmationModal
-from Buckets.modals.input import InputModal
 
 class AccountsList(ListView):
     def __init__(self, accounts, *args, **kwargs):
@@ -50,6 +48,8 @@ class AccountsList(ListView):
         )
 
 class AccountMode(ScrollableContainer):
+    DATA_DEPENDENCIES = ("accounts", "records")
+
     BINDINGS = [
         (CONFIG.hotkeys.new, "new", "New account"),
         (CONFIG.hotkeys.delete, "delete", "Archive account"),
@@ -151,6 +151,8 @@ class AccountMode(ScrollableContainer):
                 self.app.refresh(layout=True, recompose=True)  # the big button
 
         account_form = self.account_form.get_form()
+        from Buckets.modals.input import InputModal
+
         self.app.push_screen(
             InputModal("New Account", account_form), callback=check_result
         )
@@ -176,6 +178,8 @@ class AccountMode(ScrollableContainer):
 
         if id:
             filled_account_form = self.account_form.get_filled_form(id)
+            from Buckets.modals.input import InputModal
+
             self.app.push_screen(
                 InputModal("Edit Account", filled_account_form), callback=check_result
             )
@@ -203,6 +207,8 @@ class AccountMode(ScrollableContainer):
                 self.app.refresh(layout=True, recompose=True)  # the big button
 
         if id:
+            from Buckets.modals.confirmation import ConfirmationModal
+
             self.app.push_screen(
                 ConfirmationModal(
                     f"Are you sure you want to archive account '{name}'?"
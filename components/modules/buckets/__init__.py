@@ -17,6 +17,8 @@ from Buckets.managers.buckets import (
 class BucketsModule(Static):
     """Buckets CRUD + transfer list for the currently selected account (from page_parent.mode)."""
 
+    DATA_DEPENDENCIES = ("buckets", "accounts")
+
     BINDINGS = [
         Binding("a", "new", "Add"),
         Binding("e", "edit", "Edit"),
@@ -1,3 +1,4 @@
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.widgets import Static
@@ -13,12 +14,11 @@ from Buckets.managers.categories import (
     get_category_by_id,
     update_category,
 )
-from Buckets.modals.confirmation import ConfirmationModal
-from Buckets.modals.input import InputModal
 
 class Categories(Static):
     can_focus = True
     COLUMNS = ("", "Name", "Nature")
+    DATA_DEPENDENCIES = ("categories",)
 
     BINDINGS = [
         Binding(
@@ -64,7 +64,12 @@ class Categories(Static):
             for category, node, depth in categories:
                 char = "" if depth == 0 else " "
                 nature = category.nature.value
-                table.add_row(node, char + category.name, nature, key=category.id)
+                table.add_row(
+                    Text(node, style=category.color),
+                    char + category.name,
+                    nature,
+                    key=category.id,
+                )
             table.zebra_stripes = True
             empty.display = False
             table.display = True
@@ -101,6 +106,8 @@ class Categories(Static):
                     )
                     self.rebuild()
 
+        from Buckets.modals.input import InputModal
+
         self.app.push_screen(
             InputModal("New Category", CategoryForm().get_form()), callback=check_result
         )
@@ -130,6 +137,8 @@ class Categories(Static):
         parent_category_id = self.current_row
         subcategory_form = CategoryForm().get_subcategory_form(parent_category_id)
         parent_category = get_category_by_id(parent_category_id)
+        from Buckets.modals.input import InputModal
+
         self.app.push_screen(
             InputModal(f"New Subcategory of {parent_category.name}", subcategory_form),
             callback=check_result,
@@ -151,6 +160,8 @@ class Categories(Static):
                 self.rebuild()
 
         category = get_category_by_id(self.current_row)
+        from Buckets.modals.confirmation import ConfirmationModal
+
         self.app.push_screen(
             ConfirmationModal(
                 f"Are you sure you want to delete category '[{category.color}]●[/{category.color}] {category.name}'?"
@@ -181,6 +192,8 @@ class Categories(Static):
                     self.rebuild()
 
         filled_form = CategoryForm().get_filled_form(self.current_row)
+        from Buckets.modals.input import InputModal
+
         self.app.push_screen(
             InputModal("Edit Category", filled_form), callback=check_result
         )
@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -7,9 +8,21 @@ from textual.widgets import Label, Static
 
 from textual.widgets import Button
 from Buckets.forms.form import Form, FormField
-from Buckets.modals.input import InputModal
 from Buckets.config import CONFIG
 
+@lru_cache(maxsize=64)
+def _month_grid(
+    year: int, month: int, first_day_of_week: int
+) -> tuple[tuple[date, bool], ...]:
+    """The 42-day (6 week) grid shown for a month, as (date, is_current_month)."""
+    first_day = date(year, month, 1)
+    days_before = (first_day.weekday() - first_day_of_week) % 7
+    start_date = first_day - timedelta(days=days_before)
+    return tuple(
+        (day, day.month == month)
+        for day in (start_date + timedelta(days=i) for i in range(42))
+    )
+
 class DateMode(Static):
     can_focus = True
 
@@ -38,6 +51,10 @@ class DateMode(Static):
         )
         self.page_parent = parent
         self.first_day_of_week = CONFIG.defaults.first_day_of_week
+        self._rows = None
+        self._labels = []
+        self._applied_cells = [None] * 42
+        self._applied_rows = [None] * 6
 
     def on_mount(self) -> None:
         self.rebuild()
@@ -48,23 +65,37 @@ class DateMode(Static):
     # cell classes:
     # today, not_current_month, target, target_week, target_month
 
-    def _get_month_days(self, date: datetime) -> list[tuple[datetime, bool]]:
-        """Returns list of (date, is_current_month) tuples for calendar"""
-        # Get first day of month
-        first_day = date.replace(day=1)
-
-        # Calculate days before month starts to fill calendar
-        days_before = (first_day.weekday() - self.first_day_of_week) % 7
-        start_date = first_day - timedelta(days=days_before)
-
-        # Generate 42 days (6 weeks)
-        days = []
-        for i in range(42):
-            curr_date = start_date + timedelta(days=i)
-            is_current = curr_date.month == date.month
-            days.append((curr_date, is_current))
-
-        return days
+    def _get_month_days(self, date: datetime) -> tuple[tuple[date, bool], ...]:
+        """Returns (date, is_current_month) tuples for the calendar"""
+        return _month_grid(date.year, date.month, self.first_day_of_week)
+
+    def _cell_states(
+        self, calendar_days, offset_type: str, today: date, target: date
+    ) -> tuple[list[tuple[str, frozenset[str]]], list[bool]]:
+        """Compute each cell's (text, classes) and each row's target_week flag as data."""
+        week_start = week_end = None
+        if offset_type == "week":
+            week_start = target - timedelta(
+                days=(target.weekday() - self.first_day_of_week) % 7
+            )
+            week_end = week_start + timedelta(days=6)
+
+        cells: list[tuple[str, frozenset[str]]] = []
+        rows = [False] * (len(calendar_days) // 7)
+        for day_idx, (day, is_current) in enumerate(calendar_days):
+            classes = set()
+            if not is_current:
+                classes.add("not_current_month")
+            if day == today:
+                classes.add("today")
+            if day == target:
+                classes.add("target")
+            if offset_type == "month" and is_current:
+                classes.add("target_month")
+            if week_start is not None and week_start <= day <= week_end:
+                rows[day_idx // 7] = True
+            cells.append((str(day.day), frozenset(classes)))
+        return cells, rows
 
     def rebuild(self) -> None:
         """Builds the calendar.
@@ -82,60 +113,42 @@ class DateMode(Static):
         - Week: The cell row's container of the current week: class "target_week"
         - Month: Every day of the specified filter month: "target_month"
         - Year: No rules.
+
+        Only labels and rows whose text or class set changed since the last
+        rebuild are touched.
         """
-        self.page_parent.filter["offset"]
         filter_offset_type = self.page_parent.filter["offset_type"]
 
-        today = datetime.now()
+        today = datetime.now().date()
         target_date = self.page_parent.get_target_date()
 
-        # Get calendar days
         calendar_days = self._get_month_days(target_date)
+        cells, rows = self._cell_states(
+            calendar_days, filter_offset_type, today, target_date.date()
+        )
 
-        # Update calendar labels
-        calendar_rows = self.query(".calendar-row")
-
-        for row_idx, row in enumerate(calendar_rows):
-            row.remove_class("target_week")
-            for col_idx, label in enumerate(row.query("Label")):
-                day_idx = row_idx * 7 + col_idx
-                if day_idx >= len(calendar_days):
-                    continue
-
-                date, is_current = calendar_days[day_idx]
-
-                # Set day number
-                label.update(str(date.day))
-
-                # Reset classes
-                label.set_classes("")
-
-                # Add not current month class
-                if not is_current:
-                    label.add_class("not_current_month")
-
-                # Add today class
-                if date.date() == today.date():
-                    label.add_class("today")
-
-                # Add target class
-                if date.date() == target_date.date():
-                    label.add_class("target")
-
-                # Add type-specific classes
-                match filter_offset_type:
-                    case "week":
-                        # Calculate week start based on first_day_of_week
-                        days_to_first = (
-                            target_date.weekday() - self.first_day_of_week
-                        ) % 7
-                        week_start = target_date - timedelta(days=days_to_first)
-                        week_end = week_start + timedelta(days=6)
-                        if week_start.date() <= date.date() <= week_end.date():
-                            row.add_class("target_week")
-                    case "month":
-                        if is_current:
-                            label.add_class("target_month")
+        if self._rows is None:
+            self._rows = list(self.query(".calendar-row"))
+            self._labels = [
+                label for row in self._rows for label in row.query("Label")
+            ]
+
+        for label, state, applied in zip(self._labels, cells, self._applied_cells):
+            if state == applied:
+                continue
+            text, classes = state
+            if applied is None or applied[0] != text:
+                label.update(text)
+            if applied is None or applied[1] != classes:
+                label.set_classes(classes)
+        self._applied_cells = cells
+
+        for row, is_target_week, applied in zip(
+            self._rows, rows, self._applied_rows
+        ):
+            if is_target_week != applied:
+                row.set_class(is_target_week, "target_week")
+        self._applied_rows = rows
 
         self.page_parent.update_filter_label(self.query_one(".current-filter-label"))
 
@@ -154,6 +167,8 @@ class DateMode(Static):
             if result:
                 self.page_parent.set_target_date(result["date"])
 
+        from Buckets.modals.input import InputModal
+
         self.app.push_screen(
             InputModal("Go to Day", form=self.FORM), callback=check_result
         )
@@ -8,6 +8,7 @@ from Buckets.managers.utils import get_period_average, get_period_figures
 
 class Insights(Static):
     can_focus = True
+    DATA_DEPENDENCIES = ("records", "categories")
 
     def __init__(self, parent: Static, *args, **kwargs) -> None:
         super().__init__(
@@ -37,7 +38,10 @@ class Insights(Static):
         label = "Income" if is_income else "Expense"
 
         # Header text (single update)
-        current_filter_label.update(f"{label} of {self.page_parent.get_filter_label()}")
+        header = f"{label} of {self.page_parent.get_filter_label()}"
+        if self.page_parent.filter.get("query"):
+            header += " (filtered)"
+        current_filter_label.update(header)
         average_label.update(f"{label} per day")
 
         # Fetch figures (global only)
@@ -45,6 +49,7 @@ class Insights(Static):
             "offset": self.page_parent.filter["offset"],
             "offset_type": self.page_parent.filter["offset_type"],
             "isIncome": is_income,
+            "record_filter": self.page_parent.filter.get("query"),
         }
         period_net = get_period_figures(**params)
         period_average = get_period_average(
@@ -63,6 +68,7 @@ class Insights(Static):
             "offset": self.page_parent.filter["offset"],
             "offset_type": self.page_parent.filter["offset_type"],
             "is_income": self.page_parent.mode["isIncome"],
+            "record_filter": self.page_parent.filter.get("query"),
         }
         # use_account is always False; keep branch for future toggle if needed
         if self.use_account:
@@ -2,19 +2,23 @@ from __future__ import annotations
 
 from typing import ClassVar
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
 from textual.events import DescendantBlur, DescendantFocus
-from textual.widgets import DataTable, Static
+from textual.timer import Timer
+from textual.widgets import DataTable, Input, Static
 
 from Buckets.components.indicators import EmptyIndicator
 from Buckets.components.modules.records._cud import RecordCUD
 from Buckets.components.modules.records._table_builder import RecordTableBuilder
 from Buckets.config import CONFIG
+from Buckets.managers.filters import FilterError, compile_filter
+from Buckets.managers.search import PAGE_SIZE, highlight_spans
 
 class Records(RecordCUD, RecordTableBuilder, Static):
-    """Records table (date view only) with add/edit/delete/transfer; no filters."""
+    """Records table (date view, or all-time search) with add/edit/delete/transfer."""
 
     DEFAULT_CSS = """\
 Records .label-highlight-match {
@@ -32,9 +36,13 @@ Records .label-highlight-match {
         (CONFIG.hotkeys.delete, "delete", "Delete"),
         (CONFIG.hotkeys.edit, "edit", "Edit"),
         (CONFIG.hotkeys.home.new_transfer, "new_transfer", "Transfer"),
+        (CONFIG.hotkeys.home.search, "search", "Search"),
+        (CONFIG.hotkeys.home.advance_filter, "filter", "Filter"),
+        Binding("escape", "close_bar", "Close", show=False),
     ]
 
     can_focus = True
+    DATA_DEPENDENCIES = ("records", "accounts", "categories")
 
     def __init__(self, parent: Static, *args, **kwargs) -> None:
         super().__init__(
@@ -42,21 +50,137 @@ Records .label-highlight-match {
         )
         super().__setattr__("border_title", "Records")
         self.page_parent = parent
+        self._search_timer: Timer | None = None
 
         self.FILTERS = {
-            "enabled": lambda: False,
-            "label": lambda: "",
-            "amount": lambda: "",
-            "category": lambda: "",
+            "enabled": lambda: bool(self.page_parent.filter.get("query")),
+            "query": lambda: self.page_parent.filter.get("query") or "",
         }
 
     def on_mount(self) -> None:
+        self._update_filter_subtitle()
         self.rebuild()
 
+    def check_action(self, action: str, parameters) -> bool | None:
+        if action == "close_bar":
+            return (
+                self.search_query is not None
+                or self.query_one("#filter-container").display
+            )
+        return True
+
+    def action_close_bar(self) -> None:
+        if self.search_query is not None:
+            self.action_close_search()
+        else:
+            self._close_filter_bar()
+
+    def _show_bar(self, input_id: str) -> Input:
+        for widget in self.query("#filter-container Input").results(Input):
+            widget.display = widget.id == input_id
+        self.query_one("#filter-container").display = True
+        widget = self.query_one(f"#{input_id}", Input)
+        widget.focus()
+        return widget
+
+    # ---------- Filter ---------- #
+
+    def action_filter(self) -> None:
+        if self.search_query is not None:
+            self.action_close_search()
+        self._show_bar("filter-input").value = self.FILTERS["query"]()
+
+    def _apply_filter(self, text: str) -> None:
+        query = text.strip() or None
+        try:
+            compile_filter(query)
+        except FilterError as e:
+            self.notify(str(e), title="Invalid filter", severity="error")
+            return
+        self.page_parent.filter["query"] = query
+        self._close_filter_bar()
+        self._update_filter_subtitle()
+        self.current_row_index = 0
+        self.page_parent.rebuild()
+
+    def _close_filter_bar(self) -> None:
+        self.query_one("#filter-container").display = False
+        if self.table.display:
+            self.table.focus()
+        else:
+            self.focus()
+
+    def _update_filter_subtitle(self) -> None:
+        query = self.FILTERS["query"]()
+        self.border_subtitle = f"filter: {query}" if query else ""
+
+    # ---------- Search ---------- #
+
+    def action_search(self) -> None:
+        self._show_bar("search-input")
+        if self.search_query is None:
+            self.search_query = ""
+
+    def action_close_search(self) -> None:
+        self.search_query = None
+        self.search_terms = []
+        self.search_limit = PAGE_SIZE
+        self.query_one("#search-input", Input).value = ""
+        self.query_one("#filter-container").display = False
+        self.current_row_index = 0
+        self.rebuild()
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id != "search-input" or self.search_query is None:
+            return
+        event.stop()
+        # Debounce: search once typing pauses
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(0.15, self._run_search)
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        if event.input.id == "filter-input":
+            event.stop()
+            self._apply_filter(event.value)
+            return
+        if event.input.id != "search-input":
+            return
+        event.stop()
+        self._run_search()
+        if self.table.display:
+            self.table.focus()
+
+    def _run_search(self) -> None:
+        if self.search_query is None:
+            return
+        self.search_query = self.query_one("#search-input", Input).value.strip()
+        self.search_limit = PAGE_SIZE
+        self.current_row_index = 0
+        self.rebuild(focus=False)
+
+    def _get_label_string(self, text: str) -> Text | str:
+        if not self.search_query or not self.search_terms:
+            return text
+        spans = highlight_spans(text, self.search_terms)
+        if not spans:
+            return text
+        label = Text(text)
+        style = self.get_component_rich_style("label-highlight-match")
+        for start, end in spans:
+            label.stylize(style, start, end)
+        return label
+
     # ---------- Callbacks ---------- #
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         current_row_index = event.cursor_row
+        if event.row_key and event.row_key.value == "more":
+            # Next page of search results; the cursor stays on this position
+            self.current_row_index = current_row_index
+            self.search_limit += PAGE_SIZE
+            self.call_after_refresh(self.rebuild)
+            return
         if event.row_key and event.row_key.value:
             self.current_row = event.row_key.value
             self.current_row_index = current_row_index
@@ -75,7 +199,13 @@ Records .label-highlight-match {
 
     def compose(self) -> ComposeResult:
         with Container(classes="selectors"):
-            pass
+            with Container(id="filter-container") as filters:
+                filters.display = False
+                yield Input(placeholder="Search all records…", id="search-input")
+                yield Input(
+                    placeholder="Filter: amount>50 cat:Food acct:Visa label:~coffee",
+                    id="filter-input",
+                )
 
         self.table = DataTable(
             id="records-table",
@@ -85,4 +215,3 @@ Records .label-highlight-match {
         )
         yield self.table
         yield EmptyIndicator("No entries")
-        # No selectors / filters UI
@@ -11,9 +11,6 @@ from Buckets.managers.records import (
     get_record_by_id,
     update_record,
 )
-from Buckets.modals.confirmation import ConfirmationModal
-from Buckets.modals.record import RecordModal
-from Buckets.modals.transfer import TransferModal
 
 class RecordCUD:
     """Create / Update / Delete actions for Records (no people, no splits)."""
@@ -46,14 +43,14 @@ class RecordCUD:
                 # Rebuild list (if a template was created, parent may rebuild template pane)
                 self.page_parent.rebuild(templates=bool(result.get("createTemplate")))
 
-        self.app.push_screen(
-            RecordModal(
-                "New Record",
-                form=RecordForm().get_form(default_values=self.page_parent.mode),
-                date=self.page_parent.mode["date"],
-            ),
-            callback=check_result,
+        from Buckets.modals.record import RecordModal
+
+        modal = RecordModal.reusable(self.app)
+        modal.reset(
+            RecordForm().get_form(default_values=self.page_parent.mode),
+            date=self.page_parent.mode["date"],
         )
+        self.app.push_screen(modal, callback=check_result)
 
     # ---------- Update ---------- #
     def action_edit(self) -> None:
@@ -115,12 +112,16 @@ class RecordCUD:
 
         if record.isTransfer:
             # Edit transfer via dedicated modal
+            from Buckets.modals.transfer import TransferModal
+
             self.app.push_screen(
                 TransferModal(title="Edit transfer", record=record),
                 callback=check_result_records,
             )
         else:
             filled_form = RecordForm().get_filled_form(record.id)
+            from Buckets.modals.record import RecordModal
+
             self.app.push_screen(
                 RecordModal(
                     "Edit Record",
@@ -161,6 +162,8 @@ class RecordCUD:
             )
             self.page_parent.rebuild()
 
+        from Buckets.modals.confirmation import ConfirmationModal
+
         self.app.push_screen(
             ConfirmationModal("Are you sure you want to delete this record?"),
             callback=check_delete,
@@ -186,10 +189,8 @@ class RecordCUD:
                 )
                 self.page_parent.rebuild()
 
-        self.app.push_screen(
-            TransferModal(
-                title="New transfer",
-                defaultDate=self.page_parent.mode["date"].strftime("%d"),
-            ),
-            callback=check_result,
-        )
+        from Buckets.modals.transfer import TransferModal
+
+        modal = TransferModal.reusable(self.app)
+        modal.reset(defaultDate=self.page_parent.mode["date"].strftime("%d"))
+        self.app.push_screen(modal, callback=check_result)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from rich.text import Text
 
@@ -8,6 +8,9 @@ from textual.widgets import DataTable
 from Buckets.components.indicators import EmptyIndicator
 from Buckets.config import CONFIG
 from Buckets.managers.records import get_records
+from Buckets.managers.search import PAGE_SIZE, search_records
+from Buckets.managers.utils import get_start_end_of_period
+from Buckets.managers.versions import get_version
 from Buckets.utils.format import format_date_to_readable
 
 class RecordTableBuilder:
@@ -17,6 +20,18 @@ class RecordTableBuilder:
     - No people
     """
 
+    # Rendered cells survive rebuilds; keys carry the record's updatedAt so an
+    # edited record misses naturally, while account/category edits (names,
+    # colors, hidden flag) evict everything.
+    _ROW_CACHE_LIMIT = 5000
+    _row_cache: dict[tuple[int, datetime, str], tuple[Text, Text, Text]] = {}
+    _row_cache_versions: tuple[int, int] = (-1, -1)
+
+    # Search mode: None when off; results span all time instead of the period
+    search_query: str | None = None
+    search_terms: list[str] = []
+    search_limit: int = PAGE_SIZE
+
     def rebuild(self, focus: bool = True) -> None:
         if not hasattr(self, "table"):
             return
@@ -24,10 +39,14 @@ class RecordTableBuilder:
         table: DataTable = self.table
         empty_indicator: EmptyIndicator = self.query_one(".empty-indicator")
 
-        self._initialize_table(table)
-        records = self._fetch_records()
+        if self.search_query:
+            self._initialize_table(table, first_column="Date")
+            self._build_search_view(table)
+        else:
+            self._initialize_table(table)
+            records = self._fetch_records()
 
-        self._build_date_view(table, records)
+            self._build_date_view(table, records)
 
         # Restore cursor
         if hasattr(self, "current_row_index"):
@@ -49,32 +68,56 @@ class RecordTableBuilder:
         return get_records(
             offset=self.page_parent.filter["offset"],
             offset_type=self.page_parent.filter["offset_type"],
+            record_filter=self.page_parent.filter.get("query"),
         )
 
-    def _initialize_table(self, table: DataTable) -> None:
+    def _initialize_table(self, table: DataTable, first_column: str = " ") -> None:
         table.clear()
         table.columns.clear()
-        table.add_columns(" ", "Category / Transfer", "Amount", "Label", "Account")
+        table.add_columns(
+            first_column, "Category / Transfer", "Amount", "Label", "Account"
+        )
 
     def _get_label_string(self, text: str) -> Text | str:
         return text
 
+    def _row_cells(self, record, offset_type: str) -> tuple[Text, Text, Text]:
+        """Cached (category_or_transfer, amount, account) cells for a record."""
+        cache_versions = (get_version("accounts"), get_version("categories"))
+        cls = RecordTableBuilder
+        if (
+            cls._row_cache_versions != cache_versions
+            or len(cls._row_cache) > self._ROW_CACHE_LIMIT
+        ):
+            cls._row_cache = {}
+            cls._row_cache_versions = cache_versions
+
+        key = (record.id, record.updatedAt, offset_type)
+        cells = cls._row_cache.get(key)
+        if cells is None:
+            cells = self._format_record_fields(record, self._flow_icon(record.isIncome))
+            cls._row_cache[key] = cells
+        return cells
+
     # ---------------- Date view ---------------- #
 
     def _build_date_view(self, table: DataTable, records: list) -> None:
         prev_group = None
+        offset_type = self.page_parent.filter["offset_type"]
+        group_labels = self._period_group_labels()
 
         for record in records:
-            flow_icon = self._flow_icon(record.isIncome)
-            category_string, amount_string, account_string = self._format_record_fields(
-                record, flow_icon
+            category_string, amount_string, account_string = self._row_cells(
+                record, offset_type
             )
 
             # Highlight label if filtering
             label_string = self._get_label_string(record.label)
 
             # Add group header based on current offset_type
-            group_string = self._group_label_for_record(record)
+            group_string = group_labels.get(self._group_key(record.date, offset_type))
+            if group_string is None:
+                group_string = self._group_label_for_record(record)
             if group_string and prev_group != group_string:
                 prev_group = group_string
                 self._add_group_header_row(table, group_string)
@@ -89,30 +132,54 @@ class RecordTableBuilder:
                 key=f"r-{record.id}",
             )
 
-    def _flow_icon(self, is_income: bool) -> str:
-        pos = f"[green]{CONFIG.symbols.amount_positive}[/green]"
-        neg = f"[red]{CONFIG.symbols.amount_negative}[/red]"
-        return pos if is_income else neg
+    # ---------------- Search view ---------------- #
+
+    def _build_search_view(self, table: DataTable) -> None:
+        """Ranked matches across all time, one page at a time; highlighting the
+        trailing "more" row loads the next page."""
+        page = search_records(self.search_query, limit=self.search_limit)
+        self.search_terms = page.terms
 
-    def _format_record_fields(self, record, flow_icon: str) -> tuple[str, str, str]:
+        for record in page.records:
+            category_string, amount_string, account_string = self._row_cells(
+                record, "search"
+            )
+            table.add_row(
+                Text(f"{record.date:%Y-%m-%d}", style="dim"),
+                category_string,
+                amount_string,
+                self._get_label_string(record.label),
+                account_string,
+                key=f"r-{record.id}",
+            )
+        if page.has_more:
+            table.add_row(
+                "", Text("More results…", style="dim italic"), "", "", "", key="more"
+            )
+
+    def _flow_icon(self, is_income: bool) -> Text:
+        if is_income:
+            return Text(CONFIG.symbols.amount_positive, style="green")
+        return Text(CONFIG.symbols.amount_negative, style="red")
+
+    def _format_record_fields(self, record, flow_icon: Text) -> tuple[Text, Text, Text]:
         """Returns (category_or_transfer, amount_str, account_str)."""
         if record.isTransfer:
-            from_account = (
-                f"[italic]{record.account.name}[/italic]"
-                if record.account.hidden
-                else record.account.name
+            from_account = Text(
+                record.account.name, style="italic" if record.account.hidden else ""
             )
             to_account = (
-                f"[italic]{record.transferToAccount.name}[/italic]"
-                if record.transferToAccount and record.transferToAccount.hidden
-                else (
-                    record.transferToAccount.name if record.transferToAccount else "-"
+                Text(
+                    record.transferToAccount.name,
+                    style="italic" if record.transferToAccount.hidden else "",
                 )
+                if record.transferToAccount
+                else Text("-")
             )
-            category_string = f"{from_account} → {to_account}"
+            category_string = Text.assemble(from_account, " → ", to_account)
             # For transfers, show raw amount without +/- since direction is implied
-            amount_string = f"{record.amount}"
-            account_string = "-"
+            amount_string = Text(f"{record.amount}")
+            account_string = Text("-")
         else:
             color_tag = (
                 record.category.color.lower()
@@ -120,14 +187,55 @@ class RecordTableBuilder:
                 else "white"
             )
             cat_name = record.category.name if record.category else "-"
-            category_string = (
-                f"[{color_tag}]{CONFIG.symbols.category_color}[/{color_tag}] {cat_name}"
+            category_string = Text.assemble(
+                (CONFIG.symbols.category_color, color_tag), f" {cat_name}"
             )
-            amount_string = f"{flow_icon} {record.amount}"
-            account_string = record.account.name if record.account else "-"
+            amount_string = Text.assemble(flow_icon, f" {record.amount}")
+            account_string = Text(record.account.name if record.account else "-")
 
         return category_string, amount_string, account_string
 
+    # ---------------- Grouping ---------------- #
+
+    @staticmethod
+    def _group_key(day: datetime, offset_type: str):
+        if offset_type == "year":
+            return (day.year, day.month)
+        return day.date()
+
+    def _period_group_labels(self) -> dict:
+        """Group header for every day (or month) of the current period, computed once."""
+        offset_type = self.page_parent.filter["offset_type"]
+        start, end = get_start_end_of_period(
+            self.page_parent.filter["offset"], offset_type
+        )
+        labels: dict = {}
+        match offset_type:
+            case "year":
+                for month in range(1, 13):
+                    labels[(start.year, month)] = datetime(
+                        start.year, month, 1
+                    ).strftime("%B %Y")
+            case "month":
+                # Weeks bounded to the month
+                first_dow = CONFIG.defaults.first_day_of_week
+                month_start, month_end = start.date(), end.date()
+                cur = month_start
+                while cur <= month_end:
+                    week_start = cur - timedelta(days=(cur.weekday() - first_dow) % 7)
+                    week_end = min(week_start + timedelta(days=6), month_end)
+                    week_start = max(week_start, month_start)
+                    label = f"{format_date_to_readable(week_start)} - {format_date_to_readable(week_end)}"
+                    while cur <= week_end:
+                        labels[cur] = label
+                        cur += timedelta(days=1)
+            case "week":
+                cur = start.date()
+                while cur <= end.date():
+                    labels[cur] = format_date_to_readable(cur)
+                    cur += timedelta(days=1)
+        return labels
+
     def _group_label_for_record(self, record) -> str | None:
         """Generates group header text based on current filter offset_type."""
         match self.page_parent.filter["offset_type"]:
@@ -161,7 +269,5 @@ class RecordTableBuilder:
     def _add_group_header_row(
         self, table: DataTable, string: str, key: str | None = None
     ) -> None:
-        # Use dim/italic markup to visually separate group headers with the built-in DataTable
-        table.add_row(
-            "//", f"[dim][italic]{string}[/italic][/dim]", "", "", "", key=key
-        )
+        # Use dim/italic style to visually separate group headers with the built-in DataTable
+        table.add_row("//", Text(string, style="dim italic"), "", "", "", key=key)
@@ -1,12 +1,11 @@
+import asyncio
+
 from textual import events
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Label, Static
 
-from Buckets.modals.confirmation import ConfirmationModal
-from Buckets.modals.input import InputModal
 from Buckets.config import CONFIG
-from Buckets.modals.transfer import TransferModal
 from Buckets.models.record_template import RecordTemplate
 from Buckets.managers.record_templates import (
     create_template,
@@ -17,11 +16,13 @@ from Buckets.managers.record_templates import (
     swap_template_order,
     update_template,
 )
+from Buckets.managers import writer
 from Buckets.managers.records import create_record
 from Buckets.forms.recordtemplate_forms import RecordTemplateForm
 
 class Templates(Static):
     can_focus = True
+    DATA_DEPENDENCIES = ("templates", "accounts", "categories")
 
     BINDINGS = [
         Binding(CONFIG.hotkeys.new, "new_template", "New"),
@@ -59,9 +60,10 @@ class Templates(Static):
         for index, template in enumerate(self.templates):
             if index > 8:
                 break
+            label = f"{template.label} ↻" if template.recurrence else template.label
             if template.isTransfer:
                 widget = Container(
-                    Label(f"{template.label}", classes="label"),
+                    Label(label, classes="label"),
                     id=f"template-{template.id}",
                     classes="template-item",
                 )
@@ -72,7 +74,7 @@ class Templates(Static):
                         f"[{color}]{CONFIG.symbols.category_color}[/{color}]",
                         classes="dot",
                     ),
-                    Label(f"{template.label}", classes="label"),
+                    Label(label, classes="label"),
                     id=f"template-{template.id}",
                     classes="template-item",
                 )
@@ -128,14 +130,38 @@ class Templates(Static):
         template = self.templates[index - 1]
         record_data = template.to_dict()
         record_data["date"] = self.page_parent.mode["date"]
+        if writer.running():
+            # Committed with any other queued writes; the app refreshes the
+            # page once the batch is in
+            future = writer.submit(
+                create_record, record_data, tables=("records", "balances")
+            )
+            self.run_worker(self._await_write(future, template.label))
+            return
         create_record(record_data)
+        self._notify_created(template.label)
+        self.page_parent.rebuild()
+
+    async def _await_write(self, future, label: str) -> None:
+        try:
+            await asyncio.wrap_future(future)
+        except Exception as e:
+            self.app.notify(
+                title="Error",
+                message=f"Could not create the record: {e}",
+                severity="error",
+                timeout=5,
+            )
+            return
+        self._notify_created(label)
+
+    def _notify_created(self, label: str) -> None:
         self.app.notify(
             title="Success",
-            message=f"Created new record with {template.label}",
+            message=f"Created new record with {label}",
             severity="information",
             timeout=3,
         )
-        self.page_parent.rebuild()
 
     # region CRUD
     # ----------------- - ---------------- #
@@ -152,6 +178,8 @@ class Templates(Static):
                 )
                 self.rebuild()
 
+        from Buckets.modals.input import InputModal
+
         self.app.push_screen(
             InputModal("New Template", form=self.template_form.get_form()),
             callback=check_result,
@@ -169,6 +197,8 @@ class Templates(Static):
                 )
                 self.rebuild()
 
+        from Buckets.modals.transfer import TransferModal
+
         self.app.push_screen(
             TransferModal(title="New Transfer Template", isTemplate=True),
             callback=check_result,
@@ -200,6 +230,8 @@ class Templates(Static):
         # ----------------- - ---------------- #
         template = get_template_by_id(self.selected_template_id)
         if template.isTransfer:
+            from Buckets.modals.transfer import TransferModal
+
             self.app.push_screen(
                 TransferModal(
                     title="Edit Transfer Template",
@@ -209,6 +241,8 @@ class Templates(Static):
                 callback=check_result,
             )
         else:
+            from Buckets.modals.input import InputModal
+
             self.app.push_screen(
                 InputModal(
                     "Edit Template",
@@ -238,6 +272,8 @@ class Templates(Static):
         template = get_template_by_id(self.selected_template_id)
 
         # ----------------- - ---------------- #
+        from Buckets.modals.confirmation import ConfirmationModal
+
         self.app.push_screen(
             ConfirmationModal(
                 f"Are you sure you want to delete template '{template.label}'?"
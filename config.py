@@ -1,9 +1,15 @@
 # Buckets/config.py
 from __future__ import annotations
 
+import atexit
+import copy
+import hashlib
+import json
 import os
 import platform
 import subprocess
+import tempfile
+import threading
 import warnings
 from pathlib import Path
 from typing import Any, Literal
@@ -11,11 +17,36 @@ from typing import Any, Literal
 import yaml
 from pydantic import BaseModel, Field, ValidationError
 
+# libyaml bindings when PyYAML was built with them
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 def config_file() -> Path:
     """Return the path to the local config.yaml file."""
     project_root = Path(__file__).resolve().parent.parent  # points to Buckets/
     return project_root / "config.yaml"
 
+def _read_yaml(path: Path) -> dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_Loader)
+    return data if isinstance(data, dict) else {}
+
+def _write_yaml(path: Path, data: dict[str, Any]) -> None:
+    """Replace `path` atomically, so a crash never leaves half a file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".config-", suffix=".yaml")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def _digest(data: dict[str, Any]) -> str:
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
 # ---------- Defaults & basic config blocks ----------
 
 class Defaults(BaseModel):
@@ -40,6 +71,8 @@ class HomeHotkeys(BaseModel):
     select_prev_account: str = "["
     select_next_account: str = "]"
     toggle_use_account: str = "\\"
+    import_csv: str = "i"
+    search: str = "s"
     datemode: DatemodeHotkeys = DatemodeHotkeys()
 
 class RecordModalHotkeys(BaseModel):
@@ -54,6 +87,8 @@ class Hotkeys(BaseModel):
     delete: str = "d"
     edit: str = "e"
     toggle_jump_mode: str = "v"
+    toggle_instrumentation: str = "f12"
+    toggle_profiling: str = "f11"
 
     home: HomeHotkeys = HomeHotkeys()
     record_modal: RecordModalHotkeys = RecordModalHotkeys()
@@ -66,6 +101,53 @@ class Symbols(BaseModel):
     amount_positive: str = "+"
     amount_negative: str = "-"
 
+class CsvImport(BaseModel):
+    """Column mapping and parsing rules for bank-statement CSV files."""
+
+    date_column: str = "Date"
+    amount_column: str = "Amount"
+    label_column: str = "Description"
+    category_column: str = ""
+    date_format: str = "%Y-%m-%d"
+    delimiter: str = ","
+    # Bank exports are often latin-1 / cp1252; the default also skips a BOM
+    encoding: str = "utf-8-sig"
+    decimal_separator: Literal[".", ","] = "."
+    negative_is_expense: bool = True
+    chunk_size: int = Field(ge=1, default=2000)
+
+class Api(BaseModel):
+    """Local JSON API for scripts; served inside the TUI when enabled."""
+
+    enabled: bool = False
+    # Unix socket path; when empty the server listens on host:port instead
+    socket: str = ""
+    host: str = "127.0.0.1"
+    port: int = Field(ge=1, le=65535, default=8765)
+    # Required as "Authorization: Bearer <token>" when set
+    token: str = ""
+
+class Database(BaseModel):
+    """How the app writes to and follows the database file."""
+
+    # Queue UI writes on one thread, committing those that arrive together
+    # in one transaction
+    writer: bool = False
+    # How long the writer waits for more writes before committing
+    group_commit_ms: float = Field(ge=0, le=1000, default=5)
+    # Seconds between checks for writes by other processes (CLI, API
+    # scripts, another instance); 0 turns the live refresh off
+    watch_interval: float = Field(ge=0, default=1.0)
+
+class Instrumentation(BaseModel):
+    """Per-action timings and SQL counts, shown in an overlay (development)."""
+
+    enabled: bool = False
+    # Actions kept for the overlay
+    history: int = Field(ge=1, default=50)
+    # Append every action as a JSON line here when set
+    trace_file: str = ""
+
 class State(BaseModel):
     theme: str = "tokyo-night"
     check_for_updates: bool = True
@@ -75,6 +157,10 @@ class Config(BaseModel):
     hotkeys: Hotkeys = Hotkeys()
     symbols: Symbols = Symbols()
     defaults: Defaults = Defaults()
+    csv_import: CsvImport = CsvImport()
+    api: Api = Api()
+    database: Database = Database()
+    instrumentation: Instrumentation = Instrumentation()
     state: State = State()
 
     def __init__(self, **data: Any):
@@ -82,7 +168,7 @@ class Config(BaseModel):
             config_data = self._load_yaml_config()
             merged_data = {**self.model_dump(), **config_data, **data}
             super().__init__(**merged_data)
-            self.ensure_yaml_fields()
+            self.ensure_yaml_fields(config_data)
         except ValidationError as e:
             error_messages = []
             for error in e.errors():
@@ -111,19 +197,19 @@ class Config(BaseModel):
         if not path.is_file():
             return {}
         try:
-            with open(path, "r") as f:
-                data = yaml.safe_load(f)
-                return data if isinstance(data, dict) else {}
+            return _read_yaml(path)
         except Exception as e:
             warnings.warn(f"Error loading config file: {e}")
             return {}
 
-    def ensure_yaml_fields(self) -> None:
-        try:
-            with open(config_file(), "r") as f:
-                current = yaml.safe_load(f) or {}
-        except FileNotFoundError:
-            current = {}
+    def ensure_yaml_fields(self, current: dict[str, Any] | None = None) -> None:
+        """Add missing default fields to config.yaml. `current` is the file as
+        already parsed; the file is only rewritten when fields were missing."""
+        if current is None:
+            try:
+                current = _read_yaml(config_file())
+            except FileNotFoundError:
+                current = {}
 
         def merge_defaults(default: dict, target: dict) -> dict:
             for k, v in default.items():
@@ -134,15 +220,25 @@ class Config(BaseModel):
             return target
 
         default_config = self.model_dump()
-        merged = merge_defaults(default_config, current)
-
-        with open(config_file(), "w") as f:
-            yaml.dump(merged, f, default_flow_style=False)
+        merged = merge_defaults(default_config, copy.deepcopy(current))
+        if _digest(merged) == _digest(current):
+            return
+        try:
+            _write_yaml(config_file(), merged)
+        except OSError as e:
+            warnings.warn(f"Error updating config file: {e}")
 
     @classmethod
     def get_default(cls) -> "Config":
         return cls(
-            hotkeys=Hotkeys(), symbols=Symbols(), defaults=Defaults(), state=State()
+            hotkeys=Hotkeys(),
+            symbols=Symbols(),
+            defaults=Defaults(),
+            csv_import=CsvImport(),
+            api=Api(),
+            database=Database(),
+            instrumentation=Instrumentation(),
+            state=State(),
         )
 
 class ConfigurationError(Exception):
@@ -166,9 +262,7 @@ def load_config() -> None:
     path = config_file()
     if not path.exists():
         try:
-            path.touch()
-            with open(path, "w") as f:
-                yaml.dump(Config.get_default().model_dump(), f)
+            _write_yaml(path, Config.get_default().model_dump())
         except OSError:
             # non-fatal; we'll still try to load defaults
             pass
@@ -197,27 +291,63 @@ def load_config() -> None:
             print("\nExiting...")
         raise SystemExit(1)
 
+# Seconds to wait for further state changes before writing them together
+STATE_WRITE_DELAY = 0.5
+
+_pending_state: dict[str, Any] = {}
+_state_lock = threading.Lock()
+_state_timer: threading.Timer | None = None
+
 def write_state(key: str, value: Any) -> None:
-    """Write a nested state value to config.yaml using dot notation (e.g., 'theme' or 'foo.bar.baz')."""
-    try:
-        with open(config_file(), "r") as f:
-            config = yaml.safe_load(f) or {}
-    except FileNotFoundError:
-        config = {}
+    """Set a nested state value using dot notation (e.g., 'theme' or 'foo.bar.baz').
 
+    The in-memory config changes immediately; config.yaml is written in the
+    background once changes pause, so toggles never wait on disk."""
+    global _state_timer
     keys = key.split(".")
-    d = config.setdefault("state", {})
-    for k in keys[:-1]:
-        d = d.setdefault(k, {})
-    d[keys[-1]] = value
-
-    with open(config_file(), "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
 
     # update in-memory object
-    global CONFIG
     if CONFIG is not None:
         d2 = CONFIG.state
         for k in keys[:-1]:
             d2 = getattr(d2, k)
         setattr(d2, keys[-1], value)
+
+    with _state_lock:
+        _pending_state[key] = value
+        if _state_timer is not None:
+            _state_timer.cancel()
+        _state_timer = threading.Timer(STATE_WRITE_DELAY, flush_state)
+        _state_timer.daemon = True
+        _state_timer.start()
+
+def flush_state() -> None:
+    """Write pending state changes to config.yaml now (also run at exit)."""
+    global _state_timer
+    with _state_lock:
+        if _state_timer is not None:
+            _state_timer.cancel()
+            _state_timer = None
+        if not _pending_state:
+            return
+        pending = dict(_pending_state)
+        _pending_state.clear()
+
+        # Re-read so edits made to the file meanwhile are kept
+        path = config_file()
+        try:
+            config = _read_yaml(path)
+        except FileNotFoundError:
+            config = {}
+        for key, value in pending.items():
+            keys = key.split(".")
+            d = config.setdefault("state", {})
+            for k in keys[:-1]:
+                d = d.setdefault(k, {})
+            d[keys[-1]] = value
+        try:
+            _write_yaml(path, config)
+        except OSError as e:
+            warnings.warn(f"Error writing state to config file: {e}")
+
+atexit.register(flush_state)
@@ -1,7 +1,6 @@
-from rich.text import Text
-from Buckets.forms.form import Form, FormField, Option, Options
-from Buckets.managers.accounts import get_all_accounts_with_balance
-from Buckets.managers.buckets import get_bucket_by_id, get_buckets_by_account
+from Buckets.forms import options_cache
+from Buckets.forms.form import Form, FormField, Options
+from Buckets.managers.buckets import get_bucket_by_id
 
 # blueprint (never mutated)
 _BUCKET_BASE = Form(
@@ -36,17 +35,7 @@ class BucketForm:
     """Stateless: options populated per-call."""
 
     def _account_options(self) -> Options:
-        accounts = get_all_accounts_with_balance()
-        return Options(
-            items=[
-                Option(
-                    text=acc.name,
-                    value=acc.id,
-                    postfix=Text(f"{acc.balance}", style="yellow"),
-                )
-                for acc in accounts
-            ]
-        )
+        return options_cache.account_options()
 
     def get_form(self, default_account_id: int | None = None) -> Form:
         f = _BUCKET_BASE.clone()
@@ -117,8 +106,7 @@ class BucketTransferForm:
 
     def get_form(self) -> Form:
         f = self._FORM.clone()
-        buckets = get_buckets_by_account(self.account_id) if self.account_id else []
-        opts = Options(items=[Option(text=b.name, value=b.id) for b in buckets])
+        opts = options_cache.bucket_options(self.account_id)
         f.fields[0].options = opts
         f.fields[1].options = opts
         return f
@@ -1,34 +1,56 @@
-from typing import Any, List, Literal
-from pydantic import BaseModel, Field
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Literal
+
 from rich.console import RenderableType
 
-class Option(BaseModel):
-    model_config = {"arbitrary_types_allowed": True}
-    text: str | None = None
+FieldType = Literal[
+    "string",
+    "number",
+    "integer",
+    "boolean",
+    "autocomplete",
+    "dateAutoDay",
+    "hidden",
+]
+_FIELD_TYPES = frozenset(FieldType.__args__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Option:
     value: Any
+    text: str | None = None
     prefix: RenderableType | None = None
     postfix: RenderableType | None = None
+    weight: float = 0
+    payload: Any = None
+
 
-class Options(BaseModel):
-    items: List[Option] = Field(default_factory=list)
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Options:
+    """Immutable option list; safe to share between forms."""
+
+    items: tuple[Option, ...] = ()
+
+    def __post_init__(self):
+        if not isinstance(self.items, tuple):
+            object.__setattr__(self, "items", tuple(self.items))
 
     def __len__(self):
         return len(self.items)
 
-class FormField(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class FormField:
+    key: str
+    type: FieldType
     placeholder: str | None = None
     title: str | None = None
-    key: str
-    type: Literal[
-        "string",
-        "number",
-        "integer",
-        "boolean",
-        "autocomplete",
-        "dateAutoDay",
-        "hidden",
-    ]
     autocomplete_selector: bool = True
+    match_strategy: Literal["substring", "fuzzy"] = "substring"
+    suggest: Callable[[str], List[Option]] | None = None
     is_required: bool = False
     min: float | int | None = None
     max: float | int | None = None
@@ -38,12 +60,20 @@ class FormField(BaseModel):
     default_value_text: str | None = None
     create_action: bool | None = None
 
-class Form(BaseModel):
-    fields: List[FormField] = Field(default_factory=list)
+    def __post_init__(self):
+        if self.type not in _FIELD_TYPES:
+            raise ValueError(f"Invalid field type {self.type!r} for field {self.key!r}")
+
+
+@dataclass(slots=True, kw_only=True)
+class Form:
+    fields: List[FormField] = field(default_factory=list)
 
     def __len__(self):
         return len(self.fields)
 
     def clone(self) -> "Form":
-        # pydantic v2
-        return self.model_copy(deep=True)
+        # Copy-on-write: each field is copied shallowly, so per-form overrides
+        # (defaults, type, options) never touch the blueprint, while option
+        # lists and Rich renderables stay shared.
+        return Form(fields=[copy(f) for f in self.fields])
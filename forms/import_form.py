@@ -0,0 +1,42 @@
+from Buckets.forms import options_cache
+from Buckets.forms.form import Form, FormField, Options
+
+# blueprint (never mutated)
+_IMPORT_FORM = Form(
+    fields=[
+        FormField(
+            placeholder="~/Downloads/statement.csv",
+            title="CSV file",
+            key="path",
+            type="string",
+            is_required=True,
+        ),
+        FormField(
+            title="Account",
+            key="accountId",
+            type="autocomplete",
+            options=Options(),
+            is_required=True,
+            placeholder="Select Account",
+        ),
+        FormField(
+            title="Mode",
+            key="dryRun",
+            type="boolean",
+            labels=["Import", "Dry run"],
+            default_value=False,
+        ),
+    ]
+)
+
+class ImportForm:
+    def get_form(self, default_account_id: int | None = None) -> Form:
+        f = _IMPORT_FORM.clone()
+        f.fields[1].options = options_cache.account_options()
+        if default_account_id:
+            f.fields[1].default_value = default_account_id
+            for opt in f.fields[1].options.items:
+                if opt.value == default_account_id:
+                    f.fields[1].default_value_text = opt.text
+                    break
+        return f
@@ -0,0 +1,134 @@
+# Buckets/forms/options_cache.py
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+
+from rich.text import Text
+
+from Buckets.forms.form import Option, Options
+from Buckets.managers.accounts import get_all_accounts_with_balance
+from Buckets.managers.buckets import get_buckets_by_account
+from Buckets.managers.categories import get_all_categories_by_freq
+from Buckets.managers.record_templates import get_record_templates, get_transfer_templates
+from Buckets.managers.versions import get_version
+
+T = TypeVar("T")
+
+# name -> (data versions it was built at, options)
+# Options are immutable, so cached lists are shared between forms as-is.
+_cache: dict[str, tuple[tuple[int, ...], Any]] = {}
+
+
+def cached_options(name: str, depends_on: tuple[str, ...], build: Callable[[], T]) -> T:
+    """Return the options cached under `name`, rebuilding them only when one of
+    the `depends_on` data versions moved since they were built."""
+    stamp = tuple(get_version(dependency) for dependency in depends_on)
+    hit = _cache.get(name)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    options = build()
+    _cache[name] = (stamp, options)
+    return options
+
+
+def clear() -> None:
+    _cache.clear()
+
+
+# ---------- shared option lists ---------- #
+
+
+def account_options() -> Options:
+    def build() -> Options:
+        return Options(
+            items=[
+                Option(
+                    text=a.name,
+                    value=a.id,
+                    postfix=Text(f"{a.balance}", style="yellow"),
+                )
+                for a in get_all_accounts_with_balance()
+            ]
+        )
+
+    return cached_options("accounts", ("accounts", "balances"), build)
+
+
+def category_options() -> Options:
+    def build() -> Options:
+        return Options(
+            items=[
+                Option(
+                    text=c.name,
+                    value=c.id,
+                    prefix=Text("●", style=c.color),
+                    postfix=(
+                        Text(f"↪ {c.parentCategory.name}", style=c.parentCategory.color)
+                        if c.parentCategory
+                        else ""
+                    ),
+                    weight=freq,
+                )
+                for c, freq in get_all_categories_by_freq()
+            ]
+        )
+
+    # Ordered by usage, so record writes also invalidate
+    return cached_options("categories", ("categories", "records"), build)
+
+
+def template_options() -> Options:
+    def build() -> Options:
+        return Options(
+            items=[
+                Option(
+                    text=t.label,
+                    value=t.id,
+                    postfix=Text(f"{t.amount}", style="yellow"),
+                )
+                for t in get_record_templates()
+            ]
+        )
+
+    return cached_options("templates", ("templates",), build)
+
+
+def transfer_template_options() -> Options:
+    def build() -> Options:
+        return Options(
+            items=[
+                Option(
+                    text=t.label,
+                    value=t.id,
+                    postfix=Text(f"{t.amount}", style="yellow"),
+                )
+                for t in get_transfer_templates()
+            ]
+        )
+
+    return cached_options("transfer_templates", ("templates",), build)
+
+
+def transfer_accounts() -> tuple:
+    """All accounts (hidden included) with balances, for the transfer selectors."""
+    return cached_options(
+        "transfer_accounts",
+        ("accounts", "balances"),
+        lambda: tuple(get_all_accounts_with_balance(get_hidden=True)),
+    )
+
+
+def bucket_options(account_id: int | None) -> Options:
+    """Buckets are scoped to an account; empty list if none."""
+    if not account_id:
+        return Options(items=[])
+
+    def build() -> Options:
+        return Options(
+            items=[
+                Option(text=b.name, value=b.id)
+                for b in get_buckets_by_account(account_id)
+            ]
+        )
+
+    return cached_options(f"buckets:{account_id}", ("buckets",), build)
@@ -1,16 +1,13 @@
 # Buckets/forms/record_forms.py
 from __future__ import annotations
 
-import copy
 from datetime import datetime
 from rich.text import Text
 
+from Buckets.forms import options_cache
 from Buckets.forms.form import Form, FormField, Option, Options
-from Buckets.managers.accounts import get_all_accounts_with_balance
-from Buckets.managers.categories import get_all_categories_by_freq
-from Buckets.managers.record_templates import get_record_templates
+from Buckets.managers.label_index import search_labels
 from Buckets.managers.records import get_record_by_id
-from Buckets.managers.buckets import get_buckets_by_account  # ← fix import
 
 _RECORD_FORM = Form(
     fields=[
@@ -22,6 +19,7 @@ _RECORD_FORM = Form(
             options=Options(),
             autocomplete_selector=False,
             is_required=True,
+            match_strategy="fuzzy",
         ),
         FormField(
             title="Category",
@@ -30,6 +28,7 @@ _RECORD_FORM = Form(
             options=Options(),
             is_required=True,
             placeholder="Select Category",
+            match_strategy="fuzzy",
         ),
         FormField(
             placeholder="0.00",
@@ -54,6 +53,7 @@ _RECORD_FORM = Form(
             options=Options(),
             is_required=True,
             placeholder="Select Account",
+            match_strategy="fuzzy",
         ),
         FormField(
             title="Type",
@@ -79,64 +79,39 @@ class RecordForm:
     # ---------- options builders ---------- #
 
     def _template_options(self) -> Options:
-        templates = get_record_templates()
-        return Options(
-            items=[
-                Option(
-                    text=t.label,
-                    value=t.id,
-                    postfix=Text(f"{t.amount}", style="yellow"),
-                )
-                for t in templates
-            ]
-        )
+        return options_cache.template_options()
+
+    def _label_suggestions(self, query: str) -> list[Option]:
+        """Previously used labels, looked up by prefix as the user types."""
+        return [
+            Option(
+                text=entry.label,
+                value=entry.key,
+                postfix=Text(f"{entry.amount}", style="dim"),
+                payload=entry,
+            )
+            for entry in search_labels(query)
+        ]
 
     def _account_options(self) -> Options:
-        accounts = get_all_accounts_with_balance()
-        return Options(
-            items=[
-                Option(
-                    text=a.name,
-                    value=a.id,
-                    postfix=Text(f"{a.balance}", style="yellow"),
-                )
-                for a in accounts
-            ]
-        )
+        return options_cache.account_options()
 
     def _bucket_options(self, account_id: int | None) -> Options:
         """Buckets are scoped to the chosen account; empty list if none."""
-        if not account_id:
-            return Options(items=[])
-        buckets = get_buckets_by_account(account_id)
-        return Options(items=[Option(text=b.name, value=b.id) for b in buckets])
+        return options_cache.bucket_options(account_id)
 
     def _category_options(self) -> Options:
-        categories = get_all_categories_by_freq()
-        return Options(
-            items=[
-                Option(
-                    text=c.name,
-                    value=c.id,
-                    prefix=Text("●", style=c.color),
-                    postfix=(
-                        Text(f"↪ {c.parentCategory.name}", style=c.parentCategory.color)
-                        if c.parentCategory
-                        else ""
-                    ),
-                )
-                for c, _freq in categories
-            ]
-        )
+        return options_cache.category_options()
 
     # ---------- base form ---------- #
 
     def _base_form_with_options(self) -> Form:
-        # deep copy to keep the blueprint immutable
-        f = copy.deepcopy(_RECORD_FORM)
+        # clone to keep the blueprint immutable; option lists are shared
+        f = _RECORD_FORM.clone()
 
         # label (templates), category, account get populated now
         f.fields[0].options = self._template_options()
+        f.fields[0].suggest = self._label_suggestions
         f.fields[1].options = self._category_options()
         f.fields[4].options = self._account_options()  # index 4 = accountId
 
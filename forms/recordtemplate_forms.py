@@ -1,9 +1,17 @@
-from rich.text import Text
-from Buckets.managers.accounts import get_all_accounts_with_balance
-from Buckets.managers.categories import get_all_categories_by_freq
+from Buckets.forms import options_cache
 from Buckets.managers.record_templates import get_template_by_id
 from Buckets.forms.form import Form, FormField, Option, Options
 
+_RECURRENCE_OPTIONS = Options(
+    items=[
+        Option(text="Never", value="none"),
+        Option(text="Daily", value="daily"),
+        Option(text="Weekly", value="weekly", postfix="on the first due weekday"),
+        Option(text="Monthly", value="monthly", postfix="on the first due day"),
+        Option(text="Yearly", value="yearly", postfix="on the first due date"),
+    ]
+)
+
 _RECORD_TEMPLATE_FORM = Form(
     fields=[
         FormField(
@@ -20,6 +28,7 @@ _RECORD_TEMPLATE_FORM = Form(
             options=Options(),
             is_required=True,
             placeholder="Select Category",
+            match_strategy="fuzzy",
         ),
         FormField(
             placeholder="0.00",
@@ -36,6 +45,7 @@ _RECORD_TEMPLATE_FORM = Form(
             options=Options(),
             is_required=True,
             placeholder="Select Account",
+            match_strategy="fuzzy",
         ),
         FormField(
             title="Type",
@@ -44,41 +54,31 @@ _RECORD_TEMPLATE_FORM = Form(
             labels=["Expense", "Income"],
             default_value=False,
         ),
+        FormField(
+            title="Repeat",
+            key="recurrence",
+            type="autocomplete",
+            options=_RECURRENCE_OPTIONS,
+            default_value="none",
+            default_value_text="Never",
+            placeholder="Never",
+        ),
+        FormField(
+            title="First due",
+            key="recurrenceStart",
+            type="dateAutoDay",
+            placeholder="dd (mm) (yy), today if empty",
+        ),
     ]
 )
 
 
 class RecordTemplateForm:
     def _account_options(self) -> Options:
-        accounts = get_all_accounts_with_balance()
-        return Options(
-            items=[
-                Option(
-                    text=acc.name,
-                    value=acc.id,
-                    postfix=Text(f"{acc.balance}", style="yellow"),
-                )
-                for acc in accounts
-            ]
-        )
+        return options_cache.account_options()
 
     def _category_options(self) -> Options:
-        categories = get_all_categories_by_freq()
-        return Options(
-            items=[
-                Option(
-                    text=c.name,
-                    value=c.id,
-                    prefix=Text("●", style=c.color),
-                    postfix=(
-                        Text(f"↪ {c.parentCategory.name}", style=c.parentCategory.color)
-                        if c.parentCategory
-                        else ""
-                    ),
-                )
-                for c, _ in categories
-            ]
-        )
+        return options_cache.category_options()
 
     def _base(self) -> Form:
         f = _RECORD_TEMPLATE_FORM.clone()
@@ -94,7 +94,7 @@ class RecordTemplateForm:
         template = get_template_by_id(templateId)
         for field in f.fields:
             k = field.key
-            v = getattr(template, k)
+            v = getattr(template, k, None)
             match k:
                 case "isIncome":
                     field.default_value = bool(v)
@@ -104,6 +104,18 @@ class RecordTemplateForm:
                 case "accountId":
                     field.default_value = template.account.id
                     field.default_value_text = template.account.name
+                case "recurrence":
+                    field.default_value = v or "none"
+                    field.default_value_text = next(
+                        option.text
+                        for option in _RECURRENCE_OPTIONS.items
+                        if option.value == field.default_value
+                    )
+                case "recurrenceStart":
+                    next_due = template.nextDueAt
+                    field.default_value = (
+                        next_due.strftime("%d %m %y") if next_due else ""
+                    )
                 case _:
                     field.default_value = "" if v is None else str(v)
         return f
@@ -1,7 +1,6 @@
 from datetime import datetime
-from rich.text import Text
-from Buckets.forms.form import Form, FormField, Option, Options
-from Buckets.managers.record_templates import get_transfer_templates
+from Buckets.forms import options_cache
+from Buckets.forms.form import Form, FormField, Options
 from Buckets.models.record import Record
 
 _TRANSFER_FORM = Form(
@@ -55,17 +54,7 @@ class TransferForm:
         self.defaultDate = defaultDate
 
     def _template_options(self) -> Options:
-        templates = get_transfer_templates()
-        return Options(
-            items=[
-                Option(
-                    text=t.label,
-                    value=t.id,
-                    postfix=Text(f"{t.amount}", style="yellow"),
-                )
-                for t in templates
-            ]
-        )
+        return options_cache.transfer_template_options()
 
     def _base(self) -> Form:
         f = (_TRANSFER_TEMPLATE_FORM if self.isTemplate else _TRANSFER_FORM).clone()
@@ -19,6 +19,7 @@ class Home(Static):
     filter = {
         "offset": 0,
         "offset_type": CONFIG.defaults.period,
+        "query": None,  # record filter string, see managers.filters
     }
 
     BINDINGS = [
@@ -51,6 +52,9 @@ class Home(Static):
             "Select next account",
             show=False,
         ),
+        Binding(
+            CONFIG.hotkeys.home.import_csv, "import_csv", "Import CSV", show=False
+        ),
         Binding("1", "select_template_1", "Template 1", show=False),
         Binding("2", "select_template_2", "Template 2", show=False),
         Binding("3", "select_template_3", "Template 3", show=False),
@@ -90,6 +94,23 @@ class Home(Static):
         self.templates_module = Templates(parent=self)
 
     # -------- Helpers --------
+    def invalidate(self, changed: set[str]) -> None:
+        """Rebuild only the modules whose data changed while the page was hidden."""
+        if "accounts" in changed:
+            self.accounts = get_all_accounts()
+            self.accounts_indices["count"] = len(self.accounts)
+            self.accounts_indices["index"] = min(
+                self.accounts_indices["index"], max(len(self.accounts) - 1, 0)
+            )
+        for module in (
+            self.accounts_module,
+            self.insights_module,
+            self.record_module,
+            self.templates_module,
+        ):
+            if changed.intersection(module.DATA_DEPENDENCIES):
+                module.rebuild()
+
     def rebuild(self, templates: bool = False) -> None:
         self.insights_module.rebuild()
         self.accounts_module.rebuild()
@@ -212,6 +233,24 @@ class Home(Static):
         self.insights_module.rebuild()
         self.record_module.rebuild()
 
+    def action_import_csv(self) -> None:
+        from Buckets.modals.import_csv import ImportModal
+
+        def check_result(result) -> None:
+            if result and result.inserted:
+                self.app.notify(
+                    title="Success",
+                    message=result.summary(),
+                    severity="information",
+                    timeout=5,
+                )
+                self.rebuild()
+
+        self.app.push_screen(
+            ImportModal(default_account_id=self.mode["accountId"]["default_value"]),
+            callback=check_result,
+        )
+
     # -------- Templates --------
     def action_select_template_1(self) -> None:
         self.templates_module.select_template(1)
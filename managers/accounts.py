@@ -4,19 +4,22 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import func, select
+from sqlalchemy import case, func, select
 from Buckets.config import CONFIG
-from Buckets.models.database.app import Session
+from Buckets.managers import versions
+from Buckets.models.database.app import Session, WriteSession
 from Buckets.models.account import Account
 from Buckets.models.record import Record
+from Buckets.utils.query_guard import query_budget
 
 def create_account(data: dict) -> Account:
     """Create an account from a dict of fields."""
-    session = Session()
+    session = WriteSession()
     try:
         acc = Account(**data)
         session.add(acc)
         session.commit()
+        versions.bump("accounts", "balances")
         session.refresh(acc)
         session.expunge(acc)
         return acc
@@ -31,6 +34,7 @@ def _get_base_accounts_query(get_hidden: bool = False):
         stmt = stmt.order_by(Account.hidden.asc(), Account.id.asc())
     return stmt
 
+@query_budget(1)
 def get_all_accounts(get_hidden: bool = False) -> List[Account]:
     session = Session()
     try:
@@ -39,6 +43,7 @@ def get_all_accounts(get_hidden: bool = False) -> List[Account]:
     finally:
         session.close()
 
+@query_budget(1)
 def get_accounts_count(get_hidden: bool = False) -> int:
     session = Session()
     try:
@@ -49,6 +54,7 @@ def get_accounts_count(get_hidden: bool = False) -> int:
     finally:
         session.close()
 
+@query_budget(1)
 def get_account_by_id(account_id: int) -> Optional[Account]:
     session = Session()
     try:
@@ -56,18 +62,56 @@ def get_account_by_id(account_id: int) -> Optional[Account]:
     finally:
         session.close()
 
+def _balances(session, beginning: dict[int, float]) -> dict[int, float]:
+    """Balances of the accounts keyed in `beginning` (id -> beginning
+    balance), in two grouped queries however many accounts or records."""
+    if not beginning:
+        return {}
+    account_ids = list(beginning)
+    balances = {id: float(amount or 0.0) for id, amount in beginning.items()}
+    # Income adds; expenses and outgoing transfers subtract
+    is_income = Record.isTransfer.is_(False) & Record.isIncome.is_(True)
+    outgoing = (
+        select(
+            Record.accountId,
+            func.sum(case((is_income, Record.amount), else_=-Record.amount)),
+        )
+        .where(Record.accountId.in_(account_ids))
+        .group_by(Record.accountId)
+    )
+    incoming = (
+        select(Record.transferToAccountId, func.sum(Record.amount))
+        .where(
+            Record.isTransfer.is_(True),
+            Record.transferToAccountId.in_(account_ids),
+        )
+        .group_by(Record.transferToAccountId)
+    )
+    for statement in (outgoing, incoming):
+        for id, amount in session.execute(statement):
+            balances[id] += amount or 0.0
+    return {
+        id: round(balance, CONFIG.defaults.round_decimals)
+        for id, balance in balances.items()
+    }
+
+@query_budget(3)
 def get_all_accounts_with_balance(get_hidden: bool = False) -> List[Account]:
     """Return accounts list where each item also has a transient `.balance` attr."""
     session = Session()
     try:
         stmt = _get_base_accounts_query(get_hidden)
         accounts = session.scalars(stmt).all()
+        balances = _balances(
+            session, {acc.id: acc.beginningBalance for acc in accounts}
+        )
         for acc in accounts:
-            acc.balance = get_account_balance(acc.id, session)  # type: ignore[attr-defined]
+            acc.balance = balances[acc.id]  # type: ignore[attr-defined]
         return accounts
     finally:
         session.close()
 
+@query_budget(3)
 def get_account_balance_by_id(account_id: int) -> float:
     session = Session()
     try:
@@ -75,6 +119,7 @@ def get_account_balance_by_id(account_id: int) -> float:
     finally:
         session.close()
 
+@query_budget(3)
 def get_account_balance(account_id: int, session: Optional[Session] = None) -> float:
     own_session = False
     if session is None:
@@ -85,37 +130,14 @@ def get_account_balance(account_id: int, session: Optional[Session] = None) -> f
         acc = session.get(Account, account_id)
         if not acc:
             return 0.0
-
-        balance = float(acc.beginningBalance or 0.0)
-
-        origin_records = (
-            session.query(Record).filter(Record.accountId == account_id).all()
-        )
-        for r in origin_records:
-            if r.isTransfer:
-                balance -= r.amount
-            elif r.isIncome:
-                balance += r.amount
-            else:
-                balance -= r.amount
-
-        incoming_transfers = (
-            session.query(Record)
-            .filter(Record.isTransfer.is_(True))
-            .filter(Record.transferToAccountId == account_id)
-            .all()
-        )
-        for r in incoming_transfers:
-            balance += r.amount
-
-        return round(balance, CONFIG.defaults.round_decimals)
+        return _balances(session, {acc.id: acc.beginningBalance})[acc.id]
     finally:
         if own_session:
             session.close()
 
 def update_account(account_id: int, data: dict) -> Optional[Account]:
     """Update fields on an account. Returns updated Account or None."""
-    session = Session()
+    session = WriteSession()
     try:
         acc = session.get(Account, account_id)
         if not acc:
@@ -124,6 +146,7 @@ def update_account(account_id: int, data: dict) -> Optional[Account]:
             if hasattr(acc, key):
                 setattr(acc, key, val)
         session.commit()
+        versions.bump("accounts", "balances")
         session.refresh(acc)
         session.expunge(acc)
         return acc
@@ -134,13 +157,14 @@ def toggle_account_hidden(
     account_id: int, hidden: Optional[bool] = None
 ) -> Optional[Account]:
     """Toggle or explicitly set the hidden flag."""
-    session = Session()
+    session = WriteSession()
     try:
         acc = session.get(Account, account_id)
         if not acc:
             return None
         acc.hidden = (not acc.hidden) if hidden is None else bool(hidden)
         session.commit()
+        versions.bump("accounts", "balances")
         session.refresh(acc)
         session.expunge(acc)
         return acc
@@ -149,13 +173,14 @@ def toggle_account_hidden(
 
 def delete_account(account_id: int) -> bool:
     """Soft-delete account by setting deletedAt."""
-    session = Session()
+    session = WriteSession()
     try:
         acc = session.get(Account, account_id)
         if not acc:
             return False
         acc.deletedAt = datetime.now()
         session.commit()
+        versions.bump("accounts", "balances")
         return True
     finally:
         session.close()
@@ -4,8 +4,10 @@ from datetime import datetime
 from typing import Optional
 
 from Buckets.config import CONFIG
+from Buckets.managers import versions
 from Buckets.models.bucket import Bucket
-from Buckets.models.database.app import Session
+from Buckets.models.database.app import Session, WriteSession
+from Buckets.utils.query_guard import query_budget
 
 class BucketTransferError(Exception):
     """Raised when a bucket-to-bucket transfer is invalid."""
@@ -21,7 +23,7 @@ def create_bucket(data: dict) -> Bucket:
       - amount (float, default 0.0)
       - accountId (int, required)
     """
-    with Session() as s:
+    with WriteSession() as s:
         bucket = Bucket(
             name=str(data["name"]),
             amount=round(
@@ -31,10 +33,12 @@ def create_bucket(data: dict) -> Bucket:
         )
         s.add(bucket)
         s.commit()
+        versions.bump("buckets")
         s.refresh(bucket)
         s.expunge(bucket)
         return bucket
 
+@query_budget(1)
 def get_bucket_by_id(bucket_id: int) -> Optional[Bucket]:
     with Session() as s:
         bucket = s.get(Bucket, int(bucket_id))
@@ -43,6 +47,7 @@ def get_bucket_by_id(bucket_id: int) -> Optional[Bucket]:
             return bucket
         return None
 
+@query_budget(1)
 def get_buckets_by_account(
     account_id: int, include_deleted: bool = False
 ) -> list[Bucket]:
@@ -55,6 +60,7 @@ def get_buckets_by_account(
             s.expunge(b)
         return buckets
 
+@query_budget(1)
 def get_all_buckets(include_deleted: bool = False) -> list[Bucket]:
     with Session() as s:
         q = s.query(Bucket)
@@ -69,7 +75,7 @@ def update_bucket(bucket_id: int, data: dict) -> Optional[Bucket]:
     """
     Update a bucket. Updatable keys: name, amount, accountId
     """
-    with Session() as s:
+    with WriteSession() as s:
         bucket = s.get(Bucket, int(bucket_id))
         if not bucket or bucket.deletedAt is not None:
             return None
@@ -84,17 +90,19 @@ def update_bucket(bucket_id: int, data: dict) -> Optional[Bucket]:
             bucket.accountId = int(data["accountId"])
 
         s.commit()
+        versions.bump("buckets")
         s.refresh(bucket)
         s.expunge(bucket)
         return bucket
 
 def delete_bucket(bucket_id: int) -> bool:
-    with Session() as s:
+    with WriteSession() as s:
         bucket = s.get(Bucket, int(bucket_id))
         if not bucket or bucket.deletedAt is not None:
             return False
         bucket.deletedAt = datetime.now()
         s.commit()
+        versions.bump("buckets")
         return True
 
 def transfer_between_buckets(
@@ -110,7 +118,7 @@ def transfer_between_buckets(
     if amount <= 0:
         raise BucketTransferError("Amount must be greater than 0.")
 
-    with Session() as s:
+    with WriteSession() as s:
         src = s.get(Bucket, int(from_bucket_id))
         dst = s.get(Bucket, int(to_bucket_id))
 
@@ -129,4 +137,5 @@ def transfer_between_buckets(
         dst.amount = round(dst.amount + amount, CONFIG.defaults.round_decimals)
 
         s.commit()
+        versions.bump("buckets")
         return True
@@ -1,28 +1,33 @@
 from datetime import datetime
 
-from rich.text import Text
 from sqlalchemy import desc, func, select
 from sqlalchemy.orm import joinedload, sessionmaker
 
+from Buckets.managers import versions
+from Buckets.managers.filters import apply_filter
 from Buckets.managers.utils import get_start_end_of_period
 from Buckets.models.category import Category
-from Buckets.models.database.app import db_engine
+from Buckets.models.database.app import WriteSession, db_engine
 from Buckets.models.record import Record
+from Buckets.utils.query_guard import query_budget
 
 Session = sessionmaker(bind=db_engine)
 
 # region Get
+@query_budget(1)
 def get_categories_count() -> int:
     """Count all categories excluding deleted ones."""
     session = Session()
     try:
-        stmt = select(Category).filter(Category.deletedAt.is_(None))
-        return len(session.scalars(stmt).all())
+        stmt = select(func.count(Category.id)).filter(Category.deletedAt.is_(None))
+        return int(session.scalar(stmt) or 0)
     finally:
         session.close()
 
-def get_all_categories_tree() -> list[tuple[Category, Text, int]]:
-    """Retrieve all categories in a hierarchical tree format."""
+@query_budget(1)
+def get_all_categories_tree() -> list[tuple[Category, str, int]]:
+    """Retrieve all categories in a hierarchical tree format, each with its
+    tree glyph ("●" for roots, "├"/"└" below) and depth."""
     session = Session()
     try:
         stmt = (
@@ -42,12 +47,10 @@ def get_all_categories_tree() -> list[tuple[Category, Text, int]]:
             for category in categories:
                 if category.parentCategoryId == parent_id:
                     if depth == 0:
-                        node = Text("●", style=category.color)
+                        node = "●"
                     else:
-                        node = Text(
-                            " " * (depth - 1)
-                            + ("└" if is_last(category, parent_id) else "├"),
-                            style=category.color,
+                        node = " " * (depth - 1) + (
+                            "└" if is_last(category, parent_id) else "├"
                         )
                     result.append((category, node, depth))
                     result.extend(build_category_tree(category.id, depth + 1))
@@ -57,6 +60,7 @@ def get_all_categories_tree() -> list[tuple[Category, Text, int]]:
     finally:
         session.close()
 
+@query_budget(1)
 def get_all_categories_by_freq():
     """Retrieve all categories ordered by the frequency of their usage in records."""
     session = Session()
@@ -73,6 +77,7 @@ def get_all_categories_by_freq():
     finally:
         session.close()
 
+@query_budget(1)
 def get_category_by_id(category_id: int) -> Category | None:
     """Retrieve a category by its ID."""
     session = Session()
@@ -87,50 +92,41 @@ def get_category_by_id(category_id: int) -> Category | None:
     finally:
         session.close()
 
+@query_budget(2)
 def get_all_categories_records(
     offset: int = 0,
     offset_type: str = "month",
     is_income: bool = True,
     subcategories: bool = False,
     account_id: int | None = None,
+    record_filter: str | None = None,
 ):
     session = Session()
     try:
         start_of_period, end_of_period = get_start_end_of_period(offset, offset_type)
 
+        # Summed per category in SQL; records without a category drop out
         stmt = (
-            select(Record)
-            .options(joinedload(Record.category))
+            select(Record.categoryId, Category.parentCategoryId, func.sum(Record.amount))
+            .join(Category, Record.categoryId == Category.id)
             .filter(
                 Record.date >= start_of_period,
                 Record.date < end_of_period,
                 Record.isIncome == is_income,
                 Record.isTransfer == False,  # exclude transfers
             )
+            .group_by(Record.categoryId, Category.parentCategoryId)
         )
         if account_id is not None:
             stmt = stmt.filter(Record.accountId == account_id)
+        stmt = apply_filter(stmt, record_filter)
 
         category_totals: dict[int, float] = {}
-        records = session.scalars(stmt).all()
-
-        for record in records:
-            if record.category is None:
-                continue
-
-            # Amount = raw record amount (no split adjustments)
-            record_amount = record.amount
-
-            # Roll up to parent if requested
-            category_id = (
-                record.category.parentCategoryId
-                if (not subcategories and record.category.parentCategoryId)
-                else record.categoryId
-            )
-
-            category_totals[category_id] = (
-                category_totals.get(category_id, 0.0) + record_amount
-            )
+        for category_id, parent_id, amount in session.execute(stmt):
+            # Roll up to parent if requested (no split adjustments)
+            if not subcategories and parent_id:
+                category_id = parent_id
+            category_totals[category_id] = category_totals.get(category_id, 0.0) + amount
 
         if not category_totals:
             return []
@@ -160,11 +156,12 @@ def get_all_categories_records(
 # region Create
 def create_category(data: dict) -> Category:
     """Create a new category."""
-    session = Session()
+    session = WriteSession()
     try:
         new_category = Category(**data)
         session.add(new_category)
         session.commit()
+        versions.bump("categories")
         session.refresh(new_category)
         session.expunge(new_category)
         return new_category
@@ -174,13 +171,14 @@ def create_category(data: dict) -> Category:
 # region Update
 def update_category(category_id: int, data: dict) -> Category | None:
     """Update a category by its ID."""
-    session = Session()
+    session = WriteSession()
     try:
         category = session.get(Category, category_id)
         if category:
             for key, value in data.items():
                 setattr(category, key, value)
             session.commit()
+            versions.bump("categories")
             session.refresh(category)
             session.expunge(category)
         return category
@@ -190,7 +188,7 @@ def update_category(category_id: int, data: dict) -> Category | None:
 # region Delete
 def delete_category(category_id: int) -> bool:
     """Soft-delete a category and its subcategories."""
-    session = Session()
+    session = WriteSession()
     try:
         category = session.get(Category, category_id)
         if not category:
@@ -207,6 +205,7 @@ def delete_category(category_id: int) -> bool:
             sub.deletedAt = now
 
         session.commit()
+        versions.bump("categories")
         session.refresh(category)
         session.expunge(category)
         return True
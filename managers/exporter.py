@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Iterator, Literal
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import aliased, sessionmaker
+
+from Buckets.managers.utils import get_start_end_of_period
+from Buckets.models.account import Account
+from Buckets.models.category import Category
+from Buckets.models.database.app import db_engine
+from Buckets.models.record import Record
+
+Session = sessionmaker(bind=db_engine)
+
+ExportFormat = Literal["csv", "jsonl"]
+RecordKind = Literal["income", "expense", "transfer"]
+
+FIELDS = (
+    "id",
+    "date",
+    "label",
+    "amount",
+    "type",
+    "account",
+    "category",
+    "parentCategory",
+    "transferToAccount",
+    "isInProgress",
+)
+
+
+def _select_rows(
+    start: datetime | None,
+    end: datetime | None,
+    account_id: int | None,
+    category_id: int | None,
+    kind: RecordKind | None,
+):
+    """Flat column select with every name resolved through joins, so rows are
+    plain tuples and no ORM objects are hydrated."""
+    transfer_to = aliased(Account)
+    parent = aliased(Category)
+    stmt = (
+        select(
+            Record.id,
+            Record.date,
+            Record.label,
+            Record.amount,
+            Record.isIncome,
+            Record.isTransfer,
+            Account.name,
+            Category.name,
+            parent.name,
+            transfer_to.name,
+            Record.isInProgress,
+        )
+        .join(Account, Record.accountId == Account.id)
+        .outerjoin(Category, Record.categoryId == Category.id)
+        .outerjoin(parent, Category.parentCategoryId == parent.id)
+        .outerjoin(transfer_to, Record.transferToAccountId == transfer_to.id)
+        .order_by(Record.date, Record.id)
+    )
+    if start is not None:
+        stmt = stmt.where(Record.date >= start)
+    if end is not None:
+        stmt = stmt.where(Record.date < end)
+    if account_id is not None:
+        stmt = stmt.where(
+            or_(Record.accountId == account_id, Record.transferToAccountId == account_id)
+        )
+    if category_id is not None:
+        # A parent category also matches its subcategories
+        stmt = stmt.where(
+            or_(Record.categoryId == category_id, Category.parentCategoryId == category_id)
+        )
+    if kind == "transfer":
+        stmt = stmt.where(Record.isTransfer == True)  # noqa: E712
+    elif kind is not None:
+        stmt = stmt.where(
+            Record.isTransfer == False,  # noqa: E712
+            Record.isIncome == (kind == "income"),
+        )
+    return stmt
+
+
+def iter_export_rows(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    account_id: int | None = None,
+    category_id: int | None = None,
+    kind: RecordKind | None = None,
+    chunk_size: int = 1000,
+) -> Iterator[dict]:
+    """Yield records as plain dicts keyed by `FIELDS`, oldest first.
+
+    The result is streamed from a server-side cursor `chunk_size` rows at a
+    time, so memory stays flat however many records match.
+    """
+    stmt = _select_rows(start, end, account_id, category_id, kind).execution_options(
+        yield_per=chunk_size, stream_results=True
+    )
+    session = Session()
+    try:
+        for (
+            id,
+            date,
+            label,
+            amount,
+            is_income,
+            is_transfer,
+            account,
+            category,
+            parent_category,
+            transfer_to,
+            in_progress,
+        ) in session.execute(stmt):
+            yield {
+                "id": id,
+                "date": date.isoformat(sep=" ", timespec="seconds"),
+                "label": label,
+                "amount": amount,
+                "type": (
+                    "transfer" if is_transfer else "income" if is_income else "expense"
+                ),
+                "account": account,
+                "category": category or "",
+                "parentCategory": parent_category or "",
+                "transferToAccount": transfer_to or "",
+                "isInProgress": bool(in_progress),
+            }
+    finally:
+        session.close()
+
+
+def _write_csv(rows: Iterator[dict], out: IO[str]) -> int:
+    writer = csv.DictWriter(out, fieldnames=FIELDS)
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _write_jsonl(rows: Iterator[dict], out: IO[str]) -> int:
+    count = 0
+    for row in rows:
+        out.write(json.dumps(row, ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def _open_output(path: str | Path | None, compress: bool) -> IO[str]:
+    if path is None or str(path) == "-":
+        if compress:
+            return io.TextIOWrapper(
+                gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb"),
+                encoding="utf-8",
+                newline="",
+            )
+        return io.TextIOWrapper(
+            sys.stdout.buffer, encoding="utf-8", newline="", write_through=True
+        )
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def export_records(
+    path: str | Path | None = None,
+    format: ExportFormat = "csv",
+    compress: bool | None = None,
+    *,
+    offset: int | None = None,
+    offset_type: str = "month",
+    start: datetime | None = None,
+    end: datetime | None = None,
+    account_id: int | None = None,
+    category_id: int | None = None,
+    kind: RecordKind | None = None,
+    chunk_size: int = 1000,
+) -> int:
+    """Write matching records to `path` (stdout when None or "-") and return
+    how many were written.
+
+    The period is either `offset`/`offset_type` as used across the app, or an
+    explicit `start`/`end` range. `compress` defaults to whether `path` ends
+    in ".gz".
+    """
+    if offset is not None:
+        start, end = get_start_end_of_period(offset, offset_type)
+    if compress is None:
+        compress = path is not None and str(path).endswith(".gz")
+
+    rows = iter_export_rows(start, end, account_id, category_id, kind, chunk_size)
+    write = _write_jsonl if format == "jsonl" else _write_csv
+    out = _open_output(path, compress)
+    try:
+        return write(rows, out)
+    finally:
+        if out.buffer is sys.stdout.buffer:
+            # Leave stdout itself open for the caller
+            out.flush()
+            out.detach()
+        else:
+            out.close()
@@ -0,0 +1,172 @@
+"""Record filter language, compiled to SQLAlchemy predicates.
+
+    amount>50 cat:Food acct:Visa label:~coffee income before:2026-01 after:2025-06
+
+Terms are ANDed; prefix one with "-" to negate it.
+
+    amount<op>N       op is one of > >= < <= = (also "amount:>=N")
+    cat:NAME          category or any of its subcategories (also "category:")
+    acct:NAME         account, on either side of a transfer (also "account:")
+    label:~TEXT       label contains TEXT; "label:TEXT" matches it exactly
+    income | expense | transfer
+    after:DATE        on or after the start of DATE
+    before:DATE       before the start of DATE
+    WORD              same as label:~WORD
+
+Names and labels compare case-insensitively; quote values with spaces
+(cat:"Eating out"). DATE is YYYY, YYYY-MM or YYYY-MM-DD.
+
+Names are resolved in SQL subqueries, not looked up here, so a compiled
+filter never goes stale and can be cached per filter string.
+"""
+from __future__ import annotations
+
+import shlex
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import false, func, not_, or_, select
+from sqlalchemy.sql.elements import ColumnElement
+
+from Buckets.managers.utils import get_operator_amount
+from Buckets.models.account import Account
+from Buckets.models.category import Category
+from Buckets.models.record import Record
+
+
+class FilterError(ValueError):
+    """Raised for filter strings that cannot be parsed."""
+
+
+@dataclass(frozen=True, slots=True)
+class RecordFilter:
+    text: str
+    clauses: tuple[ColumnElement, ...]
+
+    def __bool__(self) -> bool:
+        return bool(self.clauses)
+
+    def apply(self, query):
+        """Add the predicates to a `select()` or legacy `Query`."""
+        return query.filter(*self.clauses) if self.clauses else query
+
+
+_NO_FILTER = RecordFilter("", ())
+
+
+def _parse_date(value: str) -> datetime:
+    for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise FilterError(f"Invalid date {value!r}, expected YYYY, YYYY-MM or YYYY-MM-DD")
+
+
+def _named(model, name: str):
+    # Never correlated: queries that join category or account must not
+    # turn these lookups into conditions on their own rows
+    return (
+        select(model.id)
+        .where(func.casefold(model.name) == name.casefold())
+        .correlate(None)
+    )
+
+
+def _category(name: str) -> ColumnElement:
+    ids = _named(Category, name)
+    return Record.categoryId.in_(
+        select(Category.id)
+        .where(or_(Category.id.in_(ids), Category.parentCategoryId.in_(ids)))
+        .correlate(None)
+    )
+
+
+def _account(name: str) -> ColumnElement:
+    ids = _named(Account, name)
+    return or_(Record.accountId.in_(ids), Record.transferToAccountId.in_(ids))
+
+
+def _label_contains(text: str) -> ColumnElement:
+    return func.casefold(Record.label).contains(text.casefold(), autoescape=True)
+
+
+def _label(value: str) -> ColumnElement:
+    if value.startswith("~"):
+        return _label_contains(value[1:])
+    return func.casefold(Record.label) == value.casefold()
+
+
+def _amount(value: str) -> ColumnElement:
+    op, amount = get_operator_amount(value)
+    if op is None:
+        raise FilterError(f"Invalid amount filter {value!r}, e.g. amount>=12.5")
+    column = Record.amount
+    return {
+        ">": column > amount,
+        ">=": column >= amount,
+        "<": column < amount,
+        "<=": column <= amount,
+        "=": column == amount,
+    }[op]
+
+
+_FLAGS = {
+    "income": lambda: Record.isIncome == True,  # noqa: E712
+    "expense": lambda: (Record.isIncome == False) & (Record.isTransfer == False),  # noqa: E712
+    "transfer": lambda: Record.isTransfer == True,  # noqa: E712
+}
+
+_KEYS = {
+    "cat": _category,
+    "category": _category,
+    "acct": _account,
+    "account": _account,
+    "label": _label,
+    "after": lambda value: Record.date >= _parse_date(value),
+    "before": lambda value: Record.date < _parse_date(value),
+}
+
+
+def _negated(clause: ColumnElement) -> ColumnElement:
+    # A term over a NULL column (no category, not a transfer, no label) is
+    # NULL, and NOT NULL is NULL too; count those rows as not matching
+    return not_(func.coalesce(clause, false()))
+
+
+def _term(token: str) -> ColumnElement:
+    lowered = token.casefold()
+    if lowered in _FLAGS:
+        return _FLAGS[lowered]()
+    if lowered.startswith("amount") and token[6:7] in (":", ">", "<", "="):
+        return _amount(token[6:].lstrip(":"))
+    key, sep, value = token.partition(":")
+    if sep and key.casefold() in _KEYS:
+        if not value:
+            raise FilterError(f"Missing value for {key}:")
+        return _KEYS[key.casefold()](value)
+    return _label_contains(token)
+
+
+@lru_cache(maxsize=128)
+def compile_filter(text: str | None) -> RecordFilter:
+    """Parse `text` once into predicates. Raises FilterError."""
+    if not text or not text.strip():
+        return _NO_FILTER
+    try:
+        tokens = shlex.split(text)
+    except ValueError as e:
+        raise FilterError(str(e)) from e
+
+    clauses = []
+    for token in tokens:
+        negate = token.startswith("-") and len(token) > 1
+        clause = _term(token[1:] if negate else token)
+        clauses.append(_negated(clause) if negate else clause)
+    return RecordFilter(text, tuple(clauses))
+
+
+def apply_filter(query, text: str | None):
+    """`query` narrowed by the (cached) filter `text`; unchanged when empty."""
+    return compile_filter(text).apply(query)
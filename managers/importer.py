@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from Buckets.config import CONFIG, CsvImport
+from Buckets.managers import versions
+from Buckets.managers.label_index import record_label_rows
+from Buckets.models.category import Category
+from Buckets.models.database.app import WriteSession, db_engine
+from Buckets.models.record import Record, record_hash
+
+Session = sessionmaker(bind=db_engine)
+
+# (bytes read so far, total bytes)
+ProgressCallback = Callable[[int, int], None]
+
+
+class CsvImportError(ValueError):
+    """Raised when the file as a whole cannot be imported (e.g. missing columns)."""
+
+
+@dataclass
+class ImportResult:
+    read: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+    dry_run: bool = False
+
+    def summary(self) -> str:
+        verb = "Would import" if self.dry_run else "Imported"
+        text = (
+            f"{verb} {self.inserted} of {self.read} rows, "
+            f"{self.duplicates} duplicates skipped"
+        )
+        if self.errors:
+            text += f", {len(self.errors)} rows with errors"
+        return text
+
+
+class _RowParser:
+    def __init__(self, settings: CsvImport, account_id: int, session) -> None:
+        self.settings = settings
+        self.account_id = account_id
+        self.round_decimals = CONFIG.defaults.round_decimals
+        self._dates: dict[str, datetime] = {}
+        self._categories: dict[str, int] = {}
+        if settings.category_column:
+            self._categories = {
+                name.casefold(): id
+                for id, name in session.execute(
+                    select(Category.id, Category.name).where(
+                        Category.deletedAt.is_(None)
+                    )
+                )
+            }
+
+    def _date(self, value: str) -> datetime:
+        # Statements repeat the same dates many times; parse each once
+        parsed = self._dates.get(value)
+        if parsed is None:
+            parsed = datetime.strptime(value.strip(), self.settings.date_format)
+            self._dates[value] = parsed
+        return parsed
+
+    def _amount(self, value: str) -> Decimal:
+        text = value.strip().replace(" ", "").replace("\u00a0", "")
+        negative = text.startswith("(") and text.endswith(")")
+        text = text.strip("()")
+        if self.settings.decimal_separator == ",":
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            text = text.replace(",", "")
+        # Drop currency symbols and other decoration
+        text = "".join(ch for ch in text if ch.isdigit() or ch in ".-+")
+        amount = Decimal(text)
+        return -amount if negative else amount
+
+    def parse(self, row: dict[str, str]) -> dict:
+        settings = self.settings
+        label = (row.get(settings.label_column) or "").strip()
+        if not label:
+            raise ValueError("Missing label")
+        try:
+            amount = self._amount(row.get(settings.amount_column) or "")
+        except InvalidOperation:
+            raise ValueError(f"Invalid amount {row.get(settings.amount_column)!r}")
+        amount_value = round(float(abs(amount)), self.round_decimals)
+        # Checked after rounding: records must have a positive amount
+        if amount_value == 0:
+            raise ValueError("Zero amount")
+        date = self._date(row.get(settings.date_column) or "")
+
+        is_expense = (amount < 0) == settings.negative_is_expense
+        category_id = None
+        if settings.category_column:
+            category_id = self._categories.get(
+                (row.get(settings.category_column) or "").strip().casefold()
+            )
+
+        now = datetime.now()
+        return {
+            "label": label,
+            "amount": amount_value,
+            "date": date,
+            "accountId": self.account_id,
+            "categoryId": category_id,
+            "isIncome": not is_expense,
+            "isTransfer": False,
+            "isInProgress": False,
+            "createdAt": now,
+            "updatedAt": now,
+            "dedupeHash": record_hash(
+                self.account_id, date, amount_value, label, not is_expense
+            ),
+        }
+
+
+# Undecodable bytes (wrong `encoding`) and malformed CSV
+_READ_ERRORS = (UnicodeDecodeError, csv.Error)
+
+
+def _read_error(reader: csv.DictReader, error: Exception) -> CsvImportError:
+    return CsvImportError(
+        f"After line {reader.line_num}: {error} "
+        "(check csv_import.encoding and delimiter)"
+    )
+
+
+def _read(reader: csv.DictReader) -> Iterator[dict]:
+    """`reader`'s rows; a read error stops the import, leaving the chunks
+    before it imported."""
+    try:
+        yield from reader
+    except _READ_ERRORS as e:
+        raise _read_error(reader, e) from e
+
+
+def _chunks(reader: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    chunk: list[dict] = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_csv(
+    path: str | Path,
+    account_id: int,
+    settings: CsvImport | None = None,
+    dry_run: bool = False,
+    progress: ProgressCallback | None = None,
+) -> ImportResult:
+    """Stream a CSV file into records for `account_id`.
+
+    Rows are parsed and inserted in chunks of `settings.chunk_size`, one
+    transaction per chunk. A row is a duplicate when the database already
+    holds as many records with its hash as the file has produced so far, so
+    re-importing the same file inserts nothing while repeated identical lines
+    within a file are kept. With `dry_run` nothing is written.
+    """
+    settings = settings or CONFIG.csv_import
+    try:
+        codecs.lookup(settings.encoding)
+    except LookupError:
+        raise CsvImportError(f"Unknown encoding {settings.encoding!r}")
+    result = ImportResult(dry_run=dry_run)
+    total = os.path.getsize(path)
+
+    # hash -> records in the database before this import / seen in the file
+    db_counts: dict[str, int] = {}
+    file_counts: dict[str, int] = {}
+
+    # A dry run only reads; don't hold the write lock for the whole file
+    session = Session() if dry_run else WriteSession()
+    try:
+        parser = _RowParser(settings, account_id, session)
+        with open(path, newline="", encoding=settings.encoding) as f:
+            reader = csv.DictReader(f, delimiter=settings.delimiter)
+            required = {
+                settings.date_column,
+                settings.amount_column,
+                settings.label_column,
+            }
+            try:
+                fieldnames = reader.fieldnames
+            except _READ_ERRORS as e:
+                raise _read_error(reader, e) from e
+            missing = required - set(fieldnames or ())
+            if missing:
+                raise CsvImportError(f"Missing columns: {', '.join(sorted(missing))}")
+
+            line_number = 1
+            for chunk in _chunks(_read(reader), settings.chunk_size):
+                rows = []
+                for raw in chunk:
+                    line_number += 1
+                    result.read += 1
+                    try:
+                        rows.append(parser.parse(raw))
+                    except ValueError as e:
+                        result.errors.append((line_number, str(e)))
+
+                unseen = {row["dedupeHash"] for row in rows} - db_counts.keys()
+                if unseen:
+                    db_counts.update(dict.fromkeys(unseen, 0))
+                    db_counts.update(
+                        session.execute(
+                            select(Record.dedupeHash, func.count())
+                            .where(Record.dedupeHash.in_(unseen))
+                            .group_by(Record.dedupeHash)
+                        ).all()
+                    )
+
+                new_rows = []
+                for row in rows:
+                    key = row["dedupeHash"]
+                    file_counts[key] = file_counts.get(key, 0) + 1
+                    if file_counts[key] <= db_counts[key]:
+                        result.duplicates += 1
+                    else:
+                        new_rows.append(row)
+
+                if new_rows and not dry_run:
+                    session.execute(insert(Record), new_rows)
+                    record_label_rows(session, new_rows)
+                    session.commit()
+                result.inserted += len(new_rows)
+
+                if progress is not None:
+                    # Bytes handed to the decoder so far, like `total`
+                    progress(f.buffer.tell(), total)
+    finally:
+        session.close()
+        # Also after a read error: the chunks before it are committed
+        if result.inserted and not dry_run:
+            versions.bump("records", "balances")
+    return result
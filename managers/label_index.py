@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from Buckets.models.database.app import db_engine
+from Buckets.models.label_index import LabelIndex
+from Buckets.models.record import Record
+from Buckets.utils.format import normalize_label
+from Buckets.utils.query_guard import query_budget
+
+Session = sessionmaker(bind=db_engine)
+
+# Upper bound for the prefix range: sorts after any real character
+_PREFIX_END = "\U0010ffff"
+
+
+# ------------------------- Write -------------------------- #
+
+
+@query_budget(1)
+def record_label_use(session, record: Record, count: bool = True) -> None:
+    """Fold a record into the label index, inside the caller's transaction.
+
+    `count` adds a use; pass False when an existing record is edited without
+    its label changing, so only the predictions are refreshed.
+    """
+    if record.isTransfer or not record.label:
+        return
+    key = normalize_label(record.label)
+    if not key:
+        return
+
+    used_at = record.date or datetime.now()
+    entry = session.get(LabelIndex, key)
+    if entry is None:
+        entry = LabelIndex(key=key, useCount=0, lastUsedAt=used_at)
+        session.add(entry)
+    if count:
+        entry.useCount = (entry.useCount or 0) + 1
+
+    # The most recent use wins the predictions
+    if used_at >= entry.lastUsedAt:
+        entry.lastUsedAt = used_at
+        entry.label = record.label.strip()
+        entry.categoryId = record.categoryId
+        entry.accountId = record.accountId
+        entry.amount = record.amount
+        entry.isIncome = bool(record.isIncome)
+
+
+@query_budget(1)
+def record_label_unuse(session, record: Record, label: str | None = None) -> None:
+    """Take back one use of `label` (default: the record's), inside the
+    caller's transaction; a label nobody uses any more leaves the index."""
+    if record.isTransfer:
+        return
+    key = normalize_label(label if label is not None else record.label or "")
+    entry = session.get(LabelIndex, key) if key else None
+    if entry is None:
+        return
+    entry.useCount = (entry.useCount or 0) - 1
+    if entry.useCount <= 0:
+        session.delete(entry)
+
+
+@query_budget(1)
+def record_label_rows(session, rows: list[dict]) -> None:
+    """Bulk variant of `record_label_use` for plain record mappings
+    (e.g. importer batches); one index lookup for all their labels."""
+    latest: dict[str, dict] = {}
+    counts: dict[str, int] = {}
+    for row in rows:
+        key = normalize_label(row.get("label") or "")
+        if not key or row.get("isTransfer"):
+            continue
+        counts[key] = counts.get(key, 0) + 1
+        if key not in latest or row["date"] >= latest[key]["date"]:
+            latest[key] = row
+
+    if not latest:
+        return
+    entries = {
+        entry.key: entry
+        for entry in session.scalars(
+            select(LabelIndex).where(LabelIndex.key.in_(list(latest)))
+        )
+    }
+    for key, row in latest.items():
+        entry = entries.get(key)
+        if entry is None:
+            entry = LabelIndex(key=key, useCount=0, lastUsedAt=row["date"])
+            session.add(entry)
+        entry.useCount = (entry.useCount or 0) + counts[key]
+        if row["date"] >= entry.lastUsedAt:
+            entry.lastUsedAt = row["date"]
+            entry.label = row["label"].strip()
+            entry.categoryId = row.get("categoryId")
+            entry.accountId = row.get("accountId")
+            entry.amount = row.get("amount")
+            entry.isIncome = bool(row.get("isIncome"))
+
+
+@query_budget(3)
+def rebuild_label_index(session) -> None:
+    """Populate an empty index from existing records (one pass, oldest first)."""
+    if session.query(LabelIndex.key).first() is not None:
+        return
+
+    rows = session.execute(
+        select(
+            Record.label,
+            Record.date,
+            Record.categoryId,
+            Record.accountId,
+            Record.amount,
+            Record.isIncome,
+        )
+        .where(Record.isTransfer == False)  # noqa: E712
+        .order_by(Record.date)
+    )
+    entries: dict[str, dict] = {}
+    for label, date, category_id, account_id, amount, is_income in rows:
+        key = normalize_label(label or "")
+        if not key:
+            continue
+        entry = entries.setdefault(key, {"key": key, "useCount": 0})
+        entry.update(
+            label=label.strip(),
+            useCount=entry["useCount"] + 1,
+            lastUsedAt=date,
+            categoryId=category_id,
+            accountId=account_id,
+            amount=amount,
+            isIncome=bool(is_income),
+        )
+    if entries:
+        session.bulk_insert_mappings(LabelIndex, list(entries.values()))
+        session.commit()
+
+
+# -------------------------- Read -------------------------- #
+
+
+@query_budget(1)
+def search_labels(prefix: str, limit: int = 12) -> list[LabelIndex]:
+    """Labels starting with `prefix`, most used first. Predictions pointing
+    at a deleted category or account are left out."""
+    key = normalize_label(prefix)
+    if not key:
+        return []
+    session = Session()
+    try:
+        stmt = (
+            select(LabelIndex)
+            .where(LabelIndex.key >= key, LabelIndex.key < key + _PREFIX_END)
+            .options(joinedload(LabelIndex.category), joinedload(LabelIndex.account))
+            .order_by(LabelIndex.useCount.desc(), LabelIndex.lastUsedAt.desc())
+            .limit(limit)
+        )
+        entries = list(session.scalars(stmt))
+    finally:
+        session.close()
+    # Detached now, so clearing these only changes what gets prefilled
+    for entry in entries:
+        if entry.category is not None and entry.category.deletedAt is not None:
+            entry.categoryId = entry.category = None
+        if entry.account is not None and entry.account.deletedAt is not None:
+            entry.accountId = entry.account = None
+    return entries
@@ -1,18 +1,22 @@
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload, sessionmaker
 
-from Buckets.models.database.app import db_engine
+from Buckets.managers import versions
+from Buckets.managers.recurrence import schedule
+from Buckets.models.database.app import WriteSession, db_engine
 from Buckets.models.record_template import RecordTemplate
+from Buckets.utils.query_guard import query_budget
 
 Session = sessionmaker(bind=db_engine)
 
 # region c
 def create_template(data):
-    session = Session()
+    session = WriteSession()
     try:
-        new_template = RecordTemplate(**data)
+        new_template = RecordTemplate(**schedule(dict(data)))
         session.add(new_template)
         session.commit()
+        versions.bump("templates")
         session.refresh(new_template)
         session.expunge(new_template)
         return new_template
@@ -27,6 +31,7 @@ def create_template_from_record(record):
     return create_template(data)
 
 # region r
+@query_budget(1)
 def get_all_templates():
     session = Session()
     try:
@@ -42,6 +47,7 @@ def get_all_templates():
     finally:
         session.close()
 
+@query_budget(1)
 def get_record_templates():
     session = Session()
     try:
@@ -58,6 +64,7 @@ def get_record_templates():
     finally:
         session.close()
 
+@query_budget(1)
 def get_transfer_templates():
     session = Session()
     try:
@@ -74,6 +81,7 @@ def get_transfer_templates():
     finally:
         session.close()
 
+@query_budget(1)
 def get_template_by_id(recordtemplate_id) -> RecordTemplate:
     session = Session()
     try:
@@ -118,13 +126,14 @@ def get_adjacent_template(recordtemplate_id, direction):
 
 # region u
 def update_template(recordtemplate_id, data):
-    session = Session()
+    session = WriteSession()
     try:
         recordtemplate = session.get(RecordTemplate, recordtemplate_id)
         if recordtemplate:
-            for key, value in data.items():
+            for key, value in schedule(dict(data)).items():
                 setattr(recordtemplate, key, value)
             session.commit()
+            versions.bump("templates")
             session.refresh(recordtemplate)
             session.expunge(recordtemplate)
         return recordtemplate
@@ -132,7 +141,7 @@ def update_template(recordtemplate_id, data):
         session.close()
 
 def swap_template_order(recordtemplate_id, direction="next"):
-    session = Session()
+    session = WriteSession()
     try:
         recordtemplate = session.get(RecordTemplate, recordtemplate_id)
 
@@ -159,6 +168,7 @@ def swap_template_order(recordtemplate_id, direction="next"):
                 recordtemplate.order = -swap_template.order
                 swap_template.order = current_order
                 session.commit()
+                versions.bump("templates")
                 session.refresh(recordtemplate)
                 session.expunge(recordtemplate)
         return recordtemplate
@@ -167,7 +177,7 @@ def swap_template_order(recordtemplate_id, direction="next"):
 
 # region d
 def delete_template(recordtemplate_id):
-    session = Session()
+    session = WriteSession()
     try:
         recordtemplate = session.get(RecordTemplate, recordtemplate_id)
         if recordtemplate:
@@ -189,6 +199,7 @@ def delete_template(recordtemplate_id):
                 template.order = recordtemplate.order + i
 
             session.commit()
+            versions.bump("templates")
             return True
         return False
     finally:
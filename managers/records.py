@@ -2,37 +2,56 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 
-from sqlalchemy import func
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import joinedload, sessionmaker
 
+from Buckets.managers import versions
+from Buckets.managers.filters import apply_filter
+from Buckets.managers.label_index import (
+    normalize_label,
+    record_label_unuse,
+    record_label_use,
+)
 from Buckets.models.account import Account
 from Buckets.managers.utils import get_start_end_of_period
-from Buckets.models.database.app import db_engine
+from Buckets.models.database.app import WriteSession, db_engine
 from Buckets.models.record import Record
 from Buckets.models.bucket import Bucket
+from Buckets.utils.query_guard import query_budget
 
 Session = sessionmaker(bind=db_engine)
 
 # ------------------------- Create ------------------------- #
 
 
-def create_record(record_data: dict) -> Record:
-    session = Session()
+def create_record(record_data: dict, session=None) -> Record:
+    """Create a record. With a caller `session` the write is only flushed;
+    committing (and bumping versions) is left to the caller."""
+    own_session = session is None
+    if own_session:
+        session = WriteSession()
     try:
         record_data.setdefault("isInProgress", False)  # ✅ Fix here
         record = Record(**record_data)
         session.add(record)
+        record_label_use(session, record)
+        if not own_session:
+            session.flush()
+            return record
         session.commit()
+        versions.bump("records", "balances")
         session.refresh(record)
         session.expunge(record)
         return record
     finally:
-        session.close()
+        if own_session:
+            session.close()
 
 
 # -------------------------- Read -------------------------- #
 
 
+@query_budget(1)
 def get_record_by_id(record_id: int) -> Record | None:
     """Fetch a single record with category/account relations (no splits)."""
     session = Session()
@@ -51,10 +70,14 @@ def get_record_by_id(record_id: int) -> Record | None:
         session.close()
 
 
+@query_budget(1)
 def get_records(
     offset: int = 0,
     offset_type: str = "month",
+    record_filter: str | None = None,
 ) -> list[Record]:
+    """Records of a period, newest first, narrowed by `record_filter`
+    (see managers.filters). Raises FilterError for an invalid filter."""
     session = Session()
     try:
         query = session.query(Record).options(
@@ -68,6 +91,7 @@ def get_records(
             Record.date >= start_of_period,
             Record.date < end_of_period,
         )
+        query = apply_filter(query, record_filter)
 
         created_at_col = getattr(Record, "createdAt")
         date_col = func.date(getattr(Record, "date"))
@@ -123,6 +147,7 @@ def _daily_sums(
     return out
 
 
+@query_budget(1)
 def get_spending(start_date: datetime, end_date: datetime) -> list[float]:
     """Daily expense totals (no splits), excluding transfers."""
     session = Session()
@@ -133,6 +158,7 @@ def get_spending(start_date: datetime, end_date: datetime) -> list[float]:
         session.close()
 
 
+@query_budget(1)
 def get_spending_trend(start_date: datetime, end_date: datetime) -> list[float]:
     """Cumulative expense totals (no splits), excluding transfers."""
     session = Session()
@@ -146,6 +172,7 @@ def get_spending_trend(start_date: datetime, end_date: datetime) -> list[float]:
 # --------------------- Balance timeline ------------------- #
 
 
+@query_budget(3)
 def get_daily_balance(start_date: datetime, end_date: datetime) -> list[float]:
     """
     Daily total balance across all accounts.
@@ -154,23 +181,52 @@ def get_daily_balance(start_date: datetime, end_date: datetime) -> list[float]:
       - Add income amounts, subtract expense amounts.
       - Ignore transfers (net-zero within the system).
       - Iterate day-by-day from start_date to end_date (clamped to today).
+    Summed in SQL: one query for the balance before start_date and one
+    grouped by day, however long the range.
     """
     session = Session()
     try:
         # Starting balance
-        accounts = session.query(Account).filter(Account.deletedAt.is_(None)).all()
-        total_balance = sum(float(a.beginningBalance or 0.0) for a in accounts)
+        total_balance = float(
+            session.scalar(
+                select(func.coalesce(func.sum(Account.beginningBalance), 0.0)).where(
+                    Account.deletedAt.is_(None)
+                )
+            )
+        )
 
-        # Apply all records before start_date
-        old_records = session.query(Record).filter(Record.date < start_date).all()
+        net = func.sum(
+            case((Record.isIncome == True, Record.amount), else_=-Record.amount)  # noqa: E712
+        )
+        not_transfer = Record.isTransfer == False  # noqa: E712
 
-        def net_effect(r: Record) -> float:
-            if r.isTransfer:
-                return 0.0
-            return float(r.amount) if r.isIncome else -float(r.amount)
+        # Apply all records before start_date
+        total_balance += float(
+            session.scalar(
+                select(func.coalesce(net, 0.0)).where(
+                    not_transfer, Record.date < start_date
+                )
+            )
+        )
 
-        for r in old_records:
-            total_balance += net_effect(r)
+        day = func.date(Record.date)
+        per_day = {
+            datetime.strptime(key, "%Y-%m-%d").date(): float(value)
+            for key, value in session.execute(
+                select(day, net)
+                .where(
+                    not_transfer,
+                    Record.date >= start_date.replace(
+                        hour=0, minute=0, second=0, microsecond=0
+                    ),
+                    Record.date < end_date.replace(
+                        hour=0, minute=0, second=0, microsecond=0
+                    )
+                    + timedelta(days=1),
+                )
+                .group_by(day)
+            )
+        }
 
         # Build daily series
         results: list[float] = []
@@ -180,11 +236,7 @@ def get_daily_balance(start_date: datetime, end_date: datetime) -> list[float]:
         while cur <= end_date:
             if cur > today:
                 break
-            day_records = (
-                session.query(Record).filter(func.date(Record.date) == cur.date()).all()
-            )
-            day_delta = sum(net_effect(r) for r in day_records)
-            total_balance += day_delta
+            total_balance += per_day.get(cur.date(), 0.0)
             results.append(total_balance)
             cur += timedelta(days=1)
 
@@ -196,35 +248,57 @@ def get_daily_balance(start_date: datetime, end_date: datetime) -> list[float]:
 # ------------------------- Update ------------------------- #
 
 
-def update_record(record_id: int, updated_data: dict) -> Record | None:
-    session = Session()
+def update_record(record_id: int, updated_data: dict, session=None) -> Record | None:
+    own_session = session is None
+    if own_session:
+        session = WriteSession()
     try:
         record = session.query(Record).get(record_id)
         if record:
             payload = dict(updated_data)
             payload.pop("bucketId", None)  # ← prevent unexpected kw on setattr loop
+            previous_label = record.label or ""
 
             for k, v in payload.items():
                 setattr(record, k, v)
 
+            relabelled = normalize_label(record.label or "") != normalize_label(
+                previous_label
+            )
+            if relabelled:
+                record_label_unuse(session, record, previous_label)
+            record_label_use(session, record, count=relabelled)
+            if not own_session:
+                session.flush()
+                return record
             session.commit()
+            versions.bump("records", "balances")
             session.refresh(record)
             session.expunge(record)
         return record
     finally:
-        session.close()
+        if own_session:
+            session.close()
 
 
 # ------------------------- Delete ------------------------- #
 
 
-def delete_record(record_id: int) -> Record | None:
-    session = Session()
+def delete_record(record_id: int, session=None) -> Record | None:
+    own_session = session is None
+    if own_session:
+        session = WriteSession()
     try:
         record = session.query(Record).get(record_id)
         if record:
+            record_label_unuse(session, record)
             session.delete(record)
+            if not own_session:
+                session.flush()
+                return record
             session.commit()
+            versions.bump("records", "balances")
         return record
     finally:
-        session.close()
+        if own_session:
+            session.close()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import calendar
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import sessionmaker
+
+from Buckets.managers import versions
+from Buckets.managers.label_index import record_label_rows
+from Buckets.models.database.app import WriteSession, db_engine
+from Buckets.models.record import Record, record_hash
+from Buckets.models.record_template import RecordTemplate
+from Buckets.utils.query_guard import query_budget
+
+Session = sessionmaker(bind=db_engine)
+
+# recurrence -> meaning of `recurrenceDay`
+#   daily:   unused
+#   weekly:  weekday, 0 = Monday
+#   monthly: day of month, clamped to short months
+#   yearly:  day of month; the month is that of the first occurrence
+RULES = ("daily", "weekly", "monthly", "yearly")
+
+
+# ----------------------- Date rules ----------------------- #
+
+
+def _on_day(year: int, month: int, day: int) -> datetime:
+    return datetime(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+def default_day(rule: str, start: datetime) -> int | None:
+    """The rule day implied by a first occurrence on `start`."""
+    if rule == "weekly":
+        return start.weekday()
+    if rule in ("monthly", "yearly"):
+        return start.day
+    return None
+
+
+def first_occurrence(rule: str, day: int | None, start: datetime) -> datetime:
+    """Earliest occurrence on or after the day of `start`."""
+    start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    if day is None:
+        day = default_day(rule, start)
+    if rule == "weekly":
+        return start + timedelta(days=(day - start.weekday()) % 7)
+    if rule in ("monthly", "yearly"):
+        candidate = _on_day(start.year, start.month, day)
+        if candidate < start:
+            candidate = next_occurrence(rule, day, candidate)
+        return candidate
+    return start
+
+
+def next_occurrence(rule: str, day: int | None, current: datetime) -> datetime:
+    """The occurrence following `current`."""
+    if rule == "weekly":
+        return current + timedelta(weeks=1)
+    if rule == "monthly":
+        year = current.year + current.month // 12
+        month = current.month % 12 + 1
+        return _on_day(year, month, day or current.day)
+    if rule == "yearly":
+        return _on_day(current.year + 1, current.month, day or current.day)
+    return current + timedelta(days=1)
+
+
+def schedule(data: dict) -> dict:
+    """Normalize the recurrence fields of template `data` in place.
+
+    Accepts `recurrence` (one of RULES, or None/"none" for manual templates),
+    an optional explicit `recurrenceDay` and an optional `recurrenceStart`
+    (defaults to today), and sets `nextDueAt` to the first occurrence.
+    Data without a `recurrence` key is left alone.
+    """
+    start = data.pop("recurrenceStart", None)
+    if "recurrence" not in data:
+        return data
+    rule = data["recurrence"]
+    if rule not in RULES:
+        data.update(recurrence=None, recurrenceDay=None, nextDueAt=None)
+        return data
+
+    start = start or datetime.now()
+    day = data.get("recurrenceDay")
+    if day is None:
+        day = default_day(rule, start)
+    data["recurrenceDay"] = day
+    data["nextDueAt"] = first_occurrence(rule, day, start)
+    return data
+
+
+# ------------------------ Catch-up ------------------------ #
+
+
+def _record_row(template: RecordTemplate, date: datetime) -> dict:
+    row = template.to_dict()
+    row.update(
+        date=date,
+        isInProgress=False,
+        dedupeHash=record_hash(
+            template.accountId,
+            date,
+            template.amount,
+            template.label,
+            bool(template.isIncome),
+        ),
+    )
+    return row
+
+
+# Due templates, record insert, label lookup, then the flush: template
+# updates and label index inserts/updates, batched per column set
+@query_budget(8)
+def generate_due_records(now: datetime | None = None) -> int:
+    """Create every occurrence due up to `now` and return how many.
+
+    Only templates whose indexed `nextDueAt` has passed are loaded, so the
+    cost does not grow with the number of rules. All missed occurrences are
+    inserted and the templates advanced in a single transaction.
+    """
+    now = now or datetime.now()
+    session = WriteSession()
+    try:
+        due = session.scalars(
+            select(RecordTemplate)
+            .where(RecordTemplate.nextDueAt <= now)
+            .order_by(RecordTemplate.nextDueAt)
+        ).all()
+        if not due:
+            return 0
+
+        rows: list[dict] = []
+        for template in due:
+            if template.recurrence not in RULES:
+                template.nextDueAt = None
+                continue
+            while template.nextDueAt <= now:
+                rows.append(_record_row(template, template.nextDueAt))
+                template.nextDueAt = next_occurrence(
+                    template.recurrence, template.recurrenceDay, template.nextDueAt
+                )
+
+        if rows:
+            session.execute(insert(Record), rows)
+            record_label_rows(session, rows)
+        session.commit()
+    finally:
+        session.close()
+
+    versions.bump("templates")
+    if rows:
+        versions.bump("records", "balances")
+    return len(rows)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from Buckets.models.database.app import db_engine
+from Buckets.models.database.fts import TABLE, fts_available
+from Buckets.models.record import Record
+from Buckets.utils.query_guard import query_budget
+
+Session = sessionmaker(bind=db_engine)
+
+PAGE_SIZE = 50
+
+_WORD = re.compile(r"\w+")
+
+
+@dataclass
+class SearchPage:
+    records: list[Record] = field(default_factory=list)
+    terms: list[str] = field(default_factory=list)
+    has_more: bool = False
+
+
+def search_terms(query: str) -> list[str]:
+    """Casefolded words of `query`; each is matched as a prefix."""
+    return _WORD.findall(query.casefold())
+
+
+def highlight_spans(label: str, terms: list[str]) -> list[tuple[int, int]]:
+    """(start, end) of every word in `label` that starts with one of `terms`."""
+    spans = []
+    for word in _WORD.finditer(label):
+        folded = word.group().casefold()
+        length = max((len(t) for t in terms if folded.startswith(t)), default=0)
+        if length:
+            length = min(length, len(word.group()))
+            spans.append((word.start(), word.start() + length))
+    return spans
+
+
+def _ranked_ids(session, terms: list[str], offset: int, limit: int) -> list[int]:
+    if fts_available():
+        # Every term must match as a word prefix, in any indexed column.
+        # All matches are ranked, so pages follow one stable order
+        match = " ".join(f'"{term}"*' for term in terms)
+        return list(
+            session.scalars(
+                text(
+                    f"SELECT rowid FROM {TABLE} WHERE {TABLE} MATCH :match "
+                    "ORDER BY rank, rowid DESC LIMIT :limit OFFSET :offset"
+                ),
+                {"match": match, "limit": limit, "offset": offset},
+            )
+        )
+
+    stmt = select(Record.id)
+    for term in terms:
+        stmt = stmt.where(Record.label.contains(term, autoescape=True))
+    stmt = stmt.order_by(Record.date.desc()).offset(offset).limit(limit)
+    return list(session.scalars(stmt))
+
+
+@query_budget(2)
+def search_records(query: str, offset: int = 0, limit: int = PAGE_SIZE) -> SearchPage:
+    """Records matching `query` across all time, best matches first.
+
+    Label hits rank above category and account hits. `has_more` tells
+    whether another page follows `offset + limit`.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return SearchPage()
+
+    session = Session()
+    try:
+        ids = _ranked_ids(session, terms, offset, limit + 1)
+        has_more = len(ids) > limit
+        ids = ids[:limit]
+        if not ids:
+            return SearchPage(terms=terms)
+
+        records = session.scalars(
+            select(Record)
+            .where(Record.id.in_(ids))
+            .options(
+                joinedload(Record.category),
+                joinedload(Record.account),
+                joinedload(Record.transferToAccount),
+            )
+        ).all()
+        by_id = {record.id: record for record in records}
+        return SearchPage(
+            records=[by_id[id] for id in ids if id in by_id],
+            terms=terms,
+            has_more=has_more,
+        )
+    finally:
+        session.close()
@@ -4,26 +4,17 @@ from __future__ import annotations
 import re
 from datetime import datetime, timedelta
 
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import sessionmaker
-from textual.widget import Widget
 
 from Buckets.config import CONFIG
 from Buckets.models.category import Category
 from Buckets.models.database.app import db_engine
 from Buckets.models.record import Record
+from Buckets.utils.query_guard import query_budget
 
 Session = sessionmaker(bind=db_engine)
 
-# ---------------- UI helper ---------------- #
-
-def try_method_query_one(widget: Widget, query: str, method: str, params) -> None:
-    """Safely find a descendant widget and call a method on it (ignore errors)."""
-    try:
-        target = widget.query_one(query)
-        getattr(target, method)(*params)
-    except Exception:
-        return
-
 # ------------- period helpers -------------- #
 
 def _get_start_end_of_year(offset: int = 0) -> tuple[datetime, datetime]:
@@ -73,6 +64,7 @@ def get_start_end_of_period(
     # default month
     return _get_start_end_of_month(offset)
 
+@query_budget(1)
 def get_period_figures(
     accountId: int | None = None,
     offset_type: str | None = None,
@@ -80,34 +72,39 @@ def get_period_figures(
     isIncome: bool | None = None,
     nature=None,
     session=None,
+    record_filter: str | None = None,
 ) -> float:
     """
-    Total income/expense for a period.
+    Total income/expense for a period, summed in SQL.
     - Excludes transfers.
     - No split logic.
+    - `record_filter` narrows the records (see managers.filters).
     """
+    from Buckets.managers.filters import apply_filter
+
     own_session = False
     if session is None:
         session = Session()
         own_session = True
     try:
-        q = session.query(Record)
+        signed = case((Record.isIncome == True, Record.amount), else_=-Record.amount)  # noqa: E712
+        stmt = select(func.coalesce(func.sum(signed), 0.0)).filter(
+            Record.isTransfer == False  # noqa: E712
+        )
         if accountId is not None:
-            q = q.filter(Record.accountId == accountId)
+            stmt = stmt.filter(Record.accountId == accountId)
         if offset_type is not None and offset is not None:
             start, end = get_start_end_of_period(offset, offset_type)
-            q = q.filter(Record.date >= start, Record.date < end)
+            stmt = stmt.filter(Record.date >= start, Record.date < end)
+        if isIncome is not None:
+            stmt = stmt.filter(Record.isIncome == isIncome)
         if nature is not None:
-            q = q.join(Record.category).filter(Category.nature == nature)
-
-        total = 0.0
-        for r in q.all():
-            if r.isTransfer:
-                continue
-            if isIncome is not None and r.isIncome != isIncome:
-                continue
-            total += r.amount if r.isIncome else -r.amount
+            stmt = stmt.join(Category, Record.categoryId == Category.id).filter(
+                Category.nature == nature
+            )
+        stmt = apply_filter(stmt, record_filter)
 
+        total = session.scalar(stmt) or 0.0
         return abs(round(total, CONFIG.defaults.round_decimals))
     finally:
         if own_session:
@@ -0,0 +1,30 @@
+# Buckets/managers/versions.py
+from __future__ import annotations
+
+# Monotonic per-table data versions. Every manager write bumps the tables it
+# touched so views can tell whether what they last rendered is stale.
+_versions: dict[str, int] = {
+    "accounts": 0,
+    "categories": 0,
+    "records": 0,
+    "templates": 0,
+    "buckets": 0,
+    # Derived: account balances, bumped by record and account writes
+    "balances": 0,
+}
+
+def bump(*names: str) -> None:
+    """Mark the given tables as changed."""
+    for name in names:
+        _versions[name] = _versions.get(name, 0) + 1
+
+def get_version(name: str) -> int:
+    return _versions.get(name, 0)
+
+def snapshot() -> dict[str, int]:
+    """Copy of all current versions, to be compared later with `changed_since`."""
+    return dict(_versions)
+
+def changed_since(before: dict[str, int]) -> set[str]:
+    """Names of tables bumped since `before` was taken."""
+    return {name for name, v in _versions.items() if before.get(name) != v}
@@ -0,0 +1,67 @@
+# Buckets/managers/watcher.py
+"""Notice writes to the database file, including other processes'.
+
+`PRAGMA data_version` on a dedicated connection changes whenever another
+connection commits, so polling it costs one tiny statement. When it moves,
+the change counters (models/database/changes.py) tell which tables were
+written. The counters can't tell this process's commits from others', so
+a table written locally is reported too; refreshing it again is cheap,
+missing another process's write to it is not.
+"""
+from __future__ import annotations
+
+import sqlite3
+
+from Buckets.managers import versions
+from Buckets.models.database.app import BUSY_TIMEOUT, DB_PATH
+from Buckets.models.database.changes import TABLE
+
+# Table -> the data versions its writes change
+TABLE_VERSIONS: dict[str, tuple[str, ...]] = {
+    "record": ("records", "balances"),
+    "account": ("accounts", "balances"),
+    "category": ("categories",),
+    "record_template": ("templates",),
+    "bucket": ("buckets",),
+}
+
+
+class ChangeWatcher:
+    def __init__(self, path=DB_PATH) -> None:
+        # Autocommit, so no read transaction is held between polls
+        self._conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        self._data_version = self._read_data_version()
+        self._counters = self._read_counters()
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _read_counters(self) -> dict[str, int]:
+        return dict(self._conn.execute(f"SELECT name, version FROM {TABLE}"))
+
+    def poll(self) -> set[str]:
+        """Data versions of the tables written since the last poll, bumped
+        here so hidden pages catch up too."""
+        data_version = self._read_data_version()
+        if data_version == self._data_version:
+            return set()
+        self._data_version = data_version
+
+        counters = self._read_counters()
+        written = {
+            table
+            for table, version in counters.items()
+            if self._counters.get(table) != version
+        }
+        self._counters = counters
+        changed = {
+            name
+            for table in written
+            for name in TABLE_VERSIONS.get(table, ())
+        }
+        if changed:
+            versions.bump(*changed)
+        return changed
+
+    def close(self) -> None:
+        self._conn.close()
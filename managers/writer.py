@@ -0,0 +1,180 @@
+# Buckets/managers/writer.py
+"""Single database writer thread with group commit.
+
+Optional (`database.writer` in the config). Writes are submitted as a
+manager function taking a `session` keyword, plus the data versions it
+touches:
+
+    future = writer.submit(create_record, data, tables=("records", "balances"))
+
+The writer runs everything queued within `window` seconds of the first
+write in one transaction, so a burst of template hotkeys costs one commit
+(and one fsync) instead of one per record. After the commit it bumps the
+versions, calls the listeners with the changed set and resolves the
+futures. If any write of a batch fails, the batch is rolled back and its
+writes are retried one transaction each, so only the failing one errors.
+
+Listeners run on the writer thread; the app hands them to its loop.
+"""
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+import time
+import warnings
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from sqlalchemy.orm import sessionmaker
+
+from Buckets.managers import versions
+from Buckets.models.database.app import write_engine
+
+# Objects stay loaded after commit; they are detached before being returned
+Session = sessionmaker(bind=write_engine, expire_on_commit=False)
+
+MAX_BATCH = 500
+
+_queue: queue.Queue[_Write | None] = queue.Queue()
+_thread: threading.Thread | None = None
+_window = 0.005
+_listeners: list[Callable[[set[str]], None]] = []
+
+
+@dataclass
+class _Write:
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    tables: tuple[str, ...]
+    future: Future = field(default_factory=Future)
+
+
+def running() -> bool:
+    return _thread is not None
+
+
+def add_listener(listener: Callable[[set[str]], None]) -> None:
+    """Call `listener` with the changed versions after every commit."""
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Callable[[set[str]], None]) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def submit(
+    fn: Callable[..., Any], *args, tables: tuple[str, ...] = (), **kwargs
+) -> Future:
+    """Queue `fn(*args, session=..., **kwargs)`; resolves after the commit.
+    Without a running writer the call runs here in its own transaction."""
+    write = _Write(fn, args, kwargs, tables)
+    if _thread is None:
+        _run_batch([write])
+    else:
+        _queue.put(write)
+    return write.future
+
+
+# ------------------------- Thread ------------------------- #
+
+
+def start(window_ms: float = 5) -> None:
+    global _thread, _window
+    if _thread is not None:
+        return
+    _window = window_ms / 1000
+    _thread = threading.Thread(target=_loop, name="buckets-db-writer", daemon=True)
+    _thread.start()
+    atexit.register(stop)
+
+
+def stop(timeout: float = 10) -> None:
+    """Commit what is queued and stop the thread."""
+    global _thread
+    if _thread is None:
+        return
+    _queue.put(None)
+    _thread.join(timeout)
+    _thread = None
+
+
+def _loop() -> None:
+    while True:
+        first = _queue.get()
+        if first is None:
+            return
+        batch = [first]
+        stopping = False
+        deadline = time.monotonic() + _window
+        while len(batch) < MAX_BATCH:
+            try:
+                write = _queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if write is None:
+                stopping = True
+                break
+            batch.append(write)
+        try:
+            _run_batch(batch)
+        except Exception as e:
+            # Futures are resolved by now; keep serving the queue
+            warnings.warn(f"Database writer batch failed: {e!r}")
+        if stopping:
+            return
+
+
+def _commit(batch: list[_Write]) -> list[Any]:
+    session = Session()
+    try:
+        results = [
+            write.fn(*write.args, session=session, **write.kwargs) for write in batch
+        ]
+        session.commit()
+        session.expunge_all()
+        return results
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def _notify(changed: set[str]) -> None:
+    if not changed:
+        return
+    versions.bump(*changed)
+    for listener in list(_listeners):
+        try:
+            listener(changed)
+        except Exception as e:
+            # The data is committed; a failing listener mustn't lose that
+            warnings.warn(f"Database writer listener {listener!r} failed: {e!r}")
+
+
+def _run_batch(batch: list[_Write]) -> None:
+    done: list[tuple[_Write, Any]] = []
+    try:
+        try:
+            done = list(zip(batch, _commit(batch)))
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0].future.set_exception(e)
+                return
+            for write in batch:
+                try:
+                    done.append((write, _commit([write])[0]))
+                except Exception as e:
+                    write.future.set_exception(e)
+        _notify({table for write, _ in done for table in write.tables})
+    finally:
+        # Every caller hears back, whatever failed above
+        for write, result in done:
+            write.future.set_result(result)
+        for write in batch:
+            if not write.future.done():
+                write.future.set_exception(RuntimeError("Write was not committed"))
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from textual import events
+from textual.app import ComposeResult
+from textual.widgets import Label, ProgressBar
+
+from Buckets.components.fields import Fields
+from Buckets.forms.import_form import ImportForm
+from Buckets.managers.importer import CsvImportError, ImportResult, import_csv
+from Buckets.modals.base_widget import ModalContainer
+from Buckets.modals.input import InputModal
+from Buckets.utils.validation import validateForm
+
+class ImportModal(InputModal):
+    """Pick a CSV file and account; the import runs in a worker thread with progress.
+
+    Dismisses with the last non-dry-run `ImportResult` (or None)."""
+
+    def __init__(self, default_account_id: int | None = None):
+        super().__init__("Import CSV", ImportForm().get_form(default_account_id))
+        self.running = False
+        self.result: ImportResult | None = None
+
+    def on_key(self, event: events.Key):
+        if event.key == "escape":
+            # Replaces InputModal's dismiss(None): report what was imported
+            event.prevent_default()
+            if not self.running:
+                self.dismiss(self.result)
+
+    def action_submit(self):
+        if self.running:
+            return
+        if self.result is not None:
+            # Already imported; enter closes
+            self.dismiss(self.result)
+            return
+
+        result_form, errors, is_valid = validateForm(self, self.form)
+        for error in self.query(".error"):
+            error.remove()
+        if not is_valid:
+            for key, value in errors.items():
+                self.query_one(f"#row-field-{key}").mount(Label(value, classes="error"))
+            return
+
+        path = Path(result_form["path"]).expanduser()
+        dry_run = bool(result_form.get("dryRun"))
+        self.running = True
+        self.query_one("#import-status", Label).update("Reading…")
+        self.run_worker(
+            lambda: self._run_import(path, int(result_form["accountId"]), dry_run),
+            thread=True,
+            exclusive=True,
+        )
+
+    def _run_import(self, path: Path, account_id: int, dry_run: bool) -> None:
+        bar = self.query_one("#import-progress", ProgressBar)
+
+        def progress(done: int, total: int) -> None:
+            self.app.call_from_thread(bar.update, total=total, progress=min(done, total))
+
+        try:
+            result = import_csv(path, account_id, dry_run=dry_run, progress=progress)
+        except (CsvImportError, OSError) as e:
+            self.app.call_from_thread(self._finish, None, str(e))
+        else:
+            self.app.call_from_thread(self._finish, result, None)
+
+    def _finish(self, result: ImportResult | None, error: str | None) -> None:
+        self.running = False
+        status = self.query_one("#import-status", Label)
+        if error is not None:
+            status.update(f"Import failed: {error}")
+            return
+        message = result.summary()
+        if result.errors:
+            line, reason = result.errors[0]
+            message += f"\nFirst error, line {line}: {reason}"
+        if not result.dry_run:
+            self.result = result
+            message += "\nPress enter to close."
+        status.update(message)
+
+    def compose(self) -> ComposeResult:
+        yield ModalContainer(
+            Fields(self.form),
+            ProgressBar(id="import-progress", show_eta=False),
+            Label("", id="import-status"),
+        )
@@ -0,0 +1,69 @@
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import ModalScreen
+from textual.widgets import DataTable, Label
+
+from Buckets.modals.base_widget import ModalContainer
+from Buckets.utils import instrumentation
+
+class InstrumentationModal(ModalScreen):
+    """Latest actions with their time, SQL query count and slowest statement."""
+
+    DEFAULT_CSS = """\
+InstrumentationModal #instrumentation-table {
+    height: auto;
+    max-height: 24;
+}
+    """
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "Close"),
+        Binding("c", "clear", "Clear"),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(
+            id="instrumentation-modal-screen", classes="modal-screen", *args, **kwargs
+        )
+        self._shown: tuple[int, int] | None = None
+
+    def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.add_columns("Action", "ms", "Queries", "Rows", "Slowest (ms)", "Statement")
+        self.refresh_table()
+        self.set_interval(1.0, self.refresh_table)
+
+    def refresh_table(self) -> None:
+        history = instrumentation.history
+        # Actions only ever append, so the same length and last entry means
+        # nothing new
+        shown = (len(history), id(history[-1]) if history else 0)
+        if shown == self._shown:
+            return
+        self._shown = shown
+        table = self.query_one(DataTable)
+        table.clear()
+        for trace in reversed(history):
+            table.add_row(
+                trace.name,
+                f"{trace.ms:.1f}",
+                str(trace.queries),
+                str(trace.rows),
+                f"{trace.slowest_ms:.1f}",
+                trace.slowest_sql[:80],
+            )
+        total_queries = sum(trace.queries for trace in history)
+        self.query_one("#instrumentation-summary", Label).update(
+            f"{len(history)} actions, {total_queries} queries"
+        )
+
+    def action_clear(self) -> None:
+        instrumentation.history.clear()
+        self.refresh_table()
+
+    def compose(self) -> ComposeResult:
+        yield ModalContainer(
+            Label("", id="instrumentation-summary"),
+            DataTable(id="instrumentation-table", cursor_type="row", zebra_stripes=True),
+            custom_classes="wrapper",
+        )
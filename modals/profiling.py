@@ -0,0 +1,85 @@
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import ModalScreen
+from textual.widgets import DataTable, Label
+
+from Buckets.modals.base_widget import ModalContainer
+from Buckets.utils import profiling
+
+class ProfilingModal(ModalScreen):
+    """Captured action profiles; the highlighted one's top functions by
+    cumulative time below."""
+
+    DEFAULT_CSS = """\
+ProfilingModal #profiling-actions {
+    height: auto;
+    max-height: 10;
+}
+ProfilingModal #profiling-functions {
+    height: auto;
+    max-height: 20;
+}
+    """
+
+    BINDINGS = [
+        Binding("escape", "dismiss", "Close"),
+        Binding("c", "clear", "Clear"),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(
+            id="profiling-modal-screen", classes="modal-screen", *args, **kwargs
+        )
+
+    def on_mount(self) -> None:
+        self.query_one("#profiling-actions", DataTable).add_columns(
+            "Action", "ms", "File"
+        )
+        self.query_one("#profiling-functions", DataTable).add_columns(
+            "Function", "Calls", "Own (ms)", "Cumulative (ms)"
+        )
+        self.refresh_tables()
+
+    def refresh_tables(self) -> None:
+        actions = self.query_one("#profiling-actions", DataTable)
+        actions.clear()
+        for index, result in reversed(list(enumerate(profiling.history))):
+            actions.add_row(
+                result.name, f"{result.ms:.1f}", result.path.name, key=str(index)
+            )
+        self.query_one("#profiling-summary", Label).update(
+            f"{len(profiling.history)} profiles in {profiling.directory.resolve()}"
+            f" — capture is {'on' if profiling.ACTIVE else 'off'}"
+        )
+        self._show_functions(len(profiling.history) - 1)
+
+    def _show_functions(self, index: int) -> None:
+        functions = self.query_one("#profiling-functions", DataTable)
+        functions.clear()
+        if not 0 <= index < len(profiling.history):
+            return
+        for row in profiling.history[index].top:
+            functions.add_row(
+                row.name[-90:],
+                str(row.calls),
+                f"{row.own_ms:.1f}",
+                f"{row.cumulative_ms:.1f}",
+            )
+
+    @on(DataTable.RowHighlighted, "#profiling-actions")
+    def _on_action_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        if event.row_key.value is not None:
+            self._show_functions(int(event.row_key.value))
+
+    def action_clear(self) -> None:
+        profiling.history.clear()
+        self.refresh_tables()
+
+    def compose(self) -> ComposeResult:
+        yield ModalContainer(
+            Label("", id="profiling-summary"),
+            DataTable(id="profiling-actions", cursor_type="row", zebra_stripes=True),
+            DataTable(id="profiling-functions", cursor_type="row", zebra_stripes=True),
+            custom_classes="wrapper",
+        )
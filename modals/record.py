@@ -44,6 +44,28 @@ class RecordModal(InputModal):
         self.date = date
         self.shift_pressed = False  # used for "Submit & Template"
 
+    @classmethod
+    def reusable(cls, app, name: str = "new-record") -> "RecordModal":
+        """The app-wide installed new-record modal, created on first use."""
+        if not app.is_screen_installed(name):
+            app.install_screen(
+                cls("New Record", form=RecordForm().get_form(default_values={})), name
+            )
+        return app.get_screen(name, cls)
+
+    def reset(self, form: Form, date: datetime) -> None:
+        """Prepare for another show: fresh form defaults, no errors, focus on top."""
+        self.form = form
+        self.date = date
+        self.shift_pressed = False
+        if not self.is_mounted:
+            return  # composes from self.form on first push
+        for error in self.query(".error"):
+            error.remove()
+        self.query_one(Fields).reset(form)
+        self._sync_bucket_visibility()
+        self.set_focus(None)
+
     def _update_errors(self, errors: dict) -> None:
         # Clear previous error labels
         previousErrors = self.query(".error")
@@ -56,47 +78,57 @@ class RecordModal(InputModal):
 
     def on_auto_complete_selected(self, event) -> None:
         """
-        If the label field is an autocomplete and user selects a template,
-        populate the rest of the fields from that template.
+        If the label field is an autocomplete and user selects a template or a
+        previously used label, populate the rest of the fields from it.
         """
         if "field-label" not in event.input.id:
             return
 
+        history = event.item.payload
+        if history is not None:
+            self._prefill(history)
+            return
+
         template = get_template_by_id(event.input.heldValue)
         if not template:
             return
 
+        self._prefill(template)
+        self.app.notify(
+            title="Success",
+            message="Template applied",
+            severity="information",
+            timeout=3,
+        )
+
+    def _prefill(self, source) -> None:
+        """Copy matching attributes of `source` into the fields after the label."""
         for field in self.form.fields[1:-1]:
+            value = getattr(source, field.key, None)
+            if value is None:
+                continue
             has_held_value = field.type in ["autocomplete"]
             field_widget = self.query_one(f"#field-{field.key}")
             if not has_held_value:
                 if field.type == "boolean":
-                    field_widget.value = getattr(template, field.key)
+                    field_widget.value = value
                 else:
-                    field_widget.value = str(getattr(template, field.key))
+                    field_widget.value = str(value)
             else:
                 # Autocomplete-backed field
-                field_widget.heldValue = getattr(template, field.key)
+                field_widget.heldValue = value
                 if "Id" in field.key:
                     # Update displayed text via the related object name
                     field_widget.value = str(
-                        getattr(getattr(template, field.key.replace("Id", "")), "name")
+                        getattr(getattr(source, field.key.replace("Id", "")), "name")
                     )
                 # Also ping the controller to refresh postfix/prefix, etc.
                 controller: Field = self.query_one(f"#field-{field.key}-controller")
-                template_value = getattr(template, field.key)
                 for index, option in enumerate(field.options.items):
-                    if option.value == template_value:
+                    if option.value == value:
                         controller.handle_select_index(index)
                         break
 
-        self.app.notify(
-            title="Success",
-            message="Template applied",
-            severity="information",
-            timeout=3,
-        )
-
     # ---------- Actions ---------- #
 
     def action_submit_and_template(self) -> None:
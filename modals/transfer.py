@@ -13,8 +13,8 @@ from textual.widgets import (
 
 from Buckets.components.autocomplete import AutoComplete
 from Buckets.components.fields import Fields
+from Buckets.forms import options_cache
 from Buckets.forms.transfer_forms import TransferForm
-from Buckets.managers.accounts import get_all_accounts_with_balance
 from Buckets.managers.record_templates import get_template_by_id
 from Buckets.modals.base_widget import ModalContainer
 from Buckets.utils.validation import validateForm
@@ -59,7 +59,7 @@ class TransferModal(ModalScreen):
         **kwargs,
     ):
         super().__init__(classes="modal-screen", *args, **kwargs)
-        self.accounts = get_all_accounts_with_balance(get_hidden=True)
+        self.accounts = options_cache.transfer_accounts()
         if record:
             self.form = TransferForm(isTemplate, defaultDate).get_filled_form(record)
         else:
@@ -69,6 +69,38 @@ class TransferModal(ModalScreen):
         self.title = title
         self.atAccountList = False
 
+    @classmethod
+    def reusable(cls, app, name: str = "new-transfer") -> "TransferModal":
+        """The app-wide installed new-transfer modal, created on first use."""
+        if not app.is_screen_installed(name):
+            app.install_screen(cls(title="New transfer"), name)
+        return app.get_screen(name, cls)
+
+    def reset(self, defaultDate: str) -> None:
+        """Prepare for another new transfer with fresh defaults."""
+        self.form = TransferForm(False, defaultDate).get_form()
+        accounts = options_cache.transfer_accounts()
+        accounts_changed = accounts is not self.accounts
+        self.accounts = accounts
+        self.fromAccount = accounts[0].id
+        self.toAccount = accounts[1].id
+        self.atAccountList = False
+        if not self.is_mounted:
+            return  # composes from self.form on first push
+
+        for error in self.query(".error"):
+            error.remove()
+        transfer_error_label = self.query_one("#transfer-error", Label)
+        transfer_error_label.update("")
+        transfer_error_label.remove_class("active")
+        self.query_one(Fields).reset(self.form)
+        if accounts_changed:
+            self.rebuild()
+        else:
+            self.fromAccountsSelector.index = 0
+            self.toAccountsSelector.index = 1
+        self.set_focus(None)
+
     @override
     def _on_mount(self, event: events.Mount) -> None:
         self.rebuild()
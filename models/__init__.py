@@ -4,3 +4,4 @@ from .bucket import Bucket  # noqa: F401
 from .category import Category  # noqa: F401
 from .record import Record  # noqa: F401
 from .record_template import RecordTemplate  # noqa: F401
+from .label_index import LabelIndex  # noqa: F401
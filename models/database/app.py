@@ -1,21 +1,58 @@
+import os
 from datetime import datetime
 from pathlib import Path
 
 import yaml
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import create_engine, event, inspect, select, text, update
 from sqlalchemy.orm import sessionmaker
 
 from Buckets.models.account import Account
 from Buckets.models.category import Category, Nature
 from Buckets.models.database.db import Base
-from Buckets.models.record import Record  # noqa: F401 (register table)
+from Buckets.models.database.changes import ensure_change_counters
+from Buckets.models.database.fts import ensure_record_fts
+from Buckets.models.record import RECORD_HASH_VERSION, Record, record_hash
 from Buckets.models.record_template import RecordTemplate  # noqa: F401
 from Buckets.models.bucket import Bucket  # noqa: F401
+from Buckets.models.label_index import LabelIndex  # noqa: F401
 
-# SQLite DB in project root
-DB_PATH = Path("buckets.db").resolve()
-db_engine = create_engine(f"sqlite:///{DB_PATH}", echo=False, future=True)
+# SQLite DB in the working directory; BUCKETS_DB points elsewhere (benchmarks)
+DB_PATH = Path(os.environ.get("BUCKETS_DB") or "buckets.db").resolve()
+# How long a connection waits for another process's write lock
+BUSY_TIMEOUT = 5.0
+db_engine = create_engine(
+    f"sqlite:///{DB_PATH}",
+    echo=False,
+    future=True,
+    connect_args={"timeout": BUSY_TIMEOUT},
+)
 Session = sessionmaker(bind=db_engine)
+# Write transactions take the write lock when they begin (waiting up to
+# BUSY_TIMEOUT), so a read-then-write never fails to upgrade because the
+# CLI, the API or another instance committed in between.
+write_engine = db_engine.execution_options(begin_immediate=True)
+WriteSession = sessionmaker(bind=write_engine)
+
+def _casefold(value):
+    return value.casefold() if isinstance(value, str) else value
+
+@event.listens_for(db_engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    # Transactions are begun in _on_begin instead of by the driver
+    dbapi_connection.isolation_level = None
+    # SQLite's lower() folds ASCII only; casefold() matches Python's
+    dbapi_connection.create_function("casefold", 1, _casefold, deterministic=True)
+    cursor = dbapi_connection.cursor()
+    # Readers don't block the writer (and vice versa) across processes
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+@event.listens_for(db_engine, "begin")
+def _on_begin(conn):
+    if conn.get_execution_options().get("begin_immediate"):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        conn.exec_driver_sql("BEGIN")
 
 def _create_outside_source_account(session):
     outside = session.query(Account).filter_by(name="Outside source").first()
@@ -107,14 +144,62 @@ def _sync_database_schema():
                                 f"{column.type}{notnull_sql}{default_sql}"
                             )
                         )
+
+                # Indexes declared on the model but missing from the table
+                existing_indexes = {
+                    index["name"] for index in inspector.get_indexes(table.name)
+                }
+                for index in table.indexes:
+                    if index.name not in existing_indexes:
+                        index.create(db_engine)
     except Exception as e:
         raise Exception(f"Failed to sync database schema: {str(e)}")
 
+def _backfill_record_hashes(session):
+    """Fill `dedupeHash` for records written before the column existed, or
+    for all records when `record_hash` changed since the database last saw
+    it (tracked in PRAGMA user_version)."""
+    hash_version = session.execute(text("PRAGMA user_version")).scalar()
+    stmt = select(
+        Record.id,
+        Record.accountId,
+        Record.date,
+        Record.amount,
+        Record.label,
+        Record.isIncome,
+    )
+    if hash_version >= RECORD_HASH_VERSION:
+        stmt = stmt.where(Record.dedupeHash.is_(None))
+    rows = session.execute(stmt).all()
+    if rows:
+        session.execute(
+            update(Record),
+            [
+                {
+                    "id": id,
+                    "dedupeHash": record_hash(
+                        account_id, date, amount, label or "", bool(is_income)
+                    ),
+                }
+                for id, account_id, date, amount, label, is_income in rows
+            ],
+        )
+    if hash_version < RECORD_HASH_VERSION:
+        session.execute(text(f"PRAGMA user_version = {RECORD_HASH_VERSION}"))
+    session.commit()
+
 def init_db():
     _sync_database_schema()
     Base.metadata.create_all(db_engine)
-    session = Session()
+    ensure_record_fts(db_engine)
+    ensure_change_counters(db_engine)
+    session = WriteSession()
     _create_outside_source_account(session)
     _create_default_categories(session)
     _fix_dangling_categories(session)
+    _backfill_record_hashes(session)
+
+    from Buckets.managers.label_index import rebuild_label_index
+
+    rebuild_label_index(session)
     session.close()
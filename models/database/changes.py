@@ -0,0 +1,50 @@
+"""Per-table change counters, for noticing writes made by other processes.
+
+`change_counter` holds one row per watched table, bumped by SQLite
+triggers on every insert, update and delete, so every writer (the app,
+the CLI, scripts, another instance) is counted. Readers compare the
+counters against what they saw last (see managers/watcher.py).
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+TABLE = "change_counter"
+
+WATCHED = ("record", "account", "category", "record_template", "bucket")
+
+
+def _triggers(table: str) -> dict[str, str]:
+    bump = f"UPDATE {TABLE} SET version = version + 1 WHERE name = '{table}';"
+    return {
+        f"{table}_changes_{suffix}": f"""
+            CREATE TRIGGER {table}_changes_{suffix} AFTER {event} ON {table} BEGIN
+                {bump}
+            END"""
+        for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+    }
+
+
+def ensure_change_counters(engine: Engine) -> None:
+    """Create the counters and their triggers if missing."""
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {TABLE} "
+                "(name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0)"
+            )
+        )
+        for table in WATCHED:
+            conn.execute(
+                text(f"INSERT OR IGNORE INTO {TABLE}(name) VALUES (:name)"),
+                {"name": table},
+            )
+        existing = {
+            name
+            for (name,) in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            )
+        }
+        for table in WATCHED:
+            for name, ddl in _triggers(table).items():
+                if name not in existing:
+                    conn.execute(text(ddl))
@@ -0,0 +1,116 @@
+"""FTS5 index over record labels plus category and account names.
+
+`record_fts` is keyed by record id (its rowid) and maintained entirely by
+SQLite triggers, so every write path (ORM, bulk inserts, other processes)
+keeps it current. When SQLite is built without FTS5 nothing is created and
+searches fall back to LIKE.
+"""
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+TABLE = "record_fts"
+
+# Column weights for bm25: label hits rank above category, then account hits
+RANK = "bm25(10.0, 3.0, 1.0)"
+
+_CATEGORY = "(SELECT name FROM category WHERE id = {row}.categoryId)"
+_ACCOUNTS = (
+    "(SELECT name FROM account WHERE id = {row}.accountId) || ' ' || "
+    "coalesce((SELECT name FROM account WHERE id = {row}.transferToAccountId), '')"
+)
+
+
+def _insert_for(row: str) -> str:
+    return (
+        f"INSERT INTO {TABLE}(rowid, label, category, account) VALUES "
+        f"({row}.id, {row}.label, {_CATEGORY.format(row=row)}, "
+        f"{_ACCOUNTS.format(row=row)});"
+    )
+
+
+_TRIGGERS = {
+    "record_fts_ai": f"""
+        CREATE TRIGGER record_fts_ai AFTER INSERT ON record BEGIN
+            {_insert_for("new")}
+        END""",
+    "record_fts_ad": f"""
+        CREATE TRIGGER record_fts_ad AFTER DELETE ON record BEGIN
+            DELETE FROM {TABLE} WHERE rowid = old.id;
+        END""",
+    "record_fts_au": f"""
+        CREATE TRIGGER record_fts_au AFTER UPDATE OF
+            label, categoryId, accountId, transferToAccountId ON record BEGIN
+            DELETE FROM {TABLE} WHERE rowid = old.id;
+            {_insert_for("new")}
+        END""",
+    "record_fts_category_au": f"""
+        CREATE TRIGGER record_fts_category_au AFTER UPDATE OF name ON category BEGIN
+            UPDATE {TABLE} SET category = new.name
+            WHERE rowid IN (SELECT id FROM record WHERE categoryId = new.id);
+        END""",
+    "record_fts_account_au": f"""
+        CREATE TRIGGER record_fts_account_au AFTER UPDATE OF name ON account BEGIN
+            UPDATE {TABLE} SET account = (
+                SELECT {_ACCOUNTS.format(row="r")} FROM record r
+                WHERE r.id = {TABLE}.rowid
+            )
+            WHERE rowid IN (
+                SELECT id FROM record
+                WHERE accountId = new.id OR transferToAccountId = new.id
+            );
+        END""",
+}
+
+_available: bool | None = None
+
+
+def fts_available() -> bool:
+    """Whether `record_fts` exists (set up by `ensure_record_fts`)."""
+    return bool(_available)
+
+
+def ensure_record_fts(engine: Engine) -> None:
+    """Create the index and its triggers if missing, backfilling existing rows."""
+    global _available
+    with engine.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": TABLE},
+        ).first()
+        if not exists:
+            try:
+                conn.execute(
+                    text(
+                        f"CREATE VIRTUAL TABLE {TABLE} USING fts5("
+                        "label, category, account, "
+                        "tokenize = 'unicode61 remove_diacritics 2', "
+                        "prefix = '2 3 4 5 6')"
+                    )
+                )
+            except OperationalError:
+                # SQLite compiled without FTS5
+                _available = False
+                return
+            conn.execute(
+                text(f"INSERT INTO {TABLE}({TABLE}, rank) VALUES ('rank', :rank)"),
+                {"rank": RANK},
+            )
+            conn.execute(
+                text(
+                    f"INSERT INTO {TABLE}(rowid, label, category, account) "
+                    f"SELECT r.id, r.label, {_CATEGORY.format(row='r')}, "
+                    f"{_ACCOUNTS.format(row='r')} FROM record r"
+                )
+            )
+
+        existing = {
+            name
+            for (name,) in conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+            )
+        }
+        for name, ddl in _TRIGGERS.items():
+            if name not in existing:
+                conn.execute(text(ddl))
+    _available = True
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
+
+from .database.db import Base
+
+class LabelIndex(Base):
+    """One row per distinct (normalized) record label.
+
+    `key` is the normalized label and the primary key, so prefix lookups are
+    range scans on the primary key index. The predicted fields are taken from
+    the most recent record using the label.
+    """
+
+    __tablename__ = "label_index"
+
+    key = Column(String, primary_key=True)
+    label = Column(String, nullable=False)
+    useCount = Column(Integer, nullable=False, default=0)
+    lastUsedAt = Column(DateTime, nullable=False, default=datetime.now)
+
+    categoryId = Column(Integer, ForeignKey("category.id"), nullable=True)
+    accountId = Column(Integer, ForeignKey("account.id"), nullable=True)
+    amount = Column(Float, nullable=True)
+    isIncome = Column(Boolean, nullable=False, default=False)
+
+    category = relationship("Category", foreign_keys=[categoryId])
+    account = relationship("Account", foreign_keys=[accountId])
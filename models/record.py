@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime
 
 from sqlalchemy import (
@@ -9,10 +10,12 @@ from sqlalchemy import (
     ForeignKey,
     Integer,
     String,
+    event,
 )
 from sqlalchemy.orm import relationship, validates
 
 from Buckets.config import CONFIG
+from Buckets.utils.format import normalize_label
 from .database.db import Base
 
 
@@ -29,10 +32,10 @@ class Record(Base):
     id = Column(Integer, primary_key=True, index=True)
     label = Column(String, nullable=False)
     amount = Column(Float, CheckConstraint("amount > 0"), nullable=False)
-    date = Column(DateTime, nullable=False, default=datetime.now)
+    date = Column(DateTime, nullable=False, default=datetime.now, index=True)
 
-    accountId = Column(Integer, ForeignKey("account.id"), nullable=False)
-    categoryId = Column(Integer, ForeignKey("category.id"), nullable=True)
+    accountId = Column(Integer, ForeignKey("account.id"), nullable=False, index=True)
+    categoryId = Column(Integer, ForeignKey("category.id"), nullable=True, index=True)
 
     bucketId = Column(Integer, ForeignKey("bucket.id"), nullable=True)
     isIncome = Column(Boolean, nullable=False, default=False)
@@ -42,7 +45,9 @@ class Record(Base):
         nullable=False,
         default=False,
     )
-    transferToAccountId = Column(Integer, ForeignKey("account.id"), nullable=True)
+    transferToAccountId = Column(
+        Integer, ForeignKey("account.id"), nullable=True, index=True
+    )
 
     account = relationship(
         "Account",
@@ -56,6 +61,9 @@ class Record(Base):
     )
     isInProgress = Column(Boolean, nullable=False, default=False)
 
+    # Hash of (accountId, day, amount, normalized label) for duplicate detection
+    dedupeHash = Column(String, nullable=True, index=True)
+
     category = relationship("Category", back_populates="records")
 
     @validates("amount")
@@ -63,3 +71,29 @@ class Record(Base):
         if value is not None:
             return round(value, CONFIG.defaults.round_decimals)
         return value
+
+# Bump when record_hash changes; init_db then recomputes every stored hash
+RECORD_HASH_VERSION = 1
+
+def record_hash(
+    account_id: int, date: datetime, amount: float, label: str, is_income: bool
+) -> str:
+    """Duplicate-detection key; only the day of `date` counts. The direction
+    is part of it, so a refund doesn't match the expense it reverses."""
+    key = (
+        f"{account_id}|{date:%Y-%m-%d}|{'+' if is_income else '-'}"
+        f"{amount:.{CONFIG.defaults.round_decimals}f}|{normalize_label(label)}"
+    )
+    return hashlib.sha1(key.encode()).hexdigest()[:20]
+
+@event.listens_for(Record, "before_insert")
+@event.listens_for(Record, "before_update")
+def receive_before_write(mapper, connection, target):
+    """Keep `dedupeHash` in sync with the hashed columns."""
+    target.dedupeHash = record_hash(
+        target.accountId,
+        target.date or datetime.now(),
+        target.amount,
+        target.label or "",
+        bool(target.isIncome),
+    )
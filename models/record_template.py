@@ -43,6 +43,11 @@ class RecordTemplate(Base):
     )
     transferToAccountId = Column(Integer, ForeignKey("account.id"), nullable=True)
 
+    # Recurrence (see managers/recurrence.py); NULL for manual-only templates
+    recurrence = Column(String, nullable=True)
+    recurrenceDay = Column(Integer, nullable=True)
+    nextDueAt = Column(DateTime, nullable=True, index=True)
+
     account = relationship("Account", foreign_keys=[accountId])
     category = relationship("Category", foreign_keys=[categoryId])
     transferToAccount = relationship("Account", foreign_keys=[transferToAccountId])
@@ -1,4 +1,26 @@
 def main():
+    import sys
+
+    from Buckets.cli import COMMANDS
+
+    argv = sys.argv[1:]
+    if argv and argv[0] in COMMANDS:
+        from Buckets.cli import main as cli_main
+
+        raise SystemExit(cli_main(argv))
+
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="buckets")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="profiles",
+        metavar="DIR",
+        help="Save a cProfile of every action to DIR (default: ./profiles)",
+    )
+    profile_dir = parser.parse_args(argv).profile
+
     from Buckets.config import load_config
 
     load_config()
@@ -7,6 +29,31 @@ def main():
 
     init_db()
 
+    from Buckets.managers.recurrence import generate_due_records
+
+    generate_due_records()
+
+    from Buckets.config import CONFIG
+
+    if CONFIG.database.writer:
+        from Buckets.managers import writer
+
+        writer.start(CONFIG.database.group_commit_ms)
+
+    if CONFIG.instrumentation.enabled:
+        # Before the app import, so the UI picks up the wrapped managers
+        from Buckets.utils import instrumentation
+
+        instrumentation.enable(
+            CONFIG.instrumentation.trace_file or None,
+            keep=CONFIG.instrumentation.history,
+        )
+
+    if profile_dir is not None:
+        from Buckets.utils import profiling
+
+        profiling.enable(profile_dir)
+
     from Buckets.app import App
 
     app = App()
@@ -2,16 +2,18 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta
 from Buckets.config import CONFIG
+from Buckets.utils.formula import FormulaError, evaluate_formula, round_amount
 
 def parse_formula_expression(value: str) -> float:
     try:
-        value = value.replace("+-", "-")
-        # trim dangling operator at end
-        if value and value[-1] in "+-*/.":
-            value = value[:-1]
-        return round(float(eval(value)), CONFIG.defaults.round_decimals)  # nosec
-    except Exception:
+        result = round_amount(evaluate_formula(value), CONFIG.defaults.round_decimals)
+    except FormulaError:
         return 0.0
+    return float(result)
+
+def normalize_label(label: str) -> str:
+    """Case- and whitespace-insensitive form of a record label."""
+    return " ".join(label.split()).casefold()
 
 def format_date_to_readable(date) -> str:
     today = datetime.now().date()
@@ -0,0 +1,157 @@
+"""Arithmetic for amount fields: `+ - * /`, parentheses and decimals.
+
+Expressions are tokenized and parsed once into a postfix program (cached),
+then evaluated with `Decimal` so intermediate results are exact; rounding
+happens only on the final value.
+"""
+from __future__ import annotations
+
+import re
+from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
+
+_TOKEN = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|(.))")
+_OPERATORS = "+-*/"
+_NEG = "neg"
+# Nested parentheses allowed; deeper input would exhaust the Python stack
+MAX_DEPTH = 100
+
+
+class FormulaError(ValueError):
+    """Raised for expressions that cannot be parsed or evaluated."""
+
+
+def _tokenize(text: str) -> list[Decimal | str]:
+    tokens: list[Decimal | str] = []
+    for number, symbol in _TOKEN.findall(text):
+        if number:
+            tokens.append(Decimal(number))
+        elif symbol in _OPERATORS or symbol in "()":
+            tokens.append(symbol)
+        elif not symbol.isspace():
+            raise FormulaError(f"Unexpected character {symbol!r}")
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the token list, emitting postfix code.
+
+    expr    := term (('+' | '-') term)*
+    term    := unary (('*' | '/') unary)*
+    unary   := ('+' | '-') unary | primary
+    primary := NUMBER | '(' expr ')'
+    """
+
+    def __init__(self, tokens: list[Decimal | str]) -> None:
+        self.tokens = tokens
+        self.pos = 0
+        self.depth = 0
+        self.code: list[Decimal | str] = []
+
+    def parse(self) -> tuple[Decimal | str, ...]:
+        self._expr()
+        if self.pos != len(self.tokens):
+            raise FormulaError(f"Unexpected {self.tokens[self.pos]!r}")
+        return tuple(self.code)
+
+    def _peek(self) -> Decimal | str | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _expr(self) -> None:
+        self._term()
+        while self._peek() in ("+", "-"):
+            op = self.tokens[self.pos]
+            self.pos += 1
+            self._term()
+            self.code.append(op)
+
+    def _term(self) -> None:
+        self._unary()
+        while self._peek() in ("*", "/"):
+            op = self.tokens[self.pos]
+            self.pos += 1
+            self._unary()
+            self.code.append(op)
+
+    def _unary(self) -> None:
+        # Signs are looped over, not recursed into, so "----1" can't nest
+        negations = 0
+        while self._peek() in ("+", "-"):
+            negations += self.tokens[self.pos] == "-"
+            self.pos += 1
+        self._primary()
+        self.code.extend([_NEG] * negations)
+
+    def _primary(self) -> None:
+        token = self._peek()
+        if isinstance(token, Decimal):
+            self.pos += 1
+            self.code.append(token)
+        elif token == "(":
+            if self.depth >= MAX_DEPTH:
+                raise FormulaError("Too many nested parentheses")
+            self.pos += 1
+            self.depth += 1
+            self._expr()
+            self.depth -= 1
+            if self._peek() != ")":
+                raise FormulaError("Missing ')'")
+            self.pos += 1
+        else:
+            raise FormulaError("Expected a number")
+
+
+def _normalize(text: str) -> str:
+    """Make a half-typed expression evaluable: drop trailing operators and
+    close any open parentheses."""
+    text = text.strip().rstrip(_OPERATORS + " ")
+    return text + ")" * max(text.count("(") - text.count(")"), 0)
+
+
+@lru_cache(maxsize=512)
+def compile_formula(text: str) -> tuple[Decimal | str, ...]:
+    """Parse `text` into a postfix program. Raises FormulaError."""
+    normalized = _normalize(text)
+    if not normalized:
+        raise FormulaError("Empty expression")
+    return _Parser(_tokenize(normalized)).parse()
+
+
+def evaluate_formula(text: str) -> Decimal:
+    """Exact value of `text`. Raises FormulaError."""
+    stack: list[Decimal] = []
+    try:
+        for op in compile_formula(text):
+            if isinstance(op, Decimal):
+                stack.append(op)
+            elif op == _NEG:
+                stack.append(-stack.pop())
+            else:
+                right = stack.pop()
+                left = stack.pop()
+                if op == "+":
+                    stack.append(left + right)
+                elif op == "-":
+                    stack.append(left - right)
+                elif op == "*":
+                    stack.append(left * right)
+                else:
+                    stack.append(left / right)
+    except ArithmeticError as e:
+        # Division by zero, and results beyond the decimal context
+        raise FormulaError("Invalid arithmetic") from e
+    return stack[0]
+
+
+def round_amount(value: Decimal, decimals: int) -> Decimal:
+    """`value` rounded to `decimals` places. Raises FormulaError when it has
+    too many digits for the decimal context."""
+    try:
+        return value.quantize(Decimal(1).scaleb(-decimals), rounding=ROUND_HALF_UP)
+    except ArithmeticError as e:
+        raise FormulaError("Amount too large") from e
+
+
+def is_formula(text: str) -> bool:
+    """Whether `text` is more than a plain (signed) number."""
+    return any(op in text[1:] for op in _OPERATORS) or "(" in text
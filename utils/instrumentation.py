@@ -0,0 +1,203 @@
+# Buckets/utils/instrumentation.py
+"""Per-action timing and SQL query counts for finding UI stutters.
+
+Off by default. `enable()` wraps every public function in `managers/*` and
+every `rebuild()` of the pages and modules, and listens to the engine's
+cursor events. An *action* is a key binding run by the app or, failing
+that, the outermost timed call; each one is kept in `history` and
+optionally appended to a JSONL trace file.
+
+While disabled nothing is wrapped or listened to, so the cost is zero.
+"""
+from __future__ import annotations
+
+import functools
+import importlib
+import inspect
+import json
+import pkgutil
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Callable, Iterator
+
+ENABLED = False
+
+history: deque[ActionTrace] = deque(maxlen=50)
+
+_current: ContextVar[ActionTrace | None] = ContextVar("action_trace", default=None)
+_trace_file: IO[str] | None = None
+
+# Where rebuild() methods live; imported (and wrapped) when enabling
+_VIEW_PACKAGES = ("Buckets.components.modules",)
+_VIEW_MODULES = ("Buckets.home", "Buckets.buckets_page")
+
+
+@dataclass
+class ActionTrace:
+    name: str
+    at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    ms: float = 0.0
+    queries: int = 0
+    rows: int = 0
+    slowest_ms: float = 0.0
+    slowest_sql: str = ""
+    # "module.function" -> [calls, total ms]
+    calls: dict[str, list[float]] = field(default_factory=dict)
+
+    def add_call(self, name: str, ms: float) -> None:
+        entry = self.calls.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += ms
+
+
+# ------------------------- Actions ------------------------ #
+
+
+@contextmanager
+def action(name: str) -> Iterator[ActionTrace | None]:
+    """Record everything run inside as one action named `name`."""
+    if not ENABLED or _current.get() is not None:
+        yield _current.get()
+        return
+    trace = ActionTrace(name)
+    token = _current.set(trace)
+    start = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        trace.ms = (time.perf_counter() - start) * 1000
+        _current.reset(token)
+        _finish(trace)
+
+
+def _finish(trace: ActionTrace) -> None:
+    history.append(trace)
+    if _trace_file is not None:
+        data = asdict(trace)
+        data["ms"] = round(trace.ms, 3)
+        data["slowest_ms"] = round(trace.slowest_ms, 3)
+        data["calls"] = {
+            name: {"count": int(count), "ms": round(ms, 3)}
+            for name, (count, ms) in trace.calls.items()
+        }
+        _trace_file.write(json.dumps(data) + "\n")
+
+
+def timed(fn: Callable, name: str | None = None) -> Callable:
+    """Wrap `fn` so its time is added to the current action (or starts one)."""
+    name = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not ENABLED:
+            return fn(*args, **kwargs)
+        with action(name) as trace:
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                trace.add_call(name, (time.perf_counter() - start) * 1000)
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+# ------------------------ SQL hooks ----------------------- #
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    ms = (time.perf_counter() - conn.info["query_start"].pop()) * 1000
+    trace = _current.get()
+    if trace is None or statement.startswith("BEGIN"):
+        return
+    trace.queries += 1
+    # rowcount covers writes; rows read are counted as the ORM loads them
+    if cursor.rowcount > 0:
+        trace.rows += cursor.rowcount
+    if ms > trace.slowest_ms:
+        trace.slowest_ms = ms
+        trace.slowest_sql = " ".join(statement.split())
+
+
+def _on_load(target, context) -> None:
+    trace = _current.get()
+    if trace is not None:
+        trace.rows += 1
+
+
+# ------------------------- Setup -------------------------- #
+
+
+def _wrap_managers() -> None:
+    import Buckets.managers as managers
+
+    for info in pkgutil.iter_modules(managers.__path__):
+        module = importlib.import_module(f"Buckets.managers.{info.name}")
+        for attr, fn in list(vars(module).items()):
+            if (
+                not attr.startswith("_")
+                and inspect.isfunction(fn)
+                and fn.__module__ == module.__name__
+                and not getattr(fn, "__instrumented__", False)
+            ):
+                setattr(module, attr, timed(fn))
+
+
+def _view_modules() -> Iterator:
+    for package_name in _VIEW_PACKAGES:
+        package = importlib.import_module(package_name)
+        yield package
+        for info in pkgutil.walk_packages(package.__path__, f"{package_name}."):
+            yield importlib.import_module(info.name)
+    for name in _VIEW_MODULES:
+        yield importlib.import_module(name)
+
+
+def rebuild_classes() -> Iterator[type]:
+    """Page and module classes defining their own `rebuild()`."""
+    for module in _view_modules():
+        for cls in vars(module).values():
+            if (
+                inspect.isclass(cls)
+                and cls.__module__ == module.__name__
+                and inspect.isfunction(cls.__dict__.get("rebuild"))
+            ):
+                yield cls
+
+
+def _wrap_rebuilds() -> None:
+    for cls in rebuild_classes():
+        if not getattr(cls.rebuild, "__instrumented__", False):
+            cls.rebuild = timed(cls.rebuild, f"{cls.__name__}.rebuild")
+
+
+def enable(trace_path: str | Path | None = None, keep: int = 50) -> None:
+    """Start collecting. Call before the app is imported: modules that
+    imported a manager function earlier keep the unwrapped one."""
+    global ENABLED, _trace_file, history
+    if ENABLED:
+        return
+    from sqlalchemy import event
+
+    from Buckets.models.database.app import db_engine
+    from Buckets.models.database.db import Base
+
+    _wrap_managers()
+    _wrap_rebuilds()
+    event.listen(db_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(db_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Base, "load", _on_load, propagate=True)
+
+    history = deque(history, maxlen=keep)
+    if trace_path:
+        _trace_file = open(trace_path, "a", encoding="utf-8", buffering=1)
+    ENABLED = True
@@ -0,0 +1,145 @@
+# Buckets/utils/profiling.py
+"""cProfile capture of single actions, for attaching to performance bugs.
+
+Off by default. `enable()` wraps every `rebuild()` of the pages and
+modules; while `ACTIVE`, each key binding the app dispatches (and each
+rebuild run outside one) is profiled on its own and saved as
+`<directory>/<time>-<n>-<action>.pstats`, readable with `pstats`,
+snakeviz and similar. `history` keeps the latest ones with their top
+functions by cumulative time.
+
+Profiles cover the event loop thread while the action runs, so work of
+other tasks interleaved with an awaiting action shows up in it too.
+"""
+from __future__ import annotations
+
+import cProfile
+import functools
+import pstats
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+DEFAULT_DIRECTORY = "profiles"
+# Functions kept per profile for the summary
+TOP = 30
+
+ENABLED = False
+ACTIVE = False
+directory = Path(DEFAULT_DIRECTORY)
+
+history: deque[ActionProfile] = deque(maxlen=50)
+
+# cProfile can't nest; inner actions and rebuilds belong to the outer one
+_running = False
+_count = 0
+_UNSAFE = re.compile(r"[^\w.-]+")
+
+
+@dataclass
+class ProfiledFunction:
+    name: str
+    calls: int
+    own_ms: float
+    cumulative_ms: float
+
+
+@dataclass
+class ActionProfile:
+    name: str
+    path: Path
+    at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    ms: float = 0.0
+    top: list[ProfiledFunction] = field(default_factory=list)
+
+
+def top_functions(stats: pstats.Stats, limit: int = TOP) -> list[ProfiledFunction]:
+    """The `limit` functions with the largest cumulative time."""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    return [
+        ProfiledFunction(
+            name=pstats.func_std_string(func),
+            calls=calls,
+            own_ms=own * 1000,
+            cumulative_ms=cumulative * 1000,
+        )
+        for func, (_, calls, own, cumulative, _) in rows[:limit]
+    ]
+
+
+@contextmanager
+def profile(name: str) -> Iterator[ActionProfile | None]:
+    """Profile everything run inside as one action named `name`."""
+    global _running, _count
+    if not ACTIVE or _running:
+        yield None
+        return
+    _running = True
+    _count += 1
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    result = ActionProfile(
+        name, directory / f"{stamp}-{_count:03d}-{_UNSAFE.sub('_', name)}.pstats"
+    )
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield result
+    finally:
+        profiler.disable()
+        result.ms = (time.perf_counter() - start) * 1000
+        _running = False
+        directory.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(result.path)
+        result.top = top_functions(pstats.Stats(profiler))
+        history.append(result)
+
+
+def profiled(fn: Callable, name: str) -> Callable:
+    """Wrap `fn` so a call outside a profiled action is profiled on its own."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not ACTIVE:
+            return fn(*args, **kwargs)
+        with profile(name):
+            return fn(*args, **kwargs)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def _wrap_rebuilds() -> None:
+    from Buckets.utils.instrumentation import rebuild_classes
+
+    for cls in rebuild_classes():
+        if not getattr(cls.rebuild, "__profiled__", False):
+            cls.rebuild = profiled(cls.rebuild, f"{cls.__name__}.rebuild")
+
+
+def enable(path: str | Path | None = None, active: bool = True) -> None:
+    """Allow profiling, saving into `path` (default: ./profiles), and start
+    capturing unless `active` is False. Rebuilds are wrapped on the class,
+    so this also works once the app is running."""
+    global ENABLED, ACTIVE, directory
+    if path is not None:
+        directory = Path(path)
+    if not ENABLED:
+        _wrap_rebuilds()
+        ENABLED = True
+    ACTIVE = active
+
+
+def toggle() -> bool:
+    """Start or stop capturing; return whether it is now on."""
+    global ACTIVE
+    if not ENABLED:
+        enable()
+    else:
+        ACTIVE = not ACTIVE
+    return ACTIVE
@@ -0,0 +1,117 @@
+# Buckets/utils/query_guard.py
+"""Query budgets for manager functions, to catch N+1 patterns early.
+
+Read paths declare how many statements they may run, whatever the data
+size:
+
+    @query_budget(3)
+    def get_all_accounts_with_balance(...): ...
+
+and checks (tests, benchmarks) run them under a guard:
+
+    check_query_budget(get_all_accounts_with_balance)
+
+    with QueryGuard(budget=3, max_repeats=1) as guard:
+        ...
+    guard.statements  # what ran
+
+The decorator only records the budget; nothing is counted outside a guard.
+"""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Same statement shape this many times in one call looks like a loop
+DEFAULT_MAX_REPEATS = 2
+
+_IN_LIST = re.compile(r"\((?:\s*\?\s*,)+\s*\?\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A guarded call ran more statements than allowed."""
+
+
+def statement_shape(statement: str) -> str:
+    """`statement` with whitespace collapsed and IN lists reduced to one
+    parameter, so per-row repeats of a query compare equal."""
+    return _IN_LIST.sub("(?)", _SPACE.sub(" ", statement).strip())
+
+
+def query_budget(budget: int, max_repeats: int = DEFAULT_MAX_REPEATS) -> Callable[[F], F]:
+    """Declare the most statements `fn` may run (see `check_query_budget`)."""
+
+    def decorate(fn: F) -> F:
+        fn.__query_budget__ = (budget, max_repeats)  # type: ignore[attr-defined]
+        return fn
+
+    return decorate
+
+
+class QueryGuard:
+    """Record the statements run on the engine while active; on a clean
+    exit, fail if there were more than `budget` or one shape repeated more
+    than `max_repeats` times. Either limit may be None."""
+
+    def __init__(
+        self,
+        budget: int | None = None,
+        max_repeats: int | None = DEFAULT_MAX_REPEATS,
+        engine=None,
+    ) -> None:
+        if engine is None:
+            from Buckets.models.database.app import db_engine as engine
+        self.engine = engine
+        self.budget = budget
+        self.max_repeats = max_repeats
+        self.statements: list[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        # Transaction control isn't a query of the guarded code
+        if not statement.startswith("BEGIN"):
+            self.statements.append(statement)
+
+    def __enter__(self) -> "QueryGuard":
+        from sqlalchemy import event
+
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        from sqlalchemy import event
+
+        event.remove(self.engine, "before_cursor_execute", self._record)
+        if exc_type is None:
+            self.check()
+
+    def repeats(self) -> list[tuple[str, int]]:
+        """Statement shapes by how often they ran, most frequent first."""
+        return Counter(map(statement_shape, self.statements)).most_common()
+
+    def check(self) -> None:
+        problems = []
+        if self.budget is not None and len(self.statements) > self.budget:
+            problems.append(
+                f"{len(self.statements)} statements, budget is {self.budget}"
+            )
+        if self.max_repeats is not None:
+            for shape, count in self.repeats():
+                if count <= self.max_repeats:
+                    break
+                problems.append(f"{count}x (max {self.max_repeats}): {shape[:200]}")
+        if problems:
+            raise QueryBudgetExceeded("\n".join(problems))
+
+
+def check_query_budget(fn: Callable, *args, **kwargs):
+    """Call `fn` under a guard with its declared budget; return its result."""
+    declared = getattr(fn, "__query_budget__", None)
+    if declared is None:
+        raise ValueError(f"{fn.__qualname__} declares no query budget")
+    budget, max_repeats = declared
+    with QueryGuard(budget, max_repeats):
+        return fn(*args, **kwargs)